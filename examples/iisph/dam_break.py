@@ -212,6 +212,7 @@ equations = [
             ),
         ],
         iterate=True,
+        cache_pairs=True,
         max_iterations=30,
         min_iterations=2
     ),
@@ -166,6 +166,7 @@ equations = [
             ),
         ],
         iterate=True,
+        cache_pairs=True,
         max_iterations=20
     ),
 
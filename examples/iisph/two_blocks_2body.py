@@ -130,6 +130,7 @@ equations = [
             ),
         ],
         iterate=True,
+        cache_pairs=True,
         max_iterations=20,
         min_iterations=2
     ),
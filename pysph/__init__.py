@@ -59,6 +59,7 @@ def in_parallel():
 
 # Utility function to determine the possible output files
 _has_h5py = None
+_has_parallel_h5py = None
 _has_pyvisfile = None
 _has_tvtk = None
 
@@ -76,6 +77,18 @@ def has_h5py():
     return _has_h5py
 
 
+def has_parallel_h5py():
+    """Return True if h5py is available and is built with MPI support.
+    """
+    global _has_parallel_h5py
+    if _has_parallel_h5py is None:
+        _has_parallel_h5py = False
+        if has_h5py():
+            import h5py
+            _has_parallel_h5py = bool(h5py.get_config().mpi)
+    return _has_parallel_h5py
+
+
 def has_tvtk():
     """Return True if tvtk is available.
     """
@@ -110,6 +110,30 @@ def get_assigned(code):
 
     return result
 
+def get_assigned_attributes(code, name='self'):
+    """Given an AST or code string return the attributes of the object with
+    the given name that are assigned, augmented assigned or deleted.
+
+    Parameters
+    ----------
+
+    code: A code string or the result of an ast.parse.
+
+    name: str: name of the object.
+
+    """
+    if isinstance(code, str):
+        tree = ast.parse(code)
+    else:
+        tree = code
+    result = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and \
+           isinstance(node.ctx, (ast.Store, ast.Del)) and \
+           isinstance(node.value, ast.Name) and node.value.id == name:
+            result.add(node.attr)
+    return result
+
 def has_node(code, node):
     """Given an AST or code string returns True if the code contains
     any particular node statement.
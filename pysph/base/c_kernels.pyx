@@ -159,6 +159,23 @@ cdef class CubicSplineWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class WendlandQuintic:
@@ -300,6 +317,23 @@ cdef class WendlandQuinticWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class Gaussian:
@@ -439,6 +473,23 @@ cdef class GaussianWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class QuinticSpline:
@@ -640,6 +691,23 @@ cdef class QuinticSplineWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class SuperGaussian:
@@ -787,6 +855,23 @@ cdef class SuperGaussianWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class WendlandQuinticC4:
@@ -932,6 +1017,23 @@ cdef class WendlandQuinticC4Wrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class WendlandQuinticC6:
@@ -1077,6 +1179,23 @@ cdef class WendlandQuinticC6Wrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class WendlandQuinticC2_1D:
@@ -1218,6 +1337,23 @@ cdef class WendlandQuinticC2_1DWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class WendlandQuinticC4_1D:
@@ -1359,6 +1495,23 @@ cdef class WendlandQuinticC4_1DWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 
 
 cdef class WendlandQuinticC6_1D:
@@ -1504,3 +1657,20 @@ cdef class WendlandQuinticC6_1DWrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
@@ -56,4 +56,21 @@ cdef class ${classname}Wrapper:
         self.kern.gradient(xij, rij, h, grad)
         return grad[0], grad[1], grad[2]
 
+    def kernel_array(self, double[:] xij, double[:] yij, double[:] zij,
+                     double[:] h):
+        """Return an array of the kernel values for the given arrays of
+        separations and smoothing lengths.
+        """
+        cdef long i, n = xij.shape[0]
+        cdef double* x = self.xij
+        cdef double rij
+        cdef double[:] result = np.empty(n)
+        for i in range(n):
+            x[0] = xij[i]
+            x[1] = yij[i]
+            x[2] = zij[i]
+            rij = sqrt(x[0]*x[0] + x[1]*x[1] + x[2]*x[2])
+            result[i] = self.kern.kernel(x, rij, h[i])
+        return np.asarray(result)
+
 % endfor
@@ -41,7 +41,6 @@ cdef class CellIndexingNNPS(NNPS):
             cache, sort_gids
         )
 
-        self.radius_scale2 = radius_scale*radius_scale
         cdef NNPSParticleArrayWrapper pa_wrapper
         cdef int i, num_particles
 
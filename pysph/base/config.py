@@ -11,6 +11,12 @@ class Config(object):
         self._use_opencl = None
         self._use_double = None
         self._profile = None
+        self._specialize = None
+        self._opt_level = None
+        self._march = None
+        self._fast_math = None
+        self._unroll_loops = None
+        self._vectorization_report = None
 
     @property
     def use_openmp(self):
@@ -68,6 +74,99 @@ class Config(object):
     def _profile_default(self):
         return False
 
+    @property
+    def specialize(self):
+        """If True, the scalar parameters of the equations, kernel and
+        integrator steppers and the iteration limits of the groups are
+        written as constants in the generated code.  This may be faster but
+        the code has to be compiled again when any of these change.
+        """
+        if self._specialize is None:
+            self._specialize = self._specialize_default()
+        return self._specialize
+
+    @specialize.setter
+    def specialize(self, value):
+        self._specialize = value
+
+    def _specialize_default(self):
+        return False
+
+    @property
+    def opt_level(self):
+        """Optimization level used to compile the generated code, for
+        example 2, 3 or 'fast'.  If None, the default of the Python build is
+        used.
+        """
+        if self._opt_level is None:
+            self._opt_level = self._opt_level_default()
+        return self._opt_level
+
+    @opt_level.setter
+    def opt_level(self, value):
+        self._opt_level = value
+
+    def _opt_level_default(self):
+        return None
+
+    @property
+    def march(self):
+        """Target architecture of the generated code, for example 'native'
+        to use all the instructions (like AVX-512) of the current machine.
+        """
+        if self._march is None:
+            self._march = self._march_default()
+        return self._march
+
+    @march.setter
+    def march(self, value):
+        self._march = value
+
+    def _march_default(self):
+        return None
+
+    @property
+    def fast_math(self):
+        if self._fast_math is None:
+            self._fast_math = self._fast_math_default()
+        return self._fast_math
+
+    @fast_math.setter
+    def fast_math(self, value):
+        self._fast_math = value
+
+    def _fast_math_default(self):
+        return False
+
+    @property
+    def unroll_loops(self):
+        if self._unroll_loops is None:
+            self._unroll_loops = self._unroll_loops_default()
+        return self._unroll_loops
+
+    @unroll_loops.setter
+    def unroll_loops(self, value):
+        self._unroll_loops = value
+
+    def _unroll_loops_default(self):
+        return False
+
+    @property
+    def vectorization_report(self):
+        """If True, the report of the loops vectorized (or not) by the
+        compiler is saved next to the generated code.
+        """
+        if self._vectorization_report is None:
+            self._vectorization_report = self._vectorization_report_default()
+        return self._vectorization_report
+
+    @vectorization_report.setter
+    def vectorization_report(self, value):
+        self._vectorization_report = value
+
+    def _vectorization_report_default(self):
+        return False
+
 
 _config = None
 
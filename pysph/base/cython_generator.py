@@ -11,12 +11,15 @@ except ImportError:
     from ordereddict import OrderedDict
 import inspect
 import logging
+import math
+import re
 from mako.template import Template
 from textwrap import dedent
 import types
 
 
-from pysph.base.ast_utils import get_assigned, has_return
+from pysph.base.ast_utils import (get_assigned, get_assigned_attributes,
+    has_return)
 from pysph.base.config import get_config
 
 
@@ -73,6 +76,33 @@ def all_numeric(seq):
         types = [int, float]
     return all(type(x) in types for x in seq)
 
+def get_common_constants(objects):
+    """Return a dictionary of the scalar numeric attributes that have the
+    same value in all the given objects.  These can be passed as the
+    `constants` to :py:meth:`CythonGenerator.parse`.
+    """
+    result = {}
+    for name, value in objects[0].__dict__.items():
+        if not isinstance(value, (int, float)):
+            continue
+        same = all(
+            type(obj.__dict__.get(name)) is type(value) and
+            obj.__dict__[name] == value for obj in objects
+        )
+        if same:
+            result[name] = value
+    return result
+
+
+def _get_init_defaults(cls):
+    try:
+        spec = inspect.getargspec(cls.__init__)
+    except (TypeError, ValueError):
+        return {}
+    defaults = spec.defaults if spec.defaults is not None else ()
+    return dict(zip(spec.args[len(spec.args) - len(defaults):], defaults))
+
+
 class CodeGenerationError(Exception):
     pass
 
@@ -112,6 +142,8 @@ class CythonGenerator(object):
         self.ignore_methods = ['_cython_code_']
         self.known_types = known_types if known_types is not None else {}
         self._config = get_config()
+        # Literals to substitute for the attributes of the class being parsed.
+        self._constants = {}
 
     ##### Public protocol #####################################################
 
@@ -153,12 +185,24 @@ class CythonGenerator(object):
     def get_code(self):
         return self.code
 
-    def parse(self, obj):
+    def parse(self, obj, constants=None):
+        """Generate the code for the given function or instance.
+
+        Parameters
+        -----------
+
+        - obj: the function or instance to wrap.
+
+        - constants: dict: attributes of the instance whose values are
+             written as literals in the generated methods instead of being
+             looked up at runtime.  Only scalar numbers that are not
+             assigned in the methods are used.
+        """
         obj_type = type(obj)
         if obj_type is types.FunctionType:
             self._parse_function(obj)
         elif hasattr(obj, '__class__'):
-            self._parse_instance(obj)
+            self._parse_instance(obj, constants)
         else:
             raise TypeError('Unsupport type to wrap: %s'%obj_type)
 
@@ -254,9 +298,44 @@ class CythonGenerator(object):
         symbols = get_assigned(dedented_body)
         undefined = symbols - set(declared) - args
         declare = [indent +'cdef double %s\n'%x for x in sorted(undefined)]
-        code = ''.join(declare) + cython_body
+        code = ''.join(declare) + self._substitute_constants(cython_body)
         return code
 
+    def _get_constants(self, cls, values, public_vars):
+        """Return the literals for the given attribute values of the class
+        that can be substituted in its methods.
+        """
+        assigned = set()
+        for name in dir(cls):
+            meth = getattr(cls, name)
+            if name.startswith('_') or not callable(meth):
+                continue
+            src = dedent(''.join(inspect.getsourcelines(meth)[0]))
+            assigned.update(get_assigned_attributes(src))
+
+        constants = {}
+        for name, value in values.items():
+            c_type = public_vars.get(name)
+            if name in assigned or c_type not in ('int', 'long', 'double'):
+                continue
+            if c_type == 'double':
+                if math.isinf(value) or math.isnan(value):
+                    continue
+                literal = repr(float(value))
+            else:
+                literal = str(int(value))
+            constants[name] = '(%s)' % literal
+        return constants
+
+    def _substitute_constants(self, code):
+        constants = self._constants
+        if len(constants) == 0:
+            return code
+        pattern = r'\bself\.(%s)\b' % '|'.join(
+            re.escape(x) for x in sorted(constants)
+        )
+        return re.sub(pattern, lambda m: constants[m.group(1)], code)
+
     def _get_method_wrapper(self, meth, indent=' '*8):
         sourcelines = inspect.getsourcelines(meth)[0]
         defn, lines = get_func_definition(sourcelines)
@@ -274,8 +353,16 @@ class CythonGenerator(object):
     def _get_public_vars(self, obj):
         # For now get it all from the dict.
         data = obj.__dict__
-        vars = OrderedDict((name, self.detect_type(name, data[name]))
-                            for name in sorted(data.keys()))
+        defaults = _get_init_defaults(obj.__class__)
+        vars = OrderedDict()
+        for name in sorted(data.keys()):
+            value = data[name]
+            # An integer passed for an argument that defaults to a float is
+            # still a double, so the code does not change with the value.
+            if isinstance(defaults.get(name), float) and \
+               isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+            vars[name] = self.detect_type(name, value)
         return vars
 
     def _get_py_method_spec(self, name, returns, args, indent=' '*8):
@@ -334,11 +421,16 @@ class CythonGenerator(object):
             code += '{defn}\n{body}'.format(defn=py_code[0], body=py_code[1])
         self.code = code
 
-    def _parse_instance(self, obj):
+    def _parse_instance(self, obj, constants=None):
         cls = obj.__class__
         name = cls.__name__
         public_vars = self._get_public_vars(obj)
-        methods = self._get_methods(cls)
+        if constants:
+            self._constants = self._get_constants(cls, constants, public_vars)
+        try:
+            methods = self._get_methods(cls)
+        finally:
+            self._constants = {}
         helper = CythonClassHelper(name=name, public_vars=public_vars,
                                    methods=methods)
         self.code = helper.generate()
@@ -6,6 +6,7 @@ from distutils.errors import CompileError, LinkError
 import hashlib
 import imp
 import importlib
+import multiprocessing
 import numpy
 import os
 from os.path import dirname, exists, expanduser, isdir, join
@@ -42,6 +43,36 @@ def get_md5(data):
     return hashlib.md5(data.encode()).hexdigest()
 
 
+def _is_clang():
+    cc = os.environ.get('CC') or get_config_var('CC') or ''
+    return 'clang' in cc
+
+
+def get_optimization_flags():
+    """Return the compiler flags for the optimization options set in the
+    configuration (`opt_level`, `march`, `fast_math` and `unroll_loops`).
+    """
+    config = get_config()
+    flags = []
+    if sys.platform == 'win32':
+        if config.opt_level is not None:
+            flags.append('/O%s' % config.opt_level)
+        if config.march is not None:
+            flags.append('/arch:%s' % config.march)
+        if config.fast_math:
+            flags.append('/fp:fast')
+    else:
+        if config.opt_level is not None:
+            flags.append('-O%s' % config.opt_level)
+        if config.march is not None:
+            flags.append('-march=%s' % config.march)
+        if config.fast_math:
+            flags.append('-ffast-math')
+        if config.unroll_loops:
+            flags.append('-funroll-loops')
+    return flags
+
+
 class ExtModule(object):
     """Encapsulates the generated code, extension module etc.
     """
@@ -70,7 +101,15 @@ class ExtModule(object):
         """
         self._setup_root(root)
         self.code = src
-        self.hash = get_md5(src)
+        # The optimization flags are part of the hash so the module is
+        # compiled again when they change.
+        self.optimization_flags = get_optimization_flags()
+        if self.optimization_flags:
+            self.hash = get_md5(
+                src + '\n# ' + ' '.join(self.optimization_flags)
+            )
+        else:
+            self.hash = get_md5(src)
         self.extension = extension
         self.name = 'm_{0}'.format(self.hash)
         self._setup_filenames()
@@ -86,12 +125,16 @@ class ExtModule(object):
             self.num_procs = 1
 
         self.shared_filesystem = False
+        # Time taken by the phases of the last build, in secs.
+        self.timings = {}
         self._create_source()
 
     def _setup_filenames(self):
         base = self.name
         self.src_path = join(self.root, base + '.' + self.extension)
         self.ext_path = join(self.root, base + get_config_var('SO'))
+        self.cpp_path = join(self.build_dir, base + '.cpp')
+        self.report_path = join(self.root, base + '.vec.txt')
         self.lock_path = join(self.root, base + '.lock')
 
     @contextmanager
@@ -181,6 +224,9 @@ class ExtModule(object):
             return True
         elif self._dependencies_have_changed():
             return True
+        elif get_config().vectorization_report and \
+             not exists(self.report_path):
+            return True
         else:
             return False
 
@@ -199,7 +245,7 @@ class ExtModule(object):
                     extra_compile_args, extra_link_args = self._get_extra_args()
 
                     extension = Extension(
-                        name=self.name, sources=[self.src_path],
+                        name=self.name, sources=[self.cpp_path],
                         include_dirs=inc_dirs,
                         extra_compile_args=extra_compile_args,
                         extra_link_args=extra_link_args,
@@ -214,12 +260,19 @@ class ExtModule(object):
                         script_args = []
                     else:
                         script_args = ['--verbose']
+                    if exists(self.report_path):
+                        os.remove(self.report_path)
                     try:
                         with CaptureMultipleStreams() as stream:
-                            mod = pyxbuild.pyx_to_dll(self.src_path, extension,
+                            start = time.time()
+                            self._cythonize()
+                            self.timings['cythonize'] = time.time() - start
+                            start = time.time()
+                            mod = pyxbuild.pyx_to_dll(self.cpp_path, extension,
                                 pyxbuild_dir=self.build_dir, force_rebuild=True,
                                 setup_args={'script_args': script_args}
                             )
+                            self.timings['compile'] = time.time() - start
                     except (CompileError, LinkError):
                         hline = "*"*80
                         print(hline + "\nERROR")
@@ -230,6 +283,14 @@ class ExtModule(object):
                         print(hline + "\n" + msg)
                         sys.exit(1)
                     shutil.copy(mod, self.ext_path)
+                    self._message(
+                        "Compiled in %.2f s (Cython: %.2f s, C++: %.2f s)" % (
+                            sum(self.timings.values()),
+                            self.timings['cythonize'], self.timings['compile']
+                        )
+                    )
+                    if get_config().vectorization_report:
+                        self._write_vectorization_report(stream)
                 else:
                     self._message("Precompiled code from:", self.src_path)
         if MPI is not None:
@@ -244,15 +305,101 @@ class ExtModule(object):
         file, path, desc = imp.find_module(self.name, [dirname(self.ext_path)])
         return imp.load_module(self.name, file, path, desc)
 
+    def _cythonize(self):
+        """Translate the source to C++, this is compiled separately so the
+        time taken by each can be measured.
+        """
+        from Cython.Compiler.Main import (CompilationOptions, default_options,
+                                          compile as cython_compile)
+        options = CompilationOptions(default_options, cplus=True,
+                                     output_file=self.cpp_path)
+        result = cython_compile(self.src_path, options)
+        if result.num_errors > 0:
+            raise CompileError("Cython failed to compile %s" % self.src_path)
+
     def _get_extra_args(self):
+        compile_args = list(self.optimization_flags)
+        link_args = []
         if get_config().use_openmp:
             if sys.platform == 'win32':
-                return ['/openmp'], []
+                compile_args.append('/openmp')
             else:
-                return ['-fopenmp'], ['-fopenmp']
+                compile_args.append('-fopenmp')
+                link_args.append('-fopenmp')
+        if get_config().vectorization_report:
+            compile_args.extend(self._get_vectorization_report_args())
+        return compile_args, link_args
+
+    def _get_vectorization_report_args(self):
+        if sys.platform == 'win32':
+            return ['/Qvec-report:2']
+        elif _is_clang():
+            return ['-Rpass=loop-vectorize', '-Rpass-missed=loop-vectorize']
         else:
-            return [], []
+            return ['-fopt-info-vec-optimized-missed=%s' % self.report_path]
+
+    def _write_vectorization_report(self, stream):
+        """GCC writes the report directly to the file, the other compilers
+        print it so the captured output is saved instead.
+        """
+        if not exists(self.report_path):
+            with open(self.report_path, 'w') as f:
+                f.write(''.join(stream.get_output()))
+        self._message("Vectorization report at:", self.report_path)
 
     def _message(self, *args):
         if self.verbose:
             print(' '.join(args))
+
+
+def _build_module(args):
+    """Build an extension module with the given arguments, this is run in a
+    separate process.  Returns the timings of the build or None if the build
+    failed.
+    """
+    code, kw = args
+    ext_mod = ExtModule(code, **kw)
+    try:
+        ext_mod.build()
+    except SystemExit:
+        return None
+    return ext_mod.timings
+
+
+def build_modules(ext_modules, workers=None):
+    """Build the given extension modules concurrently in a pool of
+    processes.
+
+    Only the modules that need to be recompiled are built.  Nothing is done
+    when there is at most one such module, when running with MPI or in a
+    daemonic process, the modules are then built when they are loaded.  Any
+    module that failed to build is also rebuilt when it is loaded so the
+    errors are reported as usual.
+
+    Parameters
+    ----------
+
+    ext_modules : list : ExtModule instances to build.
+
+    workers : int : maximum number of processes to use, defaults to the
+        number of CPUs.
+    """
+    todo = [m for m in ext_modules if m.should_recompile()]
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = min(workers, len(todo))
+    if workers < 2 or MPI is not None or \
+       multiprocessing.current_process().daemon:
+        return
+    args = [(m.code, dict(extension=m.extension, root=m.root,
+                          verbose=m.verbose, depends=m.depends))
+            for m in todo]
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.map(_build_module, args)
+    finally:
+        pool.close()
+        pool.join()
+    for ext_mod, timings in zip(todo, results):
+        if timings is not None:
+            ext_mod.timings = timings
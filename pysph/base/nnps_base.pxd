@@ -28,6 +28,9 @@ cdef extern from 'limits.h':
 ctypedef unsigned int ZOLTAN_ID_TYPE
 ctypedef unsigned int* ZOLTAN_ID_PTR
 
+# Byte type for the compressed neighbor cache.
+ctypedef unsigned char uchar
+
 cdef inline double norm2(double x, double y, double z) nogil:
     return x*x + y*y + z*z
 
@@ -241,13 +244,28 @@ cdef class NeighborCache:
     cdef list _neighbor_arrays
     cdef int _last_avg_nbr_size
 
+    # Compressed storage: zig-zag delta/varint encoded neighbor indices,
+    # one byte stream per thread indexed by the _start_stop offsets.
+    cdef bint _compressed
+    cdef vector[vector[uchar]] _encoded_neighbors
+    cdef void **_scratch
+    cdef list _scratch_arrays
+
+    # If False, the cache holds no data and neighbors are searched directly.
+    cdef bint _enabled
+
     cdef void get_neighbors_raw(self, size_t d_idx, UIntArray nbrs) nogil
     cpdef get_neighbors(self, int src_index, size_t d_idx, UIntArray nbrs)
     cpdef find_all_neighbors(self)
     cpdef update(self)
+    cpdef long get_memory_usage(self)
+    cpdef long estimate_memory_usage(self)
+    cpdef set_enabled(self, bint enabled)
 
     cdef void _update_last_avg_nbr_size(self)
     cdef void _find_neighbors(self, long d_idx) nogil
+    cdef void _find_neighbors_compressed(self, long d_idx) nogil
+    cdef void _release_storage(self)
 
 cdef class NNPSBase:
     ##########################################################################
@@ -257,6 +275,8 @@ cdef class NNPSBase:
     cdef public list pa_wrappers      # list of particle array wrappers
     cdef public int narrays           # Number of particle arrays
     cdef public bint use_cache        # Use cache or not.
+    cdef public bint compress_cache   # Store cached neighbors compressed.
+    cdef public long cache_memory_budget # Max bytes for all caches (<=0: any)
     cdef list cache                   # The neighbor cache.
     cdef int src_index, dst_index     # The current source and dest indices
 
@@ -297,6 +317,16 @@ cdef class NNPS(NNPSBase):
     cdef public NeighborCache current_cache  # The current cache
 
     cdef public bint sort_gids        # Sort neighbors by their gids.
+    cdef double radius_scale2         # Square of the radius scale
+
+    # Verlet lists: neighbors are found with a radius enlarged by the skin
+    # and the binning/caches are only rebuilt when particles have moved far
+    # enough that the lists may be invalid.
+    cdef public double skin           # Skin as a fraction of the radius
+    cdef public long n_rebuilds       # Number of times the lists were built
+    cdef double _radius_scale0        # Radius scale without the skin
+    cdef bint _force_rebuild          # Rebuild on the next update
+    cdef list _x0, _y0, _z0, _h0      # Positions and h at the last build
 
     ##########################################################################
     # Member functions
@@ -316,6 +346,15 @@ cdef class NNPS(NNPSBase):
     # compute the min and max for the particle coordinates
     cdef _compute_bounds(self)
 
+    # update the neighbor caches subject to the memory budget
+    cdef _update_caches(self)
+
+    # check if the Verlet lists need to be rebuilt
+    cdef bint _needs_rebuild(self)
+
+    # save the positions and smoothing lengths used to build the lists
+    cdef _save_reference_state(self)
+
     cdef void find_nearest_neighbors(self, size_t d_idx, UIntArray nbrs) nogil
 
     cdef void get_nearest_neighbors(self, size_t d_idx,
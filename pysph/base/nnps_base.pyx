@@ -211,6 +211,60 @@ cpdef UIntArray arange_uint(int start, int stop=-1):
 
     return arange
 
+cdef _spread_bits(np.ndarray v):
+    """Insert two zero bits between each of the lower 21 bits of `v`."""
+    v = v & np.uint64(0x1fffff)
+    v = (v | (v << np.uint64(32))) & np.uint64(0x1f00000000ffff)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x1f0000ff0000ff)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x100f00f00f00f00f)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x10c30c30c30c30c3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return v
+
+def get_morton_order(x, y, z, double cell_size, tag=None):
+    """Return the indices that sort the given points along a Morton
+    (Z-order) curve.
+
+    Parameters
+    ----------
+
+    x, y, z : array_like
+        Coordinates of the points.
+
+    cell_size : double
+        Size of the cells used to compute the keys, points in the same cell
+        retain their relative order.  This must be positive.
+
+    tag : array_like, default (None)
+        Optional particle tags, if given the 'Local' particles are placed
+        before all the others so the real particles stay at the beginning.
+
+    Returns
+    -------
+
+    order : numpy array of the (int64) indices.
+
+    """
+    if not (cell_size > 0.0 and np.isfinite(cell_size)):
+        raise ValueError('Invalid cell size %r for the Morton order.' %
+                         cell_size)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    if len(x) == 0:
+        return np.zeros(0, dtype=np.int64)
+    cdef np.ndarray key = np.zeros(len(x), dtype=np.uint64)
+    cdef int shift
+    for shift, c in enumerate((x, y, z)):
+        cid = np.floor((c - c.min())/cell_size)
+        cid = np.clip(cid, 0, 0x1fffff).astype(np.uint64)
+        key |= _spread_bits(cid) << np.uint64(shift)
+    if tag is None:
+        return np.argsort(key, kind='mergesort').astype(np.int64)
+    else:
+        is_local = np.asarray(tag) != Local
+        return np.lexsort((key, is_local)).astype(np.int64)
+
 ##############################################################################
 cdef class NNPSParticleArrayWrapper:
     def __init__(self, ParticleArray pa):
@@ -805,6 +859,55 @@ cdef class Cell:
 
 ###############################################################################
 
+cdef inline void _encode_neighbors(vector[uchar]* buf,
+                                   unsigned int* nbrs, long n,
+                                   unsigned int ref) nogil:
+    """Append the `n` neighbor indices to `buf` as zig-zag encoded
+    differences (from `ref` for the first index and from the previous index
+    after that) stored as variable length integers (7 bits per byte).  For
+    spatially ordered particles the differences are small and most indices
+    take one or two bytes instead of four.
+    """
+    cdef long i
+    cdef long long diff
+    cdef long long prev = ref
+    cdef unsigned long long zz
+    for i in range(n):
+        diff = <long long>nbrs[i] - prev
+        prev = nbrs[i]
+        zz = <unsigned long long>((diff << 1) ^ (diff >> 63))
+        while zz >= 0x80:
+            buf[0].push_back(<unsigned char>((zz & 0x7f) | 0x80))
+            zz >>= 7
+        buf[0].push_back(<unsigned char>zz)
+
+
+cdef inline void _decode_neighbors(unsigned char* data, size_t start,
+                                   size_t end, unsigned int ref,
+                                   UIntArray nbrs) nogil:
+    """Decode the bytes in [start, end) produced by `_encode_neighbors` into
+    `nbrs`.  The `nbrs` array is reset first.
+    """
+    cdef size_t i = start
+    cdef unsigned long long zz
+    cdef unsigned char b
+    cdef int shift
+    cdef long long prev = ref
+    nbrs.c_reset()
+    while i < end:
+        zz = 0
+        shift = 0
+        while True:
+            b = data[i]
+            i += 1
+            zz |= (<unsigned long long>(b & 0x7f)) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        prev += <long long>(zz >> 1) ^ (-(<long long>(zz & 1)))
+        nbrs.c_append(<unsigned int>prev)
+
+
 cdef class NeighborCache:
     def __init__(self, NNPS nnps, int dst_index, int src_index):
         self._dst_index = dst_index
@@ -830,34 +933,58 @@ cdef class NeighborCache:
             self._cached.data[i] = 0
 
         self._last_avg_nbr_size = nnbr
+        self._compressed = nnps.compress_cache
+        self._enabled = True
         self._start_stop = UIntArray()
         self._pid_to_tid = UIntArray()
         self._neighbor_arrays = []
         self._neighbors = <void**>aligned_malloc(
             sizeof(void*)*self._n_threads
         )
+        self._scratch_arrays = []
+        self._scratch = <void**>aligned_malloc(
+            sizeof(void*)*self._n_threads
+        )
+        self._encoded_neighbors.resize(self._n_threads)
 
         cdef UIntArray _arr
         for i in range(self._n_threads):
             _arr = UIntArray()
             self._neighbor_arrays.append(_arr)
             self._neighbors[i] = <void*>_arr
+            _arr = UIntArray()
+            self._scratch_arrays.append(_arr)
+            self._scratch[i] = <void*>_arr
 
     def __dealloc__(self):
         aligned_free(self._neighbors)
+        aligned_free(self._scratch)
 
     #### Public protocol ################################################
 
     cdef void get_neighbors_raw(self, size_t d_idx, UIntArray nbrs) nogil:
+        if not self._enabled:
+            nbrs.c_reset()
+            self._nnps.find_nearest_neighbors(d_idx, nbrs)
+            return
         if self._cached.data[d_idx] == 0:
-            self._find_neighbors(d_idx)
+            if self._compressed:
+                self._find_neighbors_compressed(d_idx)
+            else:
+                self._find_neighbors(d_idx)
         cdef size_t start, end, tid
         start = self._start_stop.data[2*d_idx]
         end = self._start_stop.data[2*d_idx + 1]
         tid = self._pid_to_tid.data[d_idx]
-        nbrs.c_set_view(
-            &(<UIntArray>self._neighbors[tid]).data[start], end - start
-        )
+        if self._compressed:
+            _decode_neighbors(
+                self._encoded_neighbors[tid].data(), start, end,
+                <unsigned int>d_idx, nbrs
+            )
+        else:
+            nbrs.c_set_view(
+                &(<UIntArray>self._neighbors[tid]).data[start], end - start
+            )
 
     cpdef get_neighbors(self, int src_index, size_t d_idx, UIntArray nbrs):
         self.get_neighbors_raw(d_idx, nbrs)
@@ -866,13 +993,24 @@ cdef class NeighborCache:
         cdef long d_idx
         cdef long np = \
                 self._particles[self._dst_index].get_number_of_particles()
+        if not self._enabled:
+            return
 
         with nogil, parallel():
             for d_idx in prange(np):
                 if self._cached.data[d_idx] == 0:
-                    self._find_neighbors(d_idx)
+                    if self._compressed:
+                        self._find_neighbors_compressed(d_idx)
+                    else:
+                        self._find_neighbors(d_idx)
 
     cpdef update(self):
+        cdef bint compressed = self._nnps.compress_cache
+        if compressed != self._compressed:
+            # The stored data is in the other format, release it and start
+            # afresh with the default estimate for the neighbors.
+            self._release_storage()
+            self._compressed = compressed
         self._update_last_avg_nbr_size()
         cdef int n_threads = self._n_threads
         cdef int dst_index = self._dst_index
@@ -889,9 +1027,60 @@ cdef class NeighborCache:
         # case scenario.
         cdef size_t safety = 1024
         for i in range(n_threads):
-            (<UIntArray>self._neighbors[i]).c_reserve(
-                self._last_avg_nbr_size*np/n_threads + safety
-            )
+            if self._compressed:
+                self._encoded_neighbors[i].clear()
+                self._encoded_neighbors[i].reserve(
+                    self._last_avg_nbr_size*np/n_threads + safety
+                )
+            else:
+                (<UIntArray>self._neighbors[i]).c_reserve(
+                    self._last_avg_nbr_size*np/n_threads + safety
+                )
+
+    cpdef long get_memory_usage(self):
+        """Return the number of bytes currently held by this cache, this is
+        zero for a disabled cache.
+        """
+        cdef long nbytes = 0
+        cdef int i
+        cdef UIntArray arr
+        if not self._enabled:
+            return 0
+        for i in range(self._n_threads):
+            nbytes += self._encoded_neighbors[i].capacity()
+            arr = <UIntArray>self._neighbors[i]
+            nbytes += arr.alloc*sizeof(unsigned int)
+            arr = <UIntArray>self._scratch[i]
+            nbytes += arr.alloc*sizeof(unsigned int)
+        nbytes += self._start_stop.alloc*sizeof(unsigned int)
+        nbytes += self._pid_to_tid.alloc*sizeof(unsigned int)
+        nbytes += self._cached.alloc*sizeof(int)
+        return nbytes
+
+    cpdef long estimate_memory_usage(self):
+        """Return the number of bytes this cache is expected to need for the
+        current number of destination particles.  This is based on the
+        average storage needed per particle when the cache was last filled.
+        """
+        cdef long np = \
+                self._particles[self._dst_index].get_number_of_particles()
+        cdef long item_size = 1 if self._nnps.compress_cache \
+                              else sizeof(unsigned int)
+        cdef long nbr_size = self._last_avg_nbr_size
+        if self._nnps.compress_cache != self._compressed:
+            # Assume two bytes per neighbor when switching formats.
+            nbr_size = nbr_size*2 if self._nnps.compress_cache \
+                       else nbr_size/2
+        return np*(nbr_size*item_size + 3*sizeof(unsigned int) + sizeof(int))
+
+    cpdef set_enabled(self, bint enabled):
+        """Enable or disable the cache.  A disabled cache releases its
+        storage and finds the neighbors directly on each request.
+        """
+        if not enabled and self._enabled:
+            self._update_last_avg_nbr_size()
+            self._release_storage()
+        self._enabled = enabled
 
     #### Private protocol ################################################
 
@@ -917,6 +1106,36 @@ cdef class NeighborCache:
             (<UIntArray>self._neighbors[thread_id]).length
         self._cached.data[d_idx] = 1
 
+    cdef void _find_neighbors_compressed(self, long d_idx) nogil:
+        cdef int thread_id = threadid()
+        cdef vector[uchar]* buf = &self._encoded_neighbors[thread_id]
+        (<UIntArray>self._scratch[thread_id]).c_reset()
+        self._nnps.find_nearest_neighbors(
+            d_idx, <UIntArray>self._scratch[thread_id]
+        )
+        self._pid_to_tid.data[d_idx] = thread_id
+        self._start_stop.data[d_idx*2] = buf[0].size()
+        _encode_neighbors(
+            buf, (<UIntArray>self._scratch[thread_id]).data,
+            (<UIntArray>self._scratch[thread_id]).length,
+            <unsigned int>d_idx
+        )
+        self._start_stop.data[d_idx*2+1] = buf[0].size()
+        self._cached.data[d_idx] = 1
+
+    cdef void _release_storage(self):
+        cdef int i
+        cdef UIntArray _arr
+        for i in range(self._n_threads):
+            self._encoded_neighbors[i].clear()
+            self._encoded_neighbors[i].shrink_to_fit()
+            _arr = UIntArray()
+            self._neighbor_arrays[i] = _arr
+            self._neighbors[i] = <void*>_arr
+        self._start_stop = UIntArray()
+        self._pid_to_tid = UIntArray()
+        self._cached = IntArray()
+
 
 ##############################################################################
 cdef class NNPSBase:
@@ -973,6 +1192,11 @@ cdef class NNPSBase:
         # periodicity
         self.is_periodic = self.domain.manager.is_periodic
 
+        # Neighbor cache storage options, these may be changed at any time
+        # and take effect on the next update.
+        self.compress_cache = False
+        self.cache_memory_budget = 0
+
         # The total number of cells.
         self.n_cells = 0
 
@@ -1115,6 +1339,7 @@ cdef class NNPS(NNPSBase):
                  bint sort_gids=False):
         NNPSBase.__init__(self, dim, particles, radius_scale, ghost_layers,
                 domain, cache, sort_gids)
+        self.radius_scale2 = radius_scale*radius_scale
 
         # min and max coordinate values
         self.xmin = DoubleArray(3)
@@ -1128,11 +1353,56 @@ cdef class NNPS(NNPSBase):
                 _cache.append(NeighborCache(self, d_idx, s_idx))
         self.cache = _cache
 
+        # Verlet lists are disabled by default.
+        self.skin = 0.0
+        self.n_rebuilds = 0
+        self._radius_scale0 = radius_scale
+        self._force_rebuild = True
+        self._x0 = [DoubleArray() for i in range(self.narrays)]
+        self._y0 = [DoubleArray() for i in range(self.narrays)]
+        self._z0 = [DoubleArray() for i in range(self.narrays)]
+        self._h0 = [DoubleArray() for i in range(self.narrays)]
+
     #### Public protocol #################################################
 
     def set_in_parallel(self, bint in_parallel):
         self.domain.manager.in_parallel = in_parallel
 
+    def set_verlet_skin(self, double skin):
+        """Use Verlet neighbor lists with the given skin.
+
+        The neighbors are searched for with a radius of
+        ``radius_scale*h*(1 + skin)`` and are cached.  Subsequent calls to
+        `update` only rebin the particles and rebuild the caches once the
+        particles have moved (or their smoothing lengths have grown) enough
+        that a neighbor within ``radius_scale*h`` could have been missed;
+        for a constant h this happens when the maximum displacement exceeds
+        half the skin.  The lists therefore contain some particles outside
+        the kernel support, these contribute nothing with compactly
+        supported kernels.
+
+        This requires the neighbor cache, a skin of zero disables Verlet
+        lists.
+
+        Parameters
+        ----------
+
+        skin: double
+            The skin as a fraction of the search radius.
+        """
+        if skin < 0.0:
+            raise ValueError('The Verlet skin must be non-negative.')
+        if skin > 0.0 and not self.use_cache:
+            raise RuntimeError(
+                'Verlet lists require the neighbor cache, pass cache=True.'
+            )
+        self.skin = skin
+        self.radius_scale = self._radius_scale0*(1.0 + skin)
+        self.radius_scale2 = self.radius_scale*self.radius_scale
+        self.domain.set_radius_scale(self.radius_scale)
+        self.domain.update()
+        self._force_rebuild = True
+
     def update_domain(self, *args, **kwargs):
         self.domain.update()
 
@@ -1156,6 +1426,9 @@ cdef class NNPS(NNPSBase):
 
         cdef DomainManager domain = self.domain
 
+        if self.skin > 0.0 and not self._needs_rebuild():
+            return
+
         # use cell sizes computed by the domain.
         self.cell_size = domain.manager.cell_size
         self.hmin = domain.manager.hmin
@@ -1174,8 +1447,85 @@ cdef class NNPS(NNPSBase):
             self._bin( pa_index=i, indices=indices )
 
         if self.use_cache:
-            for cache in self.cache:
-                cache.update()
+            self._update_caches()
+
+        if self.skin > 0.0:
+            self._save_reference_state()
+        self.n_rebuilds += 1
+
+    def reorder_particles(self):
+        """Reorder all the particle arrays along a Morton (Z-order) curve.
+
+        Particles that are close in space end up close in memory which
+        improves the cache behavior of the neighbor loops.  All properties
+        (including the ``gid``) are permuted together and the real particles
+        are kept before any remote or ghost particles.  The binning and any
+        neighbor caches (or Verlet lists) are rebuilt on the next call to
+        `update`.  If the particles have not been binned yet, the domain is
+        updated to find the cell size.
+        """
+        cdef int i
+        cdef ParticleArray pa
+        cdef BaseArray arr
+        cdef LongArray indices = LongArray()
+        cdef double cell_size = self.cell_size
+        if cell_size <= 0.0:
+            self.update_domain()
+            cell_size = self.domain.manager.cell_size
+
+        for i in range(self.narrays):
+            pa = self.particles[i]
+            order = get_morton_order(
+                pa.get_carray('x').get_npy_array(),
+                pa.get_carray('y').get_npy_array(),
+                pa.get_carray('z').get_npy_array(),
+                cell_size, pa.get_carray('tag').get_npy_array()
+            )
+            indices.resize(len(order))
+            indices.set_data(order)
+            for arr in pa.properties.values():
+                arr.c_align_array(indices)
+
+        self._force_rebuild = True
+
+    def get_cache_memory_usage(self):
+        """Return a dictionary keyed on the (destination, source) array names
+        with the number of bytes used by the neighbor cache for each pair.
+        """
+        cdef int d_idx, s_idx
+        result = {}
+        for d_idx in range(self.narrays):
+            for s_idx in range(self.narrays):
+                key = (self.particles[d_idx].name, self.particles[s_idx].name)
+                result[key] = self.cache[d_idx*self.narrays + s_idx]\
+                    .get_memory_usage()
+        return result
+
+    def get_neighbor_lists(self, int src_index, int dst_index):
+        """Return the neighbors of all the destination particles in
+        compressed sparse row form.
+
+        Returns a tuple ``(indptr, indices)`` of arrays such that the
+        neighbors (in the source array) of the destination particle ``i``
+        are ``indices[indptr[i]:indptr[i+1]]``.
+        """
+        cdef long i, j
+        cdef UIntArray nbrs = UIntArray()
+        cdef UIntArray result = UIntArray()
+        cdef ParticleArray dst = self.particles[dst_index]
+        cdef long n_dst = dst.get_number_of_particles()
+        cdef np.ndarray[np.int64_t, ndim=1] indptr = np.zeros(
+            n_dst + 1, dtype=np.int64
+        )
+
+        self.set_context(src_index, dst_index)
+        for i in range(n_dst):
+            self.get_nearest_neighbors(i, nbrs)
+            for j in range(nbrs.length):
+                result.c_append(nbrs.data[j])
+            indptr[i + 1] = result.length
+
+        return indptr, result.get_npy_array().copy()
 
     cdef void get_nearest_neighbors(self, size_t d_idx, UIntArray nbrs) nogil:
         if self.use_cache:
@@ -1261,6 +1611,90 @@ cdef class NNPS(NNPSBase):
             for i in range(length):
                 nbrs[i] = _data[i].first
 
+    cdef _update_caches(self):
+        """Update the neighbor caches.  If a memory budget is set, the caches
+        are enabled in order of the (destination, source) pairs as long as
+        their expected storage fits in the budget, the remaining pairs
+        fall back to a direct neighbor search.
+        """
+        cdef NeighborCache cache
+        cdef long budget = self.cache_memory_budget
+        cdef long used = 0
+        cdef long needed
+        for cache in self.cache:
+            needed = cache.estimate_memory_usage()
+            if budget > 0 and used + needed > budget:
+                cache.set_enabled(False)
+            else:
+                cache.set_enabled(True)
+                cache.update()
+                used += needed
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef bint _needs_rebuild(self):
+        """Return True if the Verlet lists may have become invalid.
+
+        A pair within the (current) search radius of particle i was within
+        the enlarged radius when the lists were built as long as twice the
+        maximum displacement is less than the smallest margin
+        ``radius_scale*((1 + skin)*h0 - h)`` over all particles.
+        """
+        if self._force_rebuild or self.domain.manager.in_parallel:
+            return True
+
+        cdef NNPSParticleArrayWrapper pa_wrapper
+        cdef DoubleArray x0, y0, z0, h0
+        cdef double *x
+        cdef double *y
+        cdef double *z
+        cdef double *h
+        cdef double fac = 1.0 + self.skin
+        cdef double radius_scale = self._radius_scale0
+        cdef double disp2, max_disp2 = 0.0
+        cdef double margin, min_margin = 1e100
+        cdef long i, n
+        cdef int j
+
+        for j in range(self.narrays):
+            pa_wrapper = self.pa_wrappers[j]
+            n = pa_wrapper.get_number_of_particles()
+            x0 = self._x0[j]
+            if n != x0.length:
+                return True
+            y0 = self._y0[j]
+            z0 = self._z0[j]
+            h0 = self._h0[j]
+            x = pa_wrapper.x.data
+            y = pa_wrapper.y.data
+            z = pa_wrapper.z.data
+            h = pa_wrapper.h.data
+            for i in range(n):
+                disp2 = norm2(x[i] - x0.data[i], y[i] - y0.data[i],
+                              z[i] - z0.data[i])
+                max_disp2 = fmax(max_disp2, disp2)
+                margin = radius_scale*(fac*h0.data[i] - h[i])
+                min_margin = fmin(min_margin, margin)
+
+        return (min_margin <= 0.0) or (4.0*max_disp2 >= min_margin*min_margin)
+
+    cdef _save_reference_state(self):
+        cdef NNPSParticleArrayWrapper pa_wrapper
+        cdef DoubleArray src, dst
+        cdef int j
+        cdef long i, n
+        for j in range(self.narrays):
+            pa_wrapper = self.pa_wrappers[j]
+            n = pa_wrapper.get_number_of_particles()
+            for src, dst in ((pa_wrapper.x, self._x0[j]),
+                             (pa_wrapper.y, self._y0[j]),
+                             (pa_wrapper.z, self._z0[j]),
+                             (pa_wrapper.h, self._h0[j])):
+                dst.resize(n)
+                for i in range(n):
+                    dst.data[i] = src.data[i]
+        self._force_rebuild = False
+
     cpdef _bin(self, int pa_index, UIntArray indices):
         raise NotImplementedError("NNPS :: _bin called")
 
@@ -31,8 +31,6 @@ cdef class OctreeNNPS(NNPS):
         cdef int i
         self.tree = [Octree(leaf_max_particles) for i in range(self.narrays)]
 
-        self.radius_scale2 = radius_scale*radius_scale
-
         self.src_index = 0
         self.dst_index = 0
         self.leaf_max_particles = leaf_max_particles
@@ -178,8 +176,6 @@ cdef class CompressedOctreeNNPS(OctreeNNPS):
         cdef int i
         self.tree = [CompressedOctree(leaf_max_particles) for i in range(self.narrays)]
 
-        self.radius_scale2 = radius_scale*radius_scale
-
         self.src_index = 0
         self.dst_index = 0
         self.leaf_max_particles = leaf_max_particles
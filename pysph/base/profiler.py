@@ -0,0 +1,98 @@
+"""Simple timers to profile the different phases of a simulation.
+
+The timings are only recorded when ``get_config().profile`` is set.  The
+generated Cython code only contains the timer calls when profiling is
+enabled, so there is no overhead otherwise.
+
+Each timer is identified by a name and accumulates the total time spent and
+the number of calls.
+"""
+
+from __future__ import print_function
+import json
+from collections import defaultdict
+from timeit import default_timer as timer  # noqa: F401
+
+from .config import get_config
+
+_profile_info = defaultdict(lambda: {'time': 0.0, 'calls': 0})
+
+
+def add_profile_info(name, time):
+    """Add the given time (in secs) to the timer with the given name.
+    """
+    info = _profile_info[name]
+    info['time'] += time
+    info['calls'] += 1
+
+
+def get_profile_info():
+    """Return a dictionary keyed on the timer names with a dictionary having
+    the total 'time' (in secs) and number of 'calls' for each.
+    """
+    return dict((k, dict(v)) for k, v in _profile_info.items())
+
+
+def reset_profile_info():
+    _profile_info.clear()
+
+
+class profile_ctx(object):
+    """A context manager that times its block when profiling is enabled.
+
+    Examples
+    --------
+
+    >>> with profile_ctx('Solver.dump_output'):
+    ...     solver.dump_output()
+
+    """
+    def __init__(self, name):
+        self.name = name
+        self._start = None
+
+    def __enter__(self):
+        if get_config().profile:
+            self._start = timer()
+        return self
+
+    def __exit__(self, *args):
+        if self._start is not None:
+            add_profile_info(self.name, timer() - self._start)
+            self._start = None
+
+
+def get_profile_table(info=None):
+    """Return a table of the given (or recorded) profile info as a string
+    with the most expensive timers first.
+    """
+    if info is None:
+        info = get_profile_info()
+    if len(info) == 0:
+        return "No profile information available"
+    width = max(30, max(len(name) for name in info))
+    fmt = "{0:<%d} {1:>12} {2:>10} {3:>12}" % width
+    lines = [fmt.format('Name', 'Time (s)', 'Calls', 'Per call (s)')]
+    items = sorted(info.items(), key=lambda x: x[1]['time'], reverse=True)
+    for name, data in items:
+        calls = data['calls']
+        lines.append(fmt.format(
+            name, '%.6g' % data['time'], calls,
+            '%.6g' % (data['time']/calls if calls > 0 else 0.0)
+        ))
+    return '\n'.join(lines)
+
+
+def print_profile(info=None):
+    print(get_profile_table(info))
+
+
+def write_profile(fname):
+    """Write the recorded profile info as a table to ``fname + '.txt'`` and as
+    JSON to ``fname + '.json'``.
+    """
+    info = get_profile_info()
+    with open(fname + '.txt', 'w') as f:
+        f.write(get_profile_table(info) + '\n')
+    with open(fname + '.json', 'w') as f:
+        json.dump(info, f, indent=2, sort_keys=True)
@@ -20,7 +20,6 @@ cdef class SpatialHashNNPS(NNPS):
     # Data Attributes
     ############################################################################
     cdef long long int table_size               # Size of hashtable
-    cdef double radius_scale2
 
     cdef HashTable** hashtable
     cdef HashTable* current_hash
@@ -51,7 +50,6 @@ cdef class ExtendedSpatialHashNNPS(NNPS):
     # Data Attributes
     ############################################################################
     cdef long long int table_size               # Size of hashtable
-    cdef double radius_scale2
 
     cdef HashTable** hashtable
     cdef HashTable* current_hash
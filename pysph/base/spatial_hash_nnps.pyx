@@ -48,7 +48,6 @@ cdef class SpatialHashNNPS(NNPS):
         cdef int narrays = len(particles)
 
         self.table_size = table_size
-        self.radius_scale2 = radius_scale*radius_scale
 
         self.hashtable = <HashTable**> malloc(narrays*sizeof(HashTable*))
 
@@ -254,7 +253,6 @@ cdef class ExtendedSpatialHashNNPS(NNPS):
         cdef int narrays = len(particles)
 
         self.table_size = table_size
-        self.radius_scale2 = radius_scale*radius_scale
 
         self.hashtable = <HashTable**> malloc(narrays*sizeof(HashTable*))
 
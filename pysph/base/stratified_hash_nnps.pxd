@@ -32,7 +32,6 @@ cdef class StratifiedHashNNPS(NNPS):
     # Data Attributes
     ############################################################################
     cdef long long int table_size               # Size of hashtable
-    cdef double radius_scale2
 
     cdef public int num_levels
     cdef public int H
@@ -35,7 +35,6 @@ cdef class StratifiedHashNNPS(NNPS):
         )
 
         self.table_size = table_size
-        self.radius_scale2 = radius_scale*radius_scale
         self.interval_size = 0
         self.H = H
 
@@ -33,7 +33,6 @@ cdef class StratifiedSFCNNPS(NNPS):
     ############################################################################
     # Data Attributes
     ############################################################################
-    cdef double radius_scale2
 
     cdef public int num_levels
     cdef int max_num_bits
@@ -44,7 +44,6 @@ cdef class StratifiedSFCNNPS(NNPS):
             cache, sort_gids
         )
 
-        self.radius_scale2 = radius_scale*radius_scale
         self.interval_size = 0
 
         self.src_index = 0
@@ -3,8 +3,8 @@ import ast
 from textwrap import dedent
 import unittest
 
-from pysph.base.ast_utils import (get_assigned, get_aug_assign_symbols, get_symbols,
-    has_node, has_return)
+from pysph.base.ast_utils import (get_assigned, get_assigned_attributes,
+    get_aug_assign_symbols, get_symbols, has_node, has_return)
 
 
 class TestASTUtils(unittest.TestCase):
@@ -94,6 +94,18 @@ class TestASTUtils(unittest.TestCase):
         expect = ['u', 'v', 'x', 'y']
         self.assertEqual(assigned, expect)
 
+    def test_assigned_attributes(self):
+        code = dedent('''
+            self.a = 1.0
+            self.b += self.c
+            self.d, x = 0.0, 1.0
+            del self.e
+            other.f = 1.0
+            y = self.g
+            ''')
+        assigned = sorted(get_assigned_attributes(code))
+        self.assertEqual(assigned, ['a', 'b', 'd', 'e'])
+
 
 if __name__ == '__main__':
     unittest.main()
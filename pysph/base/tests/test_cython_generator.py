@@ -6,7 +6,7 @@ from math import pi, sin
 
 from pysph.base.config import get_config, set_config
 from pysph.base.cython_generator import (CythonGenerator, CythonClassHelper,
-    KnownType, all_numeric)
+    KnownType, all_numeric, get_common_constants)
 
 def declare(*args):
     pass
@@ -26,6 +26,11 @@ class EqWithReturn(BasicEq):
     def func(self, d_idx=0, d_x=[0.0, 0.0]):
         return d_x[d_idx]
 
+class EqWithState(BasicEq):
+    def func(self, d_idx=0, d_x=[0.0, 0.0]):
+        self.c += 1.0
+        d_x[d_idx] = self.rho*self.c
+
 class EqWithKnownTypes:
     def some_func(self, d_idx, d_p, WIJ, DWIJ, user, d_user, s_user):
         d_p[d_idx] = WIJ*DWIJ[0]
@@ -312,6 +317,67 @@ class TestCythonCodeGenerator(TestBase):
         """)
         self.assert_code_equal(cg.get_code().strip(), expect.strip())
 
+    def test_common_constants(self):
+        # Given
+        objs = [BasicEq(rho=1.0, c=2.0), BasicEq(rho=1.0, c=3.0),
+                BasicEq(rho=1, c=2.0)]
+
+        # When/Then
+        self.assertEqual(get_common_constants(objs[:1]), {'rho': 1.0,
+                                                          'c': 2.0})
+        self.assertEqual(get_common_constants(objs[:2]), {'rho': 1.0})
+        self.assertEqual(get_common_constants(objs), {})
+
+    def test_constants_are_substituted(self):
+        # Given
+        cg = CythonGenerator()
+        eq = EqWithMethod(rho=2.0, c=1)
+
+        # When
+        cg.parse(eq, constants=get_common_constants([eq]))
+
+        # Then
+        expect = dedent("""
+        cdef class EqWithMethod:
+            cdef public list _hidden
+            cdef public double c
+            cdef public double rho
+            def __init__(self, **kwargs):
+                for key, value in kwargs.items():
+                    setattr(self, key, value)
+
+            cdef inline void func(self, long d_idx, double* d_x):
+                cdef double tmp
+                tmp = abs((2.0)*(1.0))*sin(pi*(1.0))
+                d_x[d_idx] = d_x[d_idx]*tmp
+        """)
+        self.assert_code_equal(cg.get_code().strip(), expect.strip())
+
+    def test_assigned_attributes_are_not_substituted(self):
+        # Given
+        cg = CythonGenerator()
+        eq = EqWithState(rho=2.0, c=1.0)
+
+        # When
+        cg.parse(eq, constants=get_common_constants([eq]))
+
+        # Then
+        code = cg.get_code()
+        self.assertTrue('self.c += 1.0' in code)
+        self.assertTrue('d_x[d_idx] = (2.0)*self.c' in code)
+
+    def test_code_does_not_depend_on_parameter_values(self):
+        # Given
+        cg = CythonGenerator()
+
+        # When
+        cg.parse(EqWithMethod(rho=1.0, c=2.0))
+        code = cg.get_code()
+        cg.parse(EqWithMethod(rho=2, c=3))
+
+        # Then
+        self.assert_code_equal(cg.get_code(), code)
+
 
 if __name__ == '__main__':
     unittest.main()
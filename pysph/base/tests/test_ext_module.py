@@ -14,7 +14,8 @@ try:
 except ImportError:
     import mock
 
-from pysph.base.ext_module import get_md5, ExtModule
+from pysph.base.config import get_config
+from pysph.base.ext_module import build_modules, get_md5, ExtModule
 
 
 def _check_write_source(root):
@@ -55,6 +56,19 @@ class TestMiscExtMod(TestCase):
         self.assertNotEqual(get_md5(data), get_md5(data + ' '))
 
 
+@contextmanager
+def _set_config(**kw):
+    config = get_config()
+    orig = dict((k, getattr(config, k)) for k in kw)
+    for k, v in kw.items():
+        setattr(config, k, v)
+    try:
+        yield
+    finally:
+        for k, v in orig.items():
+            setattr(config, k, v)
+
+
 class TestExtModule(TestCase):
     def setUp(self):
         self.root = tempfile.mkdtemp()
@@ -107,6 +121,56 @@ class TestExtModule(TestCase):
         self.assertEqual(mod.f(), "hello world")
         self.assertTrue(exists(s.ext_path))
 
+    def test_build_modules_concurrently(self):
+        # Given
+        data = self.data
+        mods = [ExtModule(data, root=self.root),
+                ExtModule(data + "def g(): return 1\n", root=self.root)]
+        self.assertTrue(all(m.should_recompile() for m in mods))
+
+        # When
+        build_modules(mods, workers=2)
+
+        # Then
+        for m in mods:
+            self.assertFalse(m.should_recompile())
+            self.assertEqual(sorted(m.timings.keys()),
+                             ['compile', 'cythonize'])
+        self.assertEqual(mods[1].load().g(), 1)
+
+    def test_optimization_flags_are_part_of_hash(self):
+        # Given
+        data = self.data
+
+        # When
+        with _set_config(opt_level=3, march='native', fast_math=True,
+                         unroll_loops=True):
+            s = ExtModule(data, root=self.root)
+            compile_args, link_args = s._get_extra_args()
+
+        # Then
+        self.assertNotEqual(s.hash, get_md5(data))
+        self.assertEqual(s.name, 'm_%s' % s.hash)
+        if not sys.platform.startswith('win'):
+            self.assertEqual(
+                compile_args,
+                ['-O3', '-march=native', '-ffast-math', '-funroll-loops']
+            )
+        self.assertEqual(ExtModule(data, root=self.root).hash, get_md5(data))
+
+    def test_vectorization_report(self):
+        # Given
+        data = self.data
+        s = ExtModule(data, root=self.root)
+        s.build()
+
+        with _set_config(vectorization_report=True):
+            # When/Then
+            self.assertTrue(s.should_recompile())
+            s.build()
+            self.assertFalse(s.should_recompile())
+            self.assertTrue(exists(s.report_path))
+
     def _create_dummy_module(self):
         code = "def hello(): return 'hello'"
         modname = 'test_rebuild.py'
@@ -515,5 +515,21 @@ class TestWendlandQuinticC6_1D(TestCubicSpline1D):
         self.check_kernel_at_origin(55.0 / 64.0)
 
 
+class TestKernelArray(TestCase):
+    def test_kernel_array_should_match_kernel(self):
+        # Given
+        wrapper = get_compiled_kernel(CubicSpline(dim=3))
+        xij, yij, zij = np.random.uniform(-0.2, 0.2, (3, 50))
+        h = np.random.uniform(0.05, 0.15, 50)
+
+        # When
+        result = wrapper.kernel_array(xij, yij, zij, h)
+
+        # Then
+        expect = [wrapper.kernel(xij[i], yij[i], zij[i], 0.0, 0.0, 0.0, h[i])
+                  for i in range(50)]
+        self.assertTrue(np.allclose(result, expect))
+
+
 if __name__ == '__main__':
     main()
@@ -89,6 +89,97 @@ class TestNeighborCache(unittest.TestCase):
             nb_c = nb_cached.get_npy_array()
             self.assertTrue(np.all(nb_e == nb_c))
 
+    def _check_cache_matches_direct_search(self, nnps, particles):
+        nb_cached = UIntArray()
+        nb_direct = UIntArray()
+        n = len(particles)
+        for dst_index in range(n):
+            for src_index in range(n):
+                for i in range(len(particles[dst_index].x)):
+                    nnps.get_nearest_particles_no_cache(
+                        src_index, dst_index, i, nb_direct, False
+                    )
+                    nnps.get_nearest_particles(
+                        src_index, dst_index, i, nb_cached
+                    )
+                    nb_e = nb_direct.get_npy_array()
+                    nb_c = nb_cached.get_npy_array()
+                    self.assertTrue(np.all(nb_e == nb_c))
+
+    def test_compressed_cache_gives_same_neighbors(self):
+        # Given
+        pa1 = self._make_random_parray('pa1', 5)
+        pa2 = self._make_random_parray('pa2', 4)
+        particles = [pa1, pa2]
+        nnps = LinkedListNNPS(dim=3, particles=particles, cache=True)
+
+        # When
+        nnps.compress_cache = True
+        nnps.update()
+
+        # Then
+        self._check_cache_matches_direct_search(nnps, particles)
+
+        # When the particles change.
+        pa1.x[:] = np.random.random(len(pa1.x))
+        nnps.update()
+
+        # Then
+        self._check_cache_matches_direct_search(nnps, particles)
+
+    def test_compressed_cache_uses_less_memory(self):
+        # Given
+        pa = self._make_random_parray('pa', 10)
+        nnps = LinkedListNNPS(dim=3, particles=[pa], cache=True)
+        nnps.spatially_order_particles(0)
+        nnps.update()
+        for i in range(2):
+            nnps.set_context(0, 0)
+            nnps.current_cache.find_all_neighbors()
+            nnps.update()
+        raw = nnps.get_cache_memory_usage()[('pa', 'pa')]
+
+        # When
+        nnps.compress_cache = True
+        for i in range(2):
+            nnps.update()
+            nnps.set_context(0, 0)
+            nnps.current_cache.find_all_neighbors()
+
+        # Then
+        compressed = nnps.get_cache_memory_usage()[('pa', 'pa')]
+        self.assertTrue(compressed < raw)
+        self._check_cache_matches_direct_search(nnps, [pa])
+
+    def test_caches_over_memory_budget_fall_back_to_direct_search(self):
+        # Given
+        pa1 = self._make_random_parray('pa1', 5)
+        pa2 = self._make_random_parray('pa2', 4)
+        particles = [pa1, pa2]
+        nnps = LinkedListNNPS(dim=3, particles=particles, cache=True)
+        nnps.set_context(0, 0)
+        estimate = nnps.current_cache.estimate_memory_usage()
+
+        # When
+        nnps.cache_memory_budget = estimate
+        nnps.update()
+
+        # Then
+        usage = nnps.get_cache_memory_usage()
+        self.assertTrue(usage[('pa1', 'pa1')] > 0)
+        self.assertEqual(usage[('pa1', 'pa2')], 0)
+        self.assertEqual(usage[('pa2', 'pa2')], 0)
+        self._check_cache_matches_direct_search(nnps, particles)
+
+        # When
+        nnps.cache_memory_budget = 0
+        nnps.update()
+
+        # Then
+        usage = nnps.get_cache_memory_usage()
+        self.assertTrue(all(x > 0 for x in usage.values()))
+        self._check_cache_matches_direct_search(nnps, particles)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@ from numpy import random
 # PySPH imports
 from pysph.base.point import IntPoint, Point
 from pysph.base.utils import get_particle_array
+from pysph.base.particle_array import get_ghost_tag, get_local_tag
 from pysph.base import nnps
 from pysph.base.config import get_config
 
@@ -18,7 +19,7 @@ from pyzoltan.core.carray import UIntArray, IntArray
 
 # Python testing framework
 import unittest
-from pytest import importorskip
+from pytest import importorskip, raises
 
 
 class SimpleNNPSTestCase(unittest.TestCase):
@@ -429,6 +430,20 @@ class LinkedListNNPSTestCase(DictBoxSortNNPSTestCase):
             dim=3, particles=self.particles, radius_scale=2.0
         )
 
+    def test_get_neighbor_lists(self):
+        nps = self.nps
+        nbrs = UIntArray()
+        for src_index, dst_index in [(0, 1), (1, 1)]:
+            indptr, indices = nps.get_neighbor_lists(src_index, dst_index)
+            n_dst = self.particles[dst_index].get_number_of_particles()
+            self.assertEqual(len(indptr), n_dst + 1)
+            self.assertEqual(indptr[-1], len(indices))
+            for i in range(n_dst):
+                nps.brute_force_neighbors(src_index, dst_index, i, nbrs)
+                expect = numpy.sort(nbrs.get_npy_array())
+                result = numpy.sort(indices[indptr[i]:indptr[i + 1]])
+                self.assertListEqual(list(result), list(expect))
+
     def test_cell_index_positivity(self):
         nps = self.nps
         ncells_tot = nps.ncells_tot
@@ -642,6 +657,275 @@ class TestMultipleLevelsStratifiedSFCNNPSWithSorting(
         return pa, nps
 
 
+class TestLinkedListNNPSWithVerletLists(unittest.TestCase):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.LinkedListNNPS(dim=2, particles=particles, cache=cache)
+
+    def _make_particles(self, nx=15):
+        x, y = numpy.mgrid[0:1:nx*1j, 0:1:nx*1j]
+        x = x.ravel() + random.random(x.size)*0.01
+        y = y.ravel() + random.random(y.size)*0.01
+        h = numpy.ones_like(x)*1.2/(nx - 1)
+        return get_particle_array(name='fluid', x=x, y=y, h=h)
+
+    def _get_neighbors(self, nps, pa, radius_scale):
+        # Brute force neighbors within the given radius_scale.
+        result = []
+        for i in range(pa.get_number_of_particles()):
+            r = numpy.sqrt((pa.x - pa.x[i])**2 + (pa.y - pa.y[i])**2)
+            mask = (r < radius_scale*pa.h[i]) | (r < radius_scale*pa.h)
+            result.append(set(numpy.where(mask)[0]))
+        return result
+
+    def _check_verlet_lists(self, nps, pa, radius_scale=2.0):
+        nbrs = UIntArray()
+        expect = self._get_neighbors(nps, pa, radius_scale)
+        nps.set_context(0, 0)
+        for i in range(pa.get_number_of_particles()):
+            nps.get_nearest_particles(0, 0, i, nbrs)
+            self.assertTrue(expect[i] <= set(nbrs.get_npy_array()))
+
+    def test_verlet_lists_are_reused_for_small_displacements(self):
+        # Given
+        pa = self._make_particles()
+        nps = self._make_nnps([pa])
+        nps.set_verlet_skin(0.2)
+        nps.update()
+        n_rebuilds = nps.n_rebuilds
+        # All the neighbors within the enlarged radius are found.
+        self._check_verlet_lists(nps, pa, 2.0*1.2)
+
+        # When the particles move by different amounts, each less than half
+        # the skin in all.
+        half_skin = 0.5*0.2*2.0*pa.h[0]
+        n = pa.get_number_of_particles()
+        for i in range(3):
+            pa.x += random.uniform(-0.2, 0.2, n)*half_skin
+            pa.y += random.uniform(-0.2, 0.2, n)*half_skin
+            nps.update()
+
+        # Then
+        self.assertEqual(nps.n_rebuilds, n_rebuilds)
+        self._check_verlet_lists(nps, pa)
+
+    def test_verlet_lists_are_rebuilt_for_large_displacements(self):
+        # Given
+        pa = self._make_particles()
+        nps = self._make_nnps([pa])
+        nps.set_verlet_skin(0.2)
+        nps.update()
+        n_rebuilds = nps.n_rebuilds
+
+        # When
+        pa.x[0] += 0.6*0.2*2.0*pa.h[0]
+        nps.update()
+
+        # Then
+        self.assertEqual(nps.n_rebuilds, n_rebuilds + 1)
+        self._check_verlet_lists(nps, pa)
+
+        # When the smoothing length grows beyond the skin.  The domain is
+        # updated first as the integrator does, as the cell size changes.
+        pa.h[1] *= 1.25
+        nps.update_domain()
+        nps.update()
+
+        # Then
+        self.assertEqual(nps.n_rebuilds, n_rebuilds + 2)
+        self._check_verlet_lists(nps, pa)
+
+        # When the number of particles changes.
+        pa.add_particles(x=[0.5], y=[0.5], h=[pa.h[0]])
+        nps.update()
+
+        # Then
+        self.assertEqual(nps.n_rebuilds, n_rebuilds + 3)
+        self._check_verlet_lists(nps, pa)
+
+    def test_verlet_lists_require_cache(self):
+        # Given
+        pa = self._make_particles(5)
+        nps = self._make_nnps([pa], cache=False)
+
+        # When/Then
+        self.assertRaises(RuntimeError, nps.set_verlet_skin, 0.1)
+
+
+class TestSpatialHashNNPSWithVerletLists(TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.SpatialHashNNPS(dim=2, particles=particles, cache=cache)
+
+
+class TestExtendedSpatialHashNNPSWithVerletLists(
+        TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.ExtendedSpatialHashNNPS(
+            dim=2, particles=particles, cache=cache
+        )
+
+
+class TestCellIndexingNNPSWithVerletLists(TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.CellIndexingNNPS(dim=2, particles=particles, cache=cache)
+
+
+class TestStratifiedHashNNPSWithVerletLists(
+        TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.StratifiedHashNNPS(dim=2, particles=particles, cache=cache)
+
+
+class TestStratifiedSFCNNPSWithVerletLists(TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.StratifiedSFCNNPS(dim=2, particles=particles, cache=cache)
+
+
+class TestOctreeNNPSWithVerletLists(TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.OctreeNNPS(dim=2, particles=particles, cache=cache)
+
+
+class TestCompressedOctreeNNPSWithVerletLists(
+        TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.CompressedOctreeNNPS(
+            dim=2, particles=particles, cache=cache
+        )
+
+
+class TestZOrderNNPSWithVerletLists(TestLinkedListNNPSWithVerletLists):
+    def _make_nnps(self, particles, cache=True):
+        return nnps.ZOrderNNPS(dim=2, particles=particles, cache=cache)
+
+
+class TestLinkedListNNPSReorderParticles(unittest.TestCase):
+    def _make_nnps(self, particles, cache=False):
+        return nnps.LinkedListNNPS(dim=2, particles=particles, cache=cache)
+
+    def _make_particles(self, nx=15):
+        x, y = numpy.mgrid[0:1:nx*1j, 0:1:nx*1j]
+        x = x.ravel() + random.random(x.size)*0.01
+        y = y.ravel() + random.random(y.size)*0.01
+        order = numpy.random.permutation(x.size)
+        x, y = x[order], y[order]
+        h = numpy.ones_like(x)*1.2/(nx - 1)
+        pa = get_particle_array(name='fluid', x=x, y=y, h=h)
+        pa.gid[:] = numpy.arange(x.size)
+        return pa
+
+    def _get_neighbor_gids(self, nps, pa):
+        nbrs = UIntArray()
+        result = {}
+        nps.set_context(0, 0)
+        for i in range(pa.get_number_of_particles()):
+            nps.get_nearest_particles(0, 0, i, nbrs)
+            result[pa.gid[i]] = set(pa.gid[nbrs.get_npy_array()])
+        return result
+
+    def test_reordering_keeps_particle_data_and_neighbors(self):
+        # Given
+        pa = self._make_particles()
+        nps = self._make_nnps([pa])
+        x, y, gid = pa.x.copy(), pa.y.copy(), pa.gid.copy()
+        expect = self._get_neighbor_gids(nps, pa)
+
+        # When
+        nps.reorder_particles()
+        nps.update()
+
+        # Then
+        self.assertEqual(sorted(pa.gid), list(range(len(gid))))
+        numpy.testing.assert_array_equal(pa.x, x[pa.gid])
+        numpy.testing.assert_array_equal(pa.y, y[pa.gid])
+        self.assertEqual(self._get_neighbor_gids(nps, pa), expect)
+
+    def test_reordering_improves_locality(self):
+        # Given
+        pa = self._make_particles()
+        nps = self._make_nnps([pa])
+        def _mean_jump():
+            return numpy.mean(numpy.hypot(numpy.diff(pa.x), numpy.diff(pa.y)))
+        before = _mean_jump()
+
+        # When
+        nps.reorder_particles()
+
+        # Then
+        self.assertTrue(_mean_jump() < 0.5*before)
+
+    def test_reordering_keeps_real_particles_first(self):
+        # Given
+        pa = self._make_particles(5)
+        pa.tag[::3] = get_ghost_tag()
+        pa.align_particles()
+        n_real = pa.get_number_of_particles(real=True)
+        nps = self._make_nnps([pa])
+
+        # When
+        nps.reorder_particles()
+
+        # Then
+        tag = pa.get_carray('tag').get_npy_array()
+        self.assertEqual(pa.get_number_of_particles(real=True), n_real)
+        self.assertEqual(len(tag), 25)
+        self.assertTrue(numpy.all(tag[:n_real] == get_local_tag()))
+        self.assertTrue(numpy.all(tag[n_real:] == get_ghost_tag()))
+
+    def test_reordering_rebuilds_verlet_lists(self):
+        # Given
+        pa = self._make_particles()
+        nps = self._make_nnps([pa], cache=True)
+        nps.set_verlet_skin(0.2)
+        nps.update()
+        n_rebuilds = nps.n_rebuilds
+        expect = self._get_neighbor_gids(nps, pa)
+
+        # When
+        nps.reorder_particles()
+        nps.update()
+
+        # Then
+        self.assertEqual(nps.n_rebuilds, n_rebuilds + 1)
+        self.assertEqual(self._get_neighbor_gids(nps, pa), expect)
+
+    def test_reordering_without_a_cell_size_uses_the_domain(self):
+        # Given
+        pa = self._make_particles()
+        nps = self._make_nnps([pa])
+        x, y, z = pa.x.copy(), pa.y.copy(), pa.z.copy()
+        nps.cell_size = 0.0
+
+        # When
+        nps.reorder_particles()
+
+        # Then
+        cell_size = nps.domain.manager.cell_size
+        self.assertTrue(cell_size > 0.0)
+        expect = nnps.get_morton_order(x, y, z, cell_size)
+        numpy.testing.assert_array_equal(pa.gid, expect)
+
+
+class TestZOrderNNPSReorderParticles(TestLinkedListNNPSReorderParticles):
+    def _make_nnps(self, particles, cache=False):
+        return nnps.ZOrderNNPS(dim=2, particles=particles, cache=cache)
+
+
+def test_morton_order_of_points_on_a_grid():
+    x = numpy.array([0.0, 1.0, 0.0, 1.0])
+    y = numpy.array([0.0, 0.0, 1.0, 1.0])
+    z = numpy.zeros_like(x)
+    order = nnps.get_morton_order(x[::-1], y[::-1], z, 1.0)
+    numpy.testing.assert_array_equal(order, [3, 2, 1, 0])
+
+
+
+def test_morton_order_should_raise_error_for_invalid_cell_size():
+    x = numpy.array([0.0, 1.0])
+    for cell_size in (0.0, -1.0, numpy.nan, numpy.inf):
+        with raises(ValueError):
+            nnps.get_morton_order(x, x, x, cell_size)
+
+
 def test_large_number_of_neighbors_linked_list():
     x = numpy.random.random(1 << 14)*0.1
     y = x.copy()
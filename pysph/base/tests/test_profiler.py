@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from pysph.base.config import get_config, set_config
+from pysph.base.profiler import (
+    add_profile_info, get_profile_info, get_profile_table, profile_ctx,
+    reset_profile_info, write_profile
+)
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        reset_profile_info()
+
+    def tearDown(self):
+        reset_profile_info()
+        set_config(None)
+
+    def test_add_profile_info_accumulates(self):
+        # When
+        add_profile_info('a', 1.0)
+        add_profile_info('a', 2.0)
+        add_profile_info('b', 0.5)
+
+        # Then
+        info = get_profile_info()
+        self.assertEqual(info['a'], {'time': 3.0, 'calls': 2})
+        self.assertEqual(info['b'], {'time': 0.5, 'calls': 1})
+
+    def test_profile_ctx_does_nothing_when_not_profiling(self):
+        # Given
+        get_config().profile = False
+
+        # When
+        with profile_ctx('a'):
+            pass
+
+        # Then
+        self.assertEqual(get_profile_info(), {})
+
+    def test_profile_ctx_records_time_when_profiling(self):
+        # Given
+        get_config().profile = True
+
+        # When
+        for i in range(3):
+            with profile_ctx('a'):
+                pass
+
+        # Then
+        info = get_profile_info()
+        self.assertEqual(info['a']['calls'], 3)
+        self.assertTrue(info['a']['time'] >= 0.0)
+
+    def test_table_is_sorted_by_time(self):
+        # Given
+        add_profile_info('fast', 1.0)
+        add_profile_info('slow', 10.0)
+
+        # When
+        lines = get_profile_table().splitlines()
+
+        # Then
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('slow'))
+        self.assertTrue(lines[2].startswith('fast'))
+
+    def test_write_profile(self):
+        # Given
+        add_profile_info('a', 1.0)
+        root = tempfile.mkdtemp()
+        fname = os.path.join(root, 'test_profile')
+
+        # When
+        try:
+            write_profile(fname)
+            with open(fname + '.json') as f:
+                data = json.load(f)
+            with open(fname + '.txt') as f:
+                txt = f.read()
+        finally:
+            shutil.rmtree(root)
+
+        # Then
+        self.assertEqual(data, {'a': {'time': 1.0, 'calls': 1}})
+        self.assertIn('a', txt)
+
+
+if __name__ == '__main__':
+    unittest.main()
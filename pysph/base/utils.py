@@ -398,6 +398,45 @@ def get_particle_array_gasd(constants=None, **props):
     return pa
 
 
+def set_single_precision(particles, props=None, exclude=('x', 'y', 'z', 'h')):
+    """Store the double precision properties of the given particle arrays in
+    single precision (as FloatArrays) to halve the memory used.
+
+    The generated code reads and writes these properties as floats while the
+    arithmetic is done in double precision.  The positions and smoothing
+    lengths are excluded by default as the NNPS requires them in double
+    precision.
+
+    Parameters
+    ----------
+
+    particles: list
+        The particle arrays.
+    props: sequence
+        The names of the properties to convert, defaults to all the double
+        precision properties.  The same properties are converted in all the
+        arrays so that the types are consistent.
+    exclude: sequence
+        The names of the properties that are not converted.
+    """
+    for pa in particles:
+        if props is None:
+            names = [name for name, arr in pa.properties.items()
+                     if arr.get_c_type() == 'double']
+        else:
+            names = [name for name in props if name in pa.properties]
+        output_arrays = list(pa.output_property_arrays)
+        for name in names:
+            carray = pa.properties[name]
+            if name in exclude or carray.get_c_type() != 'double':
+                continue
+            data = carray.get_npy_array().astype(numpy.float32)
+            default = pa.default_values[name]
+            pa.remove_property(name)
+            pa.add_property(name, type='float', default=default, data=data)
+        pa.set_output_arrays(output_arrays)
+
+
 def get_particles_info(particles):
     """Return the array information for a list of particles.
 
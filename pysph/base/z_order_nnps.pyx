@@ -31,7 +31,6 @@ cdef class ZOrderNNPS(NNPS):
             cache, sort_gids
         )
 
-        self.radius_scale2 = radius_scale*radius_scale
         cdef NNPSParticleArrayWrapper pa_wrapper
         cdef int i, num_particles
 
@@ -0,0 +1,238 @@
+"""Benchmark the throughput of some representative examples.
+
+Each example is run for a fixed number of steps with the output disabled,
+serially and with OpenMP for different numbers of threads.  Every run is made
+in a fresh Python process so the memory high-water mark and the thread count
+are specific to that run.  The compile time is only reported when the
+generated code was actually compiled, not when it was loaded from the cache.
+Only the throughput is compared with the baseline.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from pysph.benchmarks.utils import (
+    compare_results, get_max_rss, load_results, print_table, save_results
+)
+
+EXAMPLES = [
+    'dam_break_2d', 'dam_break_3d', 'taylor_green', 'elliptical_drop',
+    'gas_dynamics.sod_shocktube', 'rigid_body.ten_spheres_in_vessel_2d'
+]
+
+# The entries identifying a benchmark when comparing with a baseline.
+KEYS = ('example', 'threads', 'steps')
+
+COLUMNS = [
+    ('example', 'Example', '%s'), ('threads', 'Threads', '%d'),
+    ('n_particles', 'N', '%d'), ('steps', 'Steps', '%d'),
+    ('compile_time', 'Compile (s)', '%.3g'),
+    ('setup_time', 'Setup (s)', '%.3g'), ('run_time', 'Run (s)', '%.3g'),
+    ('steps_per_sec', 'Steps/s', '%.4g'),
+    ('particle_updates_per_sec', 'Updates/s', '%.4g'),
+    ('peak_memory', 'Peak mem (MiB)', '%.1f')
+]
+
+_RESULT_MARKER = 'PYSPH_BENCH_RESULT:'
+
+
+def get_default_threads():
+    """Return powers of two up to the number of CPUs and the number of CPUs.
+    """
+    n_cpu = multiprocessing.cpu_count()
+    threads = []
+    n = 1
+    while n < n_cpu:
+        threads.append(n)
+        n *= 2
+    threads.append(n_cpu)
+    return threads
+
+
+def _get_app_class(module):
+    from pysph.solver.application import Application
+    mod = __import__(module, fromlist=['Application'])
+    classes = [
+        obj for obj in vars(mod).values()
+        if isinstance(obj, type) and issubclass(obj, Application) and
+        obj.__module__ == module
+    ]
+    if len(classes) != 1:
+        raise RuntimeError(
+            'Could not find a unique Application in %s' % module
+        )
+    return classes[0]
+
+
+def bench_example(example, steps, threads, output_dir):
+    """Run the example in the current process and return the results.
+
+    ``threads`` is the number of OpenMP threads, 0 runs the example
+    serially.
+    """
+    from pysph.examples.run import guess_correct_module
+    module = guess_correct_module(example)
+    cls = _get_app_class(module)
+    args = ['--max-steps', str(steps), '--disable-output', '-q',
+            '-d', output_dir]
+    if threads > 0:
+        # The number of threads is set with OMP_NUM_THREADS by run_example.
+        args.append('--openmp')
+
+    app = cls()
+    app.run(args)
+
+    n_particles = sum(pa.get_number_of_particles() for pa in app.particles)
+    steps_done = app.solver.count
+    run_time = app.run_duration
+    return dict(
+        example=example, threads=threads, steps=steps,
+        n_particles=n_particles,
+        compile_time=_get_compile_time(app.solver.sph_compiler),
+        setup_time=app.setup_duration, run_time=run_time,
+        steps_per_sec=steps_done/run_time,
+        particle_updates_per_sec=n_particles*steps_done/run_time,
+        peak_memory=get_max_rss()
+    )
+
+
+def _get_compile_time(sph_compiler):
+    """Return the time taken to translate and compile the generated
+    modules or None if they were all loaded from the cache in ~/.pysph.
+    """
+    times = [t for name, t in sph_compiler.timings.items()
+             if name.endswith('.cythonize') or name.endswith('.compile')]
+    return sum(times) if times else None
+
+
+def run_example(example, steps, threads):
+    """Run the benchmark for the example in a new process and return the
+    results.
+    """
+    output_dir = tempfile.mkdtemp()
+    env = dict(os.environ)
+    if threads > 0:
+        env['OMP_NUM_THREADS'] = str(threads)
+    cmd = [
+        sys.executable, '-m', 'pysph.benchmarks.example_bench', '--worker',
+        json.dumps(dict(example=example, steps=steps, threads=threads,
+                        output_dir=output_dir))
+    ]
+    try:
+        output = subprocess.check_output(cmd, env=env)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    for line in reversed(output.decode('utf-8').splitlines()):
+        if line.startswith(_RESULT_MARKER):
+            return json.loads(line[len(_RESULT_MARKER):])
+    raise RuntimeError('No results for example %s' % example)
+
+
+def _describe_threads(threads):
+    return 'serial' if threads == 0 else '%d threads' % threads
+
+
+def run_benchmarks(examples, steps, threads, serial=True, verbose=True):
+    """Run the benchmarks for all the examples, serially if ``serial`` is
+    True and for each number of OpenMP threads given, and return a list of
+    results.
+    """
+    thread_counts = ([0] if serial else []) + list(threads)
+    results = []
+    for example in examples:
+        for n in thread_counts:
+            if verbose:
+                print('%s: %s' % (example, _describe_threads(n)))
+            results.append(run_example(example, steps, n))
+    return results
+
+
+def _get_parser():
+    parser = argparse.ArgumentParser(prog='pysph bench examples',
+                                     description=__doc__)
+    parser.add_argument(
+        '--examples', nargs='+', default=EXAMPLES,
+        help='Examples to benchmark.'
+    )
+    parser.add_argument(
+        '--steps', type=int, default=50,
+        help='Number of time steps to run each example.'
+    )
+    parser.add_argument(
+        '--threads', nargs='+', type=int, default=None,
+        help='Number of OpenMP threads to use, defaults to powers of two '
+        'up to the number of CPUs.  Use 0 to not run with OpenMP.'
+    )
+    parser.add_argument(
+        '--no-serial', action='store_false', dest='serial', default=True,
+        help='Do not run the examples serially.'
+    )
+    parser.add_argument(
+        '-o', '--output', default=None,
+        help='Save the results to this JSON file.'
+    )
+    parser.add_argument(
+        '--baseline', default=None,
+        help='Compare the results with those in this JSON file.'
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.1,
+        help='Allowed fractional slowdown with respect to the baseline.'
+    )
+    parser.add_argument('--worker', default=None, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    parser = _get_parser()
+    options = parser.parse_args(argv)
+    if options.worker is not None:
+        kw = json.loads(options.worker)
+        result = bench_example(**kw)
+        print(_RESULT_MARKER + json.dumps(result))
+        return
+
+    if options.threads is None:
+        threads = get_default_threads()
+    else:
+        threads = [n for n in options.threads if n > 0]
+    results = run_benchmarks(
+        options.examples, options.steps, threads, options.serial
+    )
+    print()
+    print_table(results, COLUMNS)
+    if options.output is not None:
+        save_results(results, options.output)
+        print('Results saved to %s' % options.output)
+
+    if options.baseline is not None:
+        baseline = load_results(options.baseline)
+        regressions = compare_results(
+            results, baseline, KEYS, 'particle_updates_per_sec',
+            options.tolerance
+        )
+        if len(regressions) == 0:
+            print('No regressions with respect to %s' % options.baseline)
+        else:
+            print('Regressions with respect to %s:' % options.baseline)
+            for r, ref, ratio in regressions:
+                print('  %s, %s: %.4g updates/s '
+                      '(baseline %.4g, %.0f%% slower)' % (
+                          r['example'], _describe_threads(r['threads']),
+                          r['particle_updates_per_sec'], ref,
+                          (1 - ratio)*100
+                      ))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
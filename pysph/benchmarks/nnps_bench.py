@@ -0,0 +1,210 @@
+"""Benchmark the CPU NNPS implementations.
+
+The time taken to update (bin) the particles and to find the neighbors of all
+the particles is measured for each NNPS on uniform, clustered and variable-h
+particle distributions in 1, 2 and 3 dimensions.
+"""
+
+from __future__ import print_function
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from pysph.base import nnps
+from pysph.base.utils import get_particle_array
+from pysph.benchmarks.utils import (
+    call_in_subprocess, compare_results, get_max_rss, load_results,
+    print_table, save_results
+)
+
+NNPS_CLASSES = [
+    'BoxSortNNPS', 'LinkedListNNPS', 'SpatialHashNNPS',
+    'ExtendedSpatialHashNNPS', 'CellIndexingNNPS', 'ZOrderNNPS',
+    'StratifiedHashNNPS', 'StratifiedSFCNNPS', 'OctreeNNPS',
+    'CompressedOctreeNNPS'
+]
+
+DISTRIBUTIONS = ['uniform', 'clustered', 'variable_h']
+
+# The entries identifying a benchmark when comparing with a baseline.
+KEYS = ('nnps', 'distribution', 'dim', 'n')
+
+COLUMNS = [
+    ('nnps', 'NNPS', '%s'), ('distribution', 'Distribution', '%s'),
+    ('dim', 'Dim', '%d'), ('n', 'N', '%d'),
+    ('update_time', 'Update (s)', '%.4g'),
+    ('query_time', 'Query (s)', '%.4g'),
+    ('particles_per_sec', 'Particles/s', '%.4g'),
+    ('peak_memory', 'Peak mem (MiB)', '%.1f')
+]
+
+
+def make_particles(n, dim, distribution, seed=1234):
+    """Create a particle array with about ``n`` particles in the unit
+    box of the given dimension.
+
+    ``uniform`` distributes the particles randomly with a constant ``h``,
+    ``clustered`` places them in a few tight Gaussian clusters with a constant
+    ``h`` and ``variable_h`` uses a uniform distribution with ``h`` varying by
+    a factor of four.
+    """
+    rng = np.random.RandomState(seed)
+    dx = (1.0/n)**(1.0/dim)
+    h0 = 1.2*dx
+    if distribution == 'uniform':
+        pos = rng.random_sample((n, dim))
+        h = np.ones(n)*h0
+    elif distribution == 'clustered':
+        n_clusters = 4
+        centers = rng.random_sample((n_clusters, dim))*0.6 + 0.2
+        idx = rng.randint(0, n_clusters, n)
+        pos = centers[idx] + rng.normal(scale=0.1, size=(n, dim))
+        h = np.ones(n)*h0
+    elif distribution == 'variable_h':
+        pos = rng.random_sample((n, dim))
+        h = h0*(0.5 + 1.5*rng.random_sample(n))
+    else:
+        raise ValueError('Unknown distribution: %s' % distribution)
+
+    coords = dict(zip('xyz', pos.T))
+    return get_particle_array(name='fluid', h=h, **coords)
+
+
+def bench_nnps(nnps_name, n, dim, distribution, repeat=3):
+    """Benchmark a single NNPS and return a dictionary with the results.
+
+    The ``update_time`` is the best time taken by ``update`` and the
+    ``query_time`` the best time for finding the neighbors of all the
+    particles right after an update, each phase is timed separately.  The
+    ``peak_memory`` is the increase in the memory high-water mark after the
+    particles are created.
+    """
+    pa = make_particles(n, dim, distribution)
+    mem0 = get_max_rss()
+    cls = getattr(nnps, nnps_name)
+    nps = cls(dim=dim, particles=[pa], radius_scale=2.0, cache=True)
+
+    update_times = []
+    query_times = []
+    for i in range(repeat):
+        start = time.time()
+        nps.update()
+        update_times.append(time.time() - start)
+        start = time.time()
+        nps.set_context(0, 0)
+        nps.current_cache.find_all_neighbors()
+        query_times.append(time.time() - start)
+    update_time = min(update_times)
+    query_time = min(query_times)
+    peak_memory = None if mem0 is None else get_max_rss() - mem0
+
+    return dict(
+        nnps=nnps_name, distribution=distribution, dim=dim, n=n,
+        update_time=update_time, query_time=query_time,
+        particles_per_sec=n/(update_time + query_time),
+        peak_memory=peak_memory
+    )
+
+
+def run_benchmarks(nnps_names, dims, distributions, sizes, repeat=3,
+                   isolate=True, verbose=True):
+    """Run the benchmarks for all the combinations of the arguments and
+    return a list of results.  If ``isolate`` is True, each benchmark is run
+    in a separate process.
+    """
+    results = []
+    for dim in dims:
+        for distribution in distributions:
+            for n in sizes:
+                for name in nnps_names:
+                    if verbose:
+                        print('%s: %s, dim=%d, n=%d' % (
+                            name, distribution, dim, n
+                        ))
+                    args = (name, n, dim, distribution, repeat)
+                    if isolate:
+                        result = call_in_subprocess(bench_nnps, *args)
+                    else:
+                        result = bench_nnps(*args)
+                    results.append(result)
+    return results
+
+
+def _get_parser():
+    parser = argparse.ArgumentParser(prog='pysph bench nnps',
+                                     description=__doc__)
+    parser.add_argument(
+        '--nnps', nargs='+', default=NNPS_CLASSES, choices=NNPS_CLASSES,
+        help='NNPS classes to benchmark.'
+    )
+    parser.add_argument(
+        '--dim', nargs='+', type=int, default=[1, 2, 3], choices=[1, 2, 3],
+        help='Dimensions to benchmark.'
+    )
+    parser.add_argument(
+        '--distribution', nargs='+', default=DISTRIBUTIONS,
+        choices=DISTRIBUTIONS, help='Particle distributions to use.'
+    )
+    parser.add_argument(
+        '-n', '--sizes', nargs='+', type=int, default=[10000, 100000],
+        help='Number of particles to use.'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='Repeat each measurement and use the best time.'
+    )
+    parser.add_argument(
+        '--no-isolate', action='store_false', dest='isolate', default=True,
+        help='Do not run each benchmark in a separate process.'
+    )
+    parser.add_argument(
+        '-o', '--output', default=None,
+        help='Save the results to this JSON file.'
+    )
+    parser.add_argument(
+        '--baseline', default=None,
+        help='Compare the results with those in this JSON file.'
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.1,
+        help='Allowed fractional slowdown with respect to the baseline.'
+    )
+    return parser
+
+
+def main(argv=None):
+    parser = _get_parser()
+    options = parser.parse_args(argv)
+    results = run_benchmarks(
+        options.nnps, options.dim, options.distribution, options.sizes,
+        options.repeat, options.isolate
+    )
+    print()
+    print_table(results, COLUMNS)
+    if options.output is not None:
+        save_results(results, options.output)
+        print('Results saved to %s' % options.output)
+
+    if options.baseline is not None:
+        baseline = load_results(options.baseline)
+        regressions = compare_results(
+            results, baseline, KEYS, 'particles_per_sec', options.tolerance
+        )
+        if len(regressions) == 0:
+            print('No regressions with respect to %s' % options.baseline)
+        else:
+            print('Regressions with respect to %s:' % options.baseline)
+            for r, ref, ratio in regressions:
+                print('  %s, %s, dim=%d, n=%d: %.4g particles/s '
+                      '(baseline %.4g, %.0f%% slower)' % (
+                          r['nnps'], r['distribution'], r['dim'], r['n'],
+                          r['particles_per_sec'], ref, (1 - ratio)*100
+                      ))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Run the PySPH benchmarks.
+
+Usage: pysph bench <benchmark> [options]
+
+Use ``pysph bench <benchmark> -h`` for the options of each benchmark.
+"""
+
+from __future__ import print_function
+
+import sys
+
+BENCHMARKS = {
+    'nnps': ('pysph.benchmarks.nnps_bench',
+             'Update and neighbor query of the CPU NNPS.'),
+    'examples': ('pysph.benchmarks.example_bench',
+                 'Throughput of representative examples.'),
+}
+
+
+def _print_help():
+    print(__doc__)
+    print('Available benchmarks:\n')
+    for name in sorted(BENCHMARKS):
+        print('  %-10s %s' % (name, BENCHMARKS[name][1]))
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) == 0 or argv[0] in ['-h', '--help']:
+        _print_help()
+        return
+    name = argv[0]
+    if name not in BENCHMARKS:
+        print('Unknown benchmark: %s\n' % name)
+        _print_help()
+        sys.exit(1)
+    module = __import__(BENCHMARKS[name][0], fromlist=['main'])
+    module.main(argv[1:])
+
+
+if __name__ == '__main__':
+    main()
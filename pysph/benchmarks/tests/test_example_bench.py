@@ -0,0 +1,76 @@
+import shutil
+import tempfile
+import unittest
+
+from pysph.benchmarks.example_bench import (
+    EXAMPLES, KEYS, _get_app_class, _get_compile_time, bench_example,
+    get_default_threads
+)
+from pysph.examples.run import guess_correct_module
+from pysph.solver.application import Application
+
+
+class TestExampleBench(unittest.TestCase):
+    def test_default_threads(self):
+        # When
+        threads = get_default_threads()
+
+        # Then
+        self.assertEqual(threads[0], 1)
+        self.assertEqual(threads, sorted(set(threads)))
+
+    def test_all_examples_have_an_application(self):
+        for example in EXAMPLES:
+            # When
+            cls = _get_app_class(guess_correct_module(example))
+
+            # Then
+            self.assertTrue(issubclass(cls, Application))
+
+    def test_bench_example(self):
+        # Given
+        output_dir = tempfile.mkdtemp()
+
+        # When
+        try:
+            result = bench_example('elliptical_drop', 2, 0, output_dir)
+        finally:
+            shutil.rmtree(output_dir)
+
+        # Then
+        for key in KEYS:
+            self.assertIn(key, result)
+        self.assertEqual(result['threads'], 0)
+        self.assertTrue(result['n_particles'] > 0)
+        # The code is usually in the cache, the time is None then.
+        self.assertTrue(result['compile_time'] is None or
+                        result['compile_time'] > 0.0)
+        self.assertTrue(result['run_time'] > 0.0)
+        self.assertTrue(result['steps_per_sec'] > 0.0)
+        self.assertAlmostEqual(
+            result['particle_updates_per_sec'],
+            result['steps_per_sec']*result['n_particles']
+        )
+
+    def test_compile_time_is_only_reported_when_compiled(self):
+        # Given
+        class Compiler(object):
+            timings = {'generate': 0.1, 'build': 2.0}
+
+        compiler = Compiler()
+
+        # When/Then
+        self.assertEqual(_get_compile_time(compiler), None)
+
+        # When
+        compiler.timings = dict(
+            generate=0.1, build=2.0, **{'integrator.cythonize': 0.5,
+                                        'integrator.compile': 1.0}
+        )
+
+        # Then
+        self.assertAlmostEqual(_get_compile_time(compiler), 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
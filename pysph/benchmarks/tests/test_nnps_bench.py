@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from pysph.benchmarks.nnps_bench import (
+    DISTRIBUTIONS, KEYS, bench_nnps, make_particles, run_benchmarks
+)
+from pysph.benchmarks.utils import compare_results
+
+
+class TestNNPSBench(unittest.TestCase):
+    def test_make_particles(self):
+        for dim in (1, 2, 3):
+            for distribution in DISTRIBUTIONS:
+                # When
+                pa = make_particles(100, dim, distribution)
+
+                # Then
+                self.assertEqual(pa.get_number_of_particles(), 100)
+                self.assertTrue(np.all(pa.h > 0))
+                if dim < 3:
+                    self.assertTrue(np.all(pa.z == 0.0))
+
+        self.assertRaises(ValueError, make_particles, 100, 2, 'junk')
+
+    def test_bench_nnps(self):
+        # When
+        result = bench_nnps('LinkedListNNPS', 200, 2, 'variable_h', repeat=1)
+
+        # Then
+        for key in KEYS:
+            self.assertIn(key, result)
+        self.assertEqual(result['n'], 200)
+        self.assertTrue(result['update_time'] >= 0.0)
+        self.assertTrue(result['query_time'] >= 0.0)
+        self.assertTrue(result['particles_per_sec'] > 0.0)
+
+    def test_run_benchmarks(self):
+        # When
+        results = run_benchmarks(
+            ['LinkedListNNPS', 'ZOrderNNPS'], [1, 3], ['uniform'], [100],
+            repeat=1, isolate=False, verbose=False
+        )
+
+        # Then
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            set((r['nnps'], r['dim']) for r in results),
+            set([('LinkedListNNPS', 1), ('LinkedListNNPS', 3),
+                 ('ZOrderNNPS', 1), ('ZOrderNNPS', 3)])
+        )
+
+    def test_compare_results_flags_regressions(self):
+        # Given
+        base = dict(nnps='LinkedListNNPS', distribution='uniform', dim=2,
+                    n=100)
+        baseline = [dict(base, particles_per_sec=100.0),
+                    dict(base, dim=3, particles_per_sec=100.0)]
+        results = [dict(base, particles_per_sec=80.0),
+                   dict(base, dim=3, particles_per_sec=95.0),
+                   dict(base, dim=1, particles_per_sec=1.0)]
+
+        # When
+        regressions = compare_results(
+            results, baseline, KEYS, 'particles_per_sec', tolerance=0.1
+        )
+
+        # Then
+        self.assertEqual(len(regressions), 1)
+        r, ref, ratio = regressions[0]
+        self.assertEqual(r['dim'], 2)
+        self.assertEqual(ref, 100.0)
+        self.assertAlmostEqual(ratio, 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Utilities common to the different benchmarks.
+"""
+
+from __future__ import print_function
+
+import json
+import platform
+import sys
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows.
+    resource = None
+
+
+def get_max_rss():
+    """Return the high-water mark of the resident memory of the process in
+    MiB or ``None`` if this is not available on the platform.
+
+    The value for a forked process starts at the memory used by its parent
+    at the time of the fork, so the memory used after the fork is the
+    difference with the value at the start.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # Reported in bytes on OS X and in KiB elsewhere.
+        return rss/(1024.0*1024.0)
+    else:
+        return rss/1024.0
+
+
+def call_in_subprocess(func, *args):
+    """Call the function in a new process and return its result.
+
+    This isolates the memory used by each benchmark so the high-water mark of
+    one does not affect the next.  The function and the arguments must be
+    picklable.
+    """
+    import multiprocessing
+    pool = multiprocessing.Pool(1)
+    try:
+        return pool.apply(func, args)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def get_system_info():
+    import numpy
+    import pysph
+    return dict(
+        python=platform.python_version(), platform=platform.platform(),
+        machine=platform.machine(), numpy=numpy.__version__,
+        pysph=pysph.__version__
+    )
+
+
+def save_results(results, fname):
+    """Save the list of results along with some information on the system to
+    the given JSON file.
+    """
+    data = dict(system=get_system_info(), results=results)
+    with open(fname, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_results(fname):
+    with open(fname) as f:
+        data = json.load(f)
+    return data['results']
+
+
+def compare_results(results, baseline, keys, metric, tolerance=0.1):
+    """Compare the given results with a baseline and return the regressions.
+
+    Parameters
+    ----------
+
+    results: list: dictionaries with the current results.
+    baseline: list: dictionaries with the results of the baseline.
+    keys: sequence: names of the entries that identify a benchmark.
+    metric: str: name of the entry to compare, larger is assumed better.
+    tolerance: float: allowed fractional slowdown before flagging a
+        regression.
+
+    Returns
+    -------
+
+    A list of (result, baseline_value, ratio) tuples for each benchmark
+    whose metric is smaller than ``(1 - tolerance)`` times the baseline.
+    Benchmarks missing in the baseline are ignored.
+    """
+    def _key(r):
+        return tuple(r.get(k) for k in keys)
+
+    base = dict((_key(r), r[metric]) for r in baseline)
+    regressions = []
+    for r in results:
+        ref = base.get(_key(r))
+        if not ref:
+            continue
+        ratio = r[metric]/ref
+        if ratio < 1.0 - tolerance:
+            regressions.append((r, ref, ratio))
+    return regressions
+
+
+def print_table(results, columns):
+    """Print the results as a table with the given (key, header, fmt)
+    columns.
+    """
+    if len(results) == 0:
+        return
+    widths = [max(len(hdr), max(len(fmt % r[key]) if r[key] is not None
+                                else 4 for r in results))
+              for key, hdr, fmt in columns]
+    print('  '.join(hdr.rjust(w) for (k, hdr, f), w in zip(columns, widths)))
+    for r in results:
+        row = []
+        for (key, hdr, fmt), w in zip(columns, widths):
+            value = fmt % r[key] if r[key] is not None else 'n/a'
+            row.append(value.rjust(w))
+        print('  '.join(row))
@@ -0,0 +1,52 @@
+"""Test if the parallel HDF5 output is written and loaded correctly.
+"""
+
+import mpi4py.MPI as mpi
+import numpy as np
+from os.path import join
+import shutil
+from tempfile import mkdtemp
+
+from pysph.base.particle_array import ParticleArray
+from pysph.solver.utils import dump, load
+
+comm = mpi.COMM_WORLD
+rank = comm.Get_rank()
+size = comm.Get_size()
+
+root = mkdtemp() if rank == 0 else None
+root = comm.bcast(root, root=0)
+filename = join(root, 'test.hdf5')
+
+# Each processor has a different number of particles.
+n = rank + 1
+x = np.ones(n, dtype=float)*rank
+pa = ParticleArray(name='fluid', constants={'c1': 0.0, 'c2': [0.0, 0.0]},
+                   x=x, u=x*2.0)
+
+try:
+    dump(filename, [pa], {'t': 1.0}, mpi_comm=comm, parallel_io=True)
+    comm.Barrier()
+
+    expect = np.concatenate([np.ones(i + 1)*i for i in range(size)])
+    if rank == 0:
+        data = load(filename)
+        pa1 = data["arrays"]["fluid"]
+        assert sorted(pa.properties.keys()) == sorted(pa1.properties.keys())
+        assert sorted(pa.constants.keys()) == sorted(pa1.constants.keys())
+        assert data["solver_data"]["t"] == 1.0
+        assert np.allclose(pa1.x, expect, atol=1e-14), \
+            "Expected %s, got %s" % (expect, pa1.x)
+        assert np.allclose(pa1.u, expect*2.0, atol=1e-14)
+
+    # Each processor loads an equal part of the particles.
+    data = load(filename, mpi_comm=comm)
+    pa1 = data["arrays"]["fluid"]
+    total = len(expect)
+    start, end = total*rank//size, total*(rank + 1)//size
+    assert np.allclose(pa1.x, expect[start:end], atol=1e-14), \
+        "Expected %s, got %s" % (expect[start:end], pa1.x)
+    comm.Barrier()
+finally:
+    if rank == 0:
+        shutil.rmtree(root)
@@ -82,6 +82,15 @@ class DumpLoadTestCase(unittest.TestCase):
             filename='check_dump_load.py', nprocs=4, path=path
         )
 
+    @mark.parallel
+    def test_parallel_hdf5_output(self):
+        from pysph import has_parallel_h5py
+        if not has_parallel_h5py():
+            raise unittest.SkipTest('h5py with MPI support is not available')
+        run_parallel_script.run(
+            filename='check_parallel_hdf5_output.py', nprocs=4, path=path
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,9 @@ from pysph.base.nnps import LinkedListNNPS, BoxSortNNPS, SpatialHashNNPS, \
         StratifiedSFCNNPS, OctreeNNPS, CompressedOctreeNNPS, ZOrderNNPS
 
 from pysph.base import kernels
+from pysph.base.profiler import get_profile_table, write_profile
+from pysph.solver.checkpoint import (is_checkpoint, load_checkpoint,
+                                     load_latest_checkpoint)
 from pysph.solver.controller import CommandManager
 from pysph.solver.utils import mkdir, load, get_files
 
@@ -121,6 +124,9 @@ class Application(object):
     10. :py:meth:`create_tools()`: Add any ``pysph.solver.tools.Tool``
         instances.
 
+    11. :py:meth:`create_reductions()`: Add any in-situ reductions using a
+        ``pysph.solver.reductions.Reductions`` instance.
+
     Additionally, as the appliction runs there are several convenient optional
     callbacks setup:
 
@@ -182,6 +188,10 @@ class Application(object):
         self.particles = []
         self.inlet_outlet = []
 
+        # Wall clock time (in secs) taken to setup and run the simulation.
+        self.setup_duration = 0.0
+        self.run_duration = 0.0
+
         self.initialize()
         self.scheme = self.create_scheme()
         self._setup_argparse()
@@ -321,6 +331,24 @@ class Application(object):
             default=False,
             help="Do not dump any output files.")
 
+        # --async-output
+        parser.add_argument(
+            "--async-output",
+            action="store_true",
+            dest="async_output",
+            default=False,
+            help="Write the output files in the background while the "
+            "simulation proceeds.")
+
+        # --series-output
+        parser.add_argument(
+            "--series-output",
+            action="store_true",
+            dest="series_output",
+            default=False,
+            help="Append the output to a few large files with an index "
+            "instead of writing a file for each output.")
+
         # -o/ --fname
         parser.add_argument(
             "-o",
@@ -356,6 +384,21 @@ class Application(object):
             default=False,
             help="Compress generated output files.")
 
+        # --output-precision
+        parser.add_argument(
+            "--output-precision",
+            action="store",
+            dest="output_precision",
+            nargs="+",
+            default=None,
+            metavar="PROP=PRECISION",
+            help="Reduce the precision of the given properties in the output "
+            "files.  The precision may be float32 or float16 to cast the "
+            "data, abs:<tol> or rel:<tol> to quantize it to an absolute or "
+            "relative tolerance, for example: x=abs:1e-6 p=rel:1e-4 "
+            "rho=float32.  This cannot be used with the parallel output "
+            "mode.")
+
         # --output-remote
         parser.add_argument(
             "--output-dump-remote",
@@ -401,7 +444,62 @@ class Application(object):
             action="store_true",
             dest="profile",
             default=False,
-            help="Enable profiling with OpenCL.")
+            help="Enable profiling, the timings of the different phases "
+            "of the run are written to the output directory.")
+
+        # --specialize
+        parser.add_argument(
+            "--specialize",
+            action="store_true",
+            dest="specialize",
+            default=False,
+            help="Generate code specialized to the values of the "
+            "parameters of the equations, kernel and integrator, this "
+            "recompiles the code when any of these change.")
+
+        # --opt-level
+        parser.add_argument(
+            "--opt-level",
+            action="store",
+            dest="opt_level",
+            default=None,
+            help="Optimization level used to compile the generated code "
+            "(e.g. 2, 3 or fast), defaults to that of the Python build.")
+
+        # --march
+        parser.add_argument(
+            "--march",
+            action="store",
+            dest="march",
+            default=None,
+            help="Architecture to compile the generated code for, use "
+            "'native' to use all the instructions of this machine.")
+
+        # --fast-math
+        parser.add_argument(
+            "--fast-math",
+            action="store_true",
+            dest="fast_math",
+            default=False,
+            help="Compile the generated code with unsafe floating point "
+            "optimizations.")
+
+        # --unroll-loops
+        parser.add_argument(
+            "--unroll-loops",
+            action="store_true",
+            dest="unroll_loops",
+            default=False,
+            help="Unroll the loops of the generated code.")
+
+        # --vectorization-report
+        parser.add_argument(
+            "--vectorization-report",
+            action="store_true",
+            dest="vectorization_report",
+            default=False,
+            help="Save the report of the loops vectorized by the compiler "
+            "next to the generated code.")
 
         # --use-double
         parser.add_argument(
@@ -411,6 +509,16 @@ class Application(object):
             default=False,
             help="Use double precision for OpenCL code.")
 
+        # --single-precision
+        parser.add_argument(
+            "--single-precision",
+            action="store_true",
+            dest="single_precision",
+            default=False,
+            help="Store the floating point particle properties (except the "
+            "positions and smoothing lengths) in single precision on the "
+            "CPU to reduce the memory used.")
+
         # --kernel
         all_kernels = list_all_kernels()
         parser.add_argument(
@@ -430,7 +538,10 @@ class Application(object):
             action="store",
             dest="restart_file",
             default=None,
-            help=("""Restart a PySPH simulation using a specified file """))
+            help=("""Restart a PySPH simulation using a specified file.  """
+                  """This may be an output file, a checkpoint or a """
+                  """directory of checkpoints in which case the latest """
+                  """valid checkpoint is used."""))
 
         restart.add_argument(
             "--rescale-dt",
@@ -440,6 +551,23 @@ class Application(object):
             type=float,
             help=("Scale dt upon restarting by a numerical constant"))
 
+        restart.add_argument(
+            "--checkpoint-freq",
+            action="store",
+            dest="checkpoint_freq",
+            default=0,
+            type=int,
+            help=("Write a checkpoint to restart from every these many "
+                  "iterations, 0 disables checkpoints."))
+
+        restart.add_argument(
+            "--checkpoint-keep",
+            action="store",
+            dest="checkpoint_keep",
+            default=2,
+            type=int,
+            help=("Number of the latest checkpoints to keep."))
+
         # NNPS options
         nnps_options = parser.add_argument_group("NNPS",
                                                  "Nearest Neighbor searching")
@@ -515,6 +643,42 @@ class Application(object):
             default=False,
             help="Option to enable the use of neighbor caching.")
 
+        nnps_options.add_argument(
+            "--compress-nnps-cache",
+            dest="compress_nnps_cache",
+            action="store_true",
+            default=False,
+            help="Store the cached neighbors in a compressed form, this "
+            "uses much less memory for a small decoding cost.")
+
+        nnps_options.add_argument(
+            "--nnps-cache-budget",
+            dest="nnps_cache_budget",
+            type=float,
+            default=0.0,
+            help="Maximum memory (in MB) to use for the neighbor cache, pairs "
+            "of arrays that do not fit are searched without the cache. "
+            "A value <= 0 places no limit.")
+
+        nnps_options.add_argument(
+            "--verlet-skin",
+            dest="verlet_skin",
+            type=float,
+            default=0.0,
+            help="Use Verlet neighbor lists with the given skin (as a "
+            "fraction of the kernel radius), the neighbors are only "
+            "rebuilt when particles move more than half the skin. "
+            "This implies --cache-nnps.")
+
+        nnps_options.add_argument(
+            "--reorder-freq",
+            dest="reorder_freq",
+            type=int,
+            default=0,
+            help="Reorder the particles along a Morton (Z-order) curve "
+            "every given number of iterations to improve memory locality. "
+            "A value of 0 disables the reordering.")
+
         nnps_options.add_argument(
             "--sort-gids",
             dest="sort_gids",
@@ -627,9 +791,11 @@ class Application(object):
             action="store",
             dest="parallel_output_mode",
             default='collected',
-            choices=['collected', 'distributed'],
+            choices=['collected', 'distributed', 'parallel'],
             help="""Use 'collected' to dump one output at
-            root or 'distributed' for every processor. """)
+            root, 'distributed' for every processor or 'parallel' to write
+            one HDF5 file from every processor using MPI-IO (requires h5py
+            with MPI support). """)
 
         # solver interfaces
         interfaces = parser.add_argument_group("Interfaces",
@@ -767,11 +933,20 @@ class Application(object):
 
         # Only master actually calls the particle factory, the rest create
         # dummy particle arrays.
+        # solver state from a checkpoint which is sent to other processors
+        solver_state = None
         if rank == 0:
             if options.restart_file is not None:
-                # FIXME: not tested, probably does not work!
                 solver = self.solver
-                data = load(options.restart_file)
+                restart_file = options.restart_file
+                if isdir(restart_file):
+                    restart_file, data = load_latest_checkpoint(restart_file)
+                    self._message("Restarting from %s" % restart_file)
+                elif is_checkpoint(restart_file):
+                    data = load_checkpoint(restart_file)
+                else:
+                    # FIXME: not tested, probably does not work!
+                    data = load(restart_file)
 
                 arrays = data['arrays']
                 solver_data = data['solver_data']
@@ -784,23 +959,35 @@ class Application(object):
                 # save the particles list
                 self.particles = particles
 
-                # time, timestep and solver iteration count at restart
-                t, dt, count = solver_data['t'], solver_data[
-                    'dt'], solver_data['count']
+                if 'solver_state' in data:
+                    solver_state = data['solver_state']
+                    solver_state['dt'] *= options.rescale_dt
+                    solver.set_state(solver_state)
+                else:
+                    # time, timestep and solver iteration count at restart
+                    t, dt, count = solver_data['t'], solver_data[
+                        'dt'], solver_data['count']
 
-                # rescale dt at restart
-                dt *= options.rescale_dt
-                solver.t, solver.dt, solver.count = t, dt, count
+                    # rescale dt at restart
+                    dt *= options.rescale_dt
+                    solver.t, solver.dt, solver.count = t, dt, count
 
             else:
                 self.particles = particle_factory(*args, **kw)
 
+            if options.single_precision:
+                utils.set_single_precision(self.particles)
+
             # get the array info which will be b'casted to other procs
             particles_info = utils.get_particles_info(self.particles)
 
         # Broadcast the particles_info to other processors for parallel runs
         if self.num_procs > 1:
             particles_info = self.comm.bcast(particles_info, root=0)
+            if options.restart_file is not None:
+                solver_state = self.comm.bcast(solver_state, root=0)
+                if rank != 0 and solver_state is not None:
+                    self.solver.set_state(solver_state)
 
         # now all processors other than root create dummy particle arrays
         if rank != 0:
@@ -820,6 +1007,18 @@ class Application(object):
             get_config().use_double = options.use_double
         if options.profile:
             get_config().profile = options.profile
+        if options.specialize:
+            get_config().specialize = options.specialize
+        if options.opt_level is not None:
+            get_config().opt_level = options.opt_level
+        if options.march is not None:
+            get_config().march = options.march
+        if options.fast_math:
+            get_config().fast_math = options.fast_math
+        if options.unroll_loops:
+            get_config().unroll_loops = options.unroll_loops
+        if options.vectorization_report:
+            get_config().vectorization_report = options.vectorization_report
         # setup the solver using any options
         self.solver.setup_solver(options.__dict__)
 
@@ -838,7 +1037,7 @@ class Application(object):
         self._setup_parallel_manager_and_initial_load_balance()
 
         if self.nnps is None:
-            cache = options.cache_nnps
+            cache = options.cache_nnps or options.verlet_skin > 0
             # create the NNPS object
             if options.with_opencl:
                 from pysph.base.gpu_nnps import ZOrderGPUNNPS
@@ -961,6 +1160,12 @@ class Application(object):
             self.nnps = nnps
 
         nnps = self.nnps
+        if not options.with_opencl:
+            nnps.compress_cache = options.compress_nnps_cache
+            nnps.cache_memory_budget = int(options.nnps_cache_budget*1024**2)
+            if options.verlet_skin > 0:
+                nnps.set_verlet_skin(options.verlet_skin)
+
         # once the NNPS has been set-up, we set the default Solver
         # post-stage callback to the DomainManager.setup_domain
         # method. This method is responsible to computing the new cell
@@ -981,6 +1186,9 @@ class Application(object):
 
         solver.set_max_steps(self.options.max_steps)
 
+        if not options.with_opencl:
+            solver.set_reorder_freq(options.reorder_freq)
+
         # Setup the solver output file name
         fname = options.fname
 
@@ -1002,8 +1210,15 @@ class Application(object):
         solver.set_output_fname(fname)
 
         solver.set_compress_output(options.compress_output)
+        if options.output_precision is not None:
+            solver.set_output_precision(
+                dict(x.split('=', 1) for x in options.output_precision)
+            )
         # disable_output
         solver.set_disable_output(options.disable_output)
+        solver.set_async_output(options.async_output)
+        solver.set_series_output(options.series_output)
+        solver.set_checkpoint(options.checkpoint_freq, options.checkpoint_keep)
 
         # output print frequency
         if options.freq is not None:
@@ -1199,6 +1414,17 @@ class Application(object):
             logger.info(s)
             print(s)
 
+    def _write_profile(self):
+        """Write the recorded timings to the output directory and show them.
+        """
+        fname = join(self.output_dir, self.solver.fname + '_profile')
+        if self.num_procs > 1:
+            fname += '_%d' % self.rank
+        write_profile(fname)
+        self._message('Profile written to %s.{txt,json}:\n%s' % (
+            fname, get_profile_table()
+        ))
+
     def _write_info(self, filename, **kw):
         """Write the information dictionary to given filename. Any extra
         keyword arguments are written to the file.
@@ -1292,22 +1518,38 @@ class Application(object):
             self._setup_solver_callbacks(self)
             for tool in self.create_tools():
                 self.add_tool(tool)
+            reductions = self.create_reductions()
+            if reductions is not None:
+                self.solver.set_reductions(reductions)
 
             end_time = time.time()
-            setup_duration = end_time - start_time
-            self._message("Setup took: %.5f secs" % (setup_duration))
+            self.setup_duration = end_time - start_time
+            self._message("Setup took: %.5f secs" % (self.setup_duration))
             self._write_info(self.info_filename, completed=False, cpu_time=0)
 
         start_time = time.time()
         self.solver.solve(not self.options.quiet)
         end_time = time.time()
-        run_duration = end_time - start_time
-        self._message("Run took: %.5f secs" % (run_duration))
+        self.run_duration = end_time - start_time
+        self._message("Run took: %.5f secs" % (self.run_duration))
+        if (self.options.cache_nnps or self.options.verlet_skin > 0) and \
+                not self.options.with_opencl:
+            usage = self.nnps.get_cache_memory_usage()
+            logger.info(
+                'Neighbor cache memory usage (bytes) per (dest, source):\n%s'
+                % '\n'.join('  %s, %s: %d' % (k[0], k[1], usage[k])
+                             for k in sorted(usage))
+            )
+        if self.options.verlet_skin > 0 and not self.options.with_opencl:
+            logger.info('Neighbor lists rebuilt %d times with Verlet skin %g'
+                        % (self.nnps.n_rebuilds, self.options.verlet_skin))
         if self.options.with_opencl and self.options.profile:
             from pysph.base.opencl import print_profile
             print_profile()
+        if self.options.profile:
+            self._write_profile()
         self._write_info(
-            self.info_filename, completed=True, cpu_time=run_duration)
+            self.info_filename, completed=True, cpu_time=self.run_duration)
 
     def set_args(self, args):
         self.args = args
@@ -1476,6 +1718,13 @@ class Application(object):
         """
         return []
 
+    def create_reductions(self):
+        """Create and return a :py:class:`pysph.solver.reductions.Reductions`
+        instance with the quantities to be evaluated as the simulation
+        proceeds or None.  This is called after the tools are created.
+        """
+        return None
+
     def pre_step(self, solver):
         """If overloaded, this is called automatically before each integrator
         step.  The method is passed the solver instance.
@@ -0,0 +1,184 @@
+"""
+Checkpoints used to restart a simulation.
+
+Unlike the output files, which may only contain some of the properties and
+may be compressed, a checkpoint stores all the properties and constants of
+the particles uncompressed (so the data can be memory mapped) along with the
+state of the solver needed to continue the simulation.  A checksum of every
+property is stored and verified when loading.  The solver state and the
+checksums are stored as JSON.
+
+The checkpoints are written in the npz format to
+``<output_dir>/checkpoints/<fname>_<count>.npz``.
+"""
+
+import json
+import logging
+import os
+import zipfile
+import zlib
+
+import numpy
+
+from pysph.solver.output import NumpyOutput, _get_npz_key, _numpy_load
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointOutput(NumpyOutput):
+    """Write all the particle data and the solver state uncompressed with
+    checksums of the data.
+    """
+    def __init__(self, solver_state, mpi_comm=None):
+        super(CheckpointOutput, self).__init__(
+            detailed_output=True, only_real=True, mpi_comm=mpi_comm,
+            compress=False
+        )
+        self.solver_state = solver_state
+
+    def _get_output_data(self):
+        output_data = super(CheckpointOutput, self)._get_output_data()
+        checksums = {}
+        for name, arrays in self.all_array_data.items():
+            for prop, data in arrays.items():
+                checksums[_get_npz_key(name, prop)] = _checksum(data)
+        output_data['checksums'] = json.dumps(checksums)
+        output_data['solver_state'] = json.dumps(self.solver_state)
+        return output_data
+
+
+def _checksum(data):
+    return zlib.adler32(numpy.ascontiguousarray(data)) & 0xffffffff
+
+
+def _get_count(fname):
+    base = os.path.splitext(os.path.basename(fname))[0]
+    return int(base[base.rfind('_') + 1:])
+
+
+def dump_checkpoint(filename, particles, solver_state, mpi_comm=None):
+    """Write a checkpoint of the particles and the solver state.
+
+    The file is first written to a temporary file which is renamed once it
+    is complete, so an interrupted write does not leave a partial
+    checkpoint.
+
+    Parameters
+    ----------
+
+    filename: str
+        Filename to write to, this should end with '.npz'.
+
+    particles: sequence(ParticleArray)
+        Sequence of particle arrays to save.
+
+    solver_state: dict
+        The state of the solver, see :py:meth:`Solver.get_state`.
+
+    mpi_comm: mpi4pi.MPI.Intracomm
+        If passed, the data from all processors is gathered and written by
+        the root.
+    """
+    output = CheckpointOutput(solver_state, mpi_comm)
+    if not output.snapshot(particles, solver_state):
+        return
+    tmp_fname = filename + '.tmp'
+    with open(tmp_fname, 'wb') as f:
+        output._save(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.rename(tmp_fname, filename)
+
+
+def load_checkpoint(filename, verify=True):
+    """Load a checkpoint.
+
+    Returns a dictionary with the 'arrays', the 'solver_data' and the
+    'solver_state'.  If `verify` is True, the checksums of the data are
+    checked and a RuntimeError is raised if they do not match.
+    """
+    if not zipfile.is_zipfile(filename):
+        raise RuntimeError('%s is not a checkpoint' % filename)
+    try:
+        npz = _numpy_load(filename)
+        try:
+            if 'solver_state' not in npz.files:
+                raise RuntimeError('%s is not a checkpoint' % filename)
+            solver_state = json.loads(npz['solver_state'].item())
+            checksums = json.loads(npz['checksums'].item())
+            data = NumpyOutput()._get_npz_data(
+                npz, filename, None, None, False, 0, None
+            )
+        finally:
+            npz.close()
+    except zipfile.BadZipfile as e:
+        raise RuntimeError('Corrupt checkpoint %s: %s' % (filename, e))
+
+    if verify:
+        for name, pa in data['arrays'].items():
+            for prop in pa.properties:
+                key = _get_npz_key(name, prop)
+                if key in checksums and \
+                   _checksum(pa.get(prop)) != checksums[key]:
+                    msg = "Checksum of %s.%s in %s does not match" % (
+                        name, prop, filename
+                    )
+                    raise RuntimeError(msg)
+    data['solver_state'] = solver_state
+    return data
+
+
+def is_checkpoint(filename):
+    """Return True if the given file is a checkpoint.
+    """
+    if not filename.endswith('.npz') or not zipfile.is_zipfile(filename):
+        return False
+    with numpy.load(filename) as npz:
+        return 'solver_state' in npz.files
+
+
+def get_checkpoint_files(dirname):
+    """Return the checkpoint files in the given directory sorted by the
+    iteration count.
+    """
+    if not os.path.isdir(dirname):
+        return []
+    files = []
+    for f in os.listdir(dirname):
+        if f.endswith('.npz'):
+            try:
+                _get_count(f)
+            except ValueError:
+                continue
+            files.append(os.path.join(dirname, f))
+    return sorted(files, key=_get_count)
+
+
+def load_latest_checkpoint(dirname):
+    """Load the latest valid checkpoint in the given directory, any
+    checkpoints that cannot be read or are corrupt are skipped with a
+    warning.
+
+    Returns the filename and the data as returned by
+    :py:func:`load_checkpoint`.
+    """
+    skipped = []
+    for fname in reversed(get_checkpoint_files(dirname)):
+        try:
+            return fname, load_checkpoint(fname)
+        except (RuntimeError, IOError, OSError, ValueError,
+                zipfile.BadZipfile) as e:
+            logger.warning('Skipping checkpoint %s: %s', fname, e)
+            skipped.append(os.path.basename(fname))
+    msg = 'No valid checkpoint found in %s' % dirname
+    if skipped:
+        msg += ', skipped: %s' % ', '.join(skipped)
+    raise RuntimeError(msg)
+
+
+def remove_old_checkpoints(dirname, keep):
+    """Only keep the last `keep` checkpoints in the directory.
+    """
+    files = get_checkpoint_files(dirname)
+    for fname in files[:max(len(files) - keep, 0)]:
+        os.remove(fname)
@@ -2,26 +2,54 @@
 An interface to output the data in various format
 """
 
+from collections import namedtuple
+from io import BytesIO
 import numpy
 import os
+import struct
+import sys
+import threading
+import zipfile
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
 
 from pysph.base.particle_array import ParticleArray
 from pysph.base.utils import get_particles_info, get_particle_array
-from pysph import has_h5py
+from pysph import has_h5py, has_parallel_h5py
 
-output_formats = ('hdf5', 'npz')
+output_formats = ('hdf5', 'npz', 'series')
 
 
 class Output(object):
-    """ Class that handles output for simulation """
+    """ Class that handles output for simulation
+
+    The `precision` is an optional dictionary keyed on the property name (or
+    ``'array.property'`` for a particular array) to reduce the precision of
+    the floating point data written, see :py:func:`dump`.
+    """
     def __init__(self, detailed_output=False, only_real=True, mpi_comm=None,
-                 compress=False):
+                 compress=False, precision=None):
         self.compress = compress
         self.detailed_output = detailed_output
         self.only_real = only_real
         self.mpi_comm = mpi_comm
+        self.precision = dict(
+            (k, _parse_precision(v)) for k, v in (precision or {}).items()
+        )
 
     def dump(self, fname, particles, solver_data):
+        if self.snapshot(particles, solver_data):
+            self._dump(fname)
+
+    def snapshot(self, particles, solver_data, copy=False):
+        """Collect the data to be written from the particles.
+
+        If `copy` is True, the data is copied so it is not affected by later
+        changes to the particles.  Returns True if this processor should
+        write the data.
+        """
         self.particle_data = dict(get_particles_info(particles))
         self.all_array_data = {}
         for array in particles:
@@ -35,11 +63,16 @@ class Output(object):
                     self.all_array_data, mpi_comm
                     )
         self.solver_data = solver_data
-        if mpi_comm is None or mpi_comm.Get_rank() == 0:
-            self._dump(fname)
+        write = mpi_comm is None or mpi_comm.Get_rank() == 0
+        if write and self.precision:
+            # This makes new arrays so they need not be copied.
+            self._reduce_precision()
+        if copy:
+            self._copy_data()
+        return write
 
-    def load(self, fname):
-        return self._load(fname)
+    def load(self, fname, arrays=None, props=None, lazy=False):
+        return self._load(fname, arrays, props, lazy)
 
     def _gather_array_data(self, all_array_data, comm):
         """Given array_data from the current processor and an MPI
@@ -69,11 +102,42 @@ class Output(object):
                     array_data[prop] = prop_arr
         return all_array_data
 
+    def _reduce_precision(self):
+        """Reduce the precision of the array data and record the information
+        needed to restore it in the particle data.
+        """
+        for name, arrays in self.all_array_data.items():
+            restore = {}
+            for prop, data in arrays.items():
+                spec = self.precision.get(
+                    name + '.' + prop, self.precision.get(prop)
+                )
+                if spec is not None:
+                    result = _reduce_precision(data, spec)
+                    if result is not None:
+                        arrays[prop], restore[prop] = result
+            if restore:
+                self.particle_data[name]['precision'] = restore
+
+    def _copy_data(self):
+        for pdata in self.particle_data.values():
+            pdata['constants'] = dict(
+                (k, v.copy()) for k, v in pdata['constants'].items()
+            )
+            pdata['output_property_arrays'] = list(
+                pdata['output_property_arrays']
+            )
+        self.all_array_data = dict(
+            (name, dict((k, v.copy()) for k, v in arrays.items()))
+            for name, arrays in self.all_array_data.items()
+        )
+        self.solver_data = dict(self.solver_data)
+
     def _dump(self, fname):
         """ Implement the method for writing the output to a file here """
         raise NotImplementedError()
 
-    def _load(self, fname):
+    def _load(self, fname, arrays=None, props=None, lazy=False):
         """ Implement the method for loading from file here """
         raise NotImplementedError()
 
@@ -81,18 +145,43 @@ class Output(object):
 class NumpyOutput(Output):
 
     def _dump(self, filename):
+        self._save(filename)
+
+    def _save(self, file):
         save_method = numpy.savez_compressed if self.compress else numpy.savez
+        save_method(file, version=3, **self._get_output_data())
+
+    def _get_output_data(self):
         output_data = {"particles": self.particle_data,
                        "solver_data": self.solver_data}
+        # Each property is a separate member so it can be read on its own.
         for name, arrays in self.all_array_data.items():
-            self.particle_data[name]["arrays"] = arrays
-        save_method(filename, version=2, **output_data)
+            for prop, data in arrays.items():
+                output_data[_get_npz_key(name, prop)] = data
+        return output_data
+
+    def _load(self, fname, arrays=None, props=None, lazy=False):
+        return self._load_npz(fname, arrays, props, lazy)
+
+    def _load_npz(self, fname, arrays=None, props=None, lazy=False,
+                  offset=0, size=None):
+        """Load the npz data stored in the file, or in `size` bytes starting
+        at `offset` in the file if `size` is given.
+        """
+        fobj = fname if size is None else _FileSection(fname, offset, size)
+        data = _numpy_load(fobj)
+        try:
+            return self._get_npz_data(data, fname, arrays, props, lazy,
+                                      offset, size)
+        finally:
+            data.close()
+            if fobj is not fname:
+                fobj.close()
 
-    def _load(self, fname):
+    def _get_npz_data(self, data, fname, arrays, props, lazy, offset, size):
         def _get_dict_from_arrays(arrays):
             arrays.shape = (1,)
             return arrays[0]
-        data = numpy.load(fname)
 
         if 'version' not in data.files:
             msg = "Wrong file type! No version number recorded."
@@ -104,26 +193,50 @@ class NumpyOutput(Output):
         ret["solver_data"] = solver_data
 
         if version == 1:
-            arrays = _get_dict_from_arrays(data["arrays"])
-            for array_name in arrays:
-                array = get_particle_array(name=array_name,
-                                           **arrays[array_name])
+            all_arrays = _get_dict_from_arrays(data["arrays"])
+            for array_name in _get_selected(all_arrays, arrays):
+                array_data = all_arrays[array_name]
+                selected = _get_selected_props(array_data, props)
+                array = get_particle_array(
+                    name=array_name,
+                    **dict((x, array_data[x]) for x in selected)
+                )
                 ret["arrays"][array_name] = array
 
         elif version == 2:
             particles = _get_dict_from_arrays(data["particles"])
 
-            for array_name, array_info in particles.items():
-                array = ParticleArray(name=array_name,
-                                      constants=array_info["constants"],
-                                      **array_info["arrays"])
-                array.set_output_arrays(
-                    array_info.get('output_property_arrays', [])
+            for array_name in _get_selected(particles, arrays):
+                array_info = particles[array_name]
+                stored = array_info["arrays"]
+                ret["arrays"][array_name] = _make_particle_array(
+                    array_name, array_info, props,
+                    lambda prop, stored=stored: stored[prop],
+                    list(stored.keys())
+                )
+
+        elif version == 3:
+            particles = _get_dict_from_arrays(data["particles"])
+            files = set(data.files)
+            for array_name in _get_selected(particles, arrays):
+                array_info = particles[array_name]
+                stored = [x for x in array_info["properties"]
+                          if _get_npz_key(array_name, x) in files]
+
+                def reader(prop, array_name=array_name):
+                    key = _get_npz_key(array_name, prop)
+                    if lazy:
+                        return _read_npz_member(fname, key, offset, size)
+                    else:
+                        return data[key]
+
+                reader = _get_restoring_reader(
+                    reader, array_info.get('precision')
+                )
+                maker = _make_lazy_array if lazy else _make_particle_array
+                ret["arrays"][array_name] = maker(
+                    array_name, array_info, props, reader, stored
                 )
-                for prop, prop_info in array_info["properties"].items():
-                    if prop not in array_info["arrays"]:
-                        array.add_property(**prop_info)
-                ret["arrays"][array_name] = array
 
         else:
             raise RuntimeError("Version not understood!")
@@ -132,9 +245,12 @@ class NumpyOutput(Output):
 
 class HDFOutput(Output):
 
-    def _dump(self, filename):
+    def _open(self, filename, mode):
         import h5py
-        with h5py.File(filename, 'w') as f:
+        return h5py.File(filename, mode)
+
+    def _dump(self, filename):
+        with self._open(filename, 'w') as f:
             solver_grp = f.create_group('solver_data')
             particles_grp = f.create_group('particles')
             for ptype, pdata in self.particle_data.items():
@@ -145,7 +261,7 @@ class HDFOutput(Output):
                 self._set_properties(pdata, arrays_grp, data)
             self._set_solver_data(solver_grp)
 
-    def _load(self, fname):
+    def _load(self, fname, arrays=None, props=None, lazy=False):
         if has_h5py():
             import h5py
         else:
@@ -153,37 +269,64 @@ class HDFOutput(Output):
             raise ImportError(msg)
 
         ret = {}
-        with h5py.File(fname, 'r') as f:
+        with self._open(fname, 'r') as f:
             solver_grp = f['solver_data']
             particles_grp = f['particles']
             ret["solver_data"] = self._get_solver_data(solver_grp)
-            ret["arrays"] = self._get_particles(particles_grp)
+            ret["arrays"] = self._get_particles(
+                particles_grp, arrays, props, lazy, fname
+            )
         return ret
 
-    def _get_particles(self, grp):
+    def _get_particles(self, grp, arrays=None, props=None, lazy=False,
+                       fname=None):
 
         particles = {}
-        for name, prop_array in grp.items():
+        for name in _get_selected(grp.keys(), arrays):
+            prop_array = grp[name]
             output_array = []
             const_grp = prop_array['constants']
             arrays_grp = prop_array['arrays']
             constants = self._get_constants(const_grp)
-            array = ParticleArray(str(name), constants=constants)
-
-            for pname, h5obj in arrays_grp.items():
+            properties = {}
+            precision = {}
+            for pname in _get_selected_props(arrays_grp.keys(), props):
+                h5obj = arrays_grp[pname]
                 prop_name = str(h5obj.attrs['name'])
-                type_ = str(h5obj.attrs['type'])
-                default = h5obj.attrs['default']
+                properties[prop_name] = dict(
+                    name=prop_name, type=str(h5obj.attrs['type']),
+                    default=h5obj.attrs['default']
+                )
                 if h5obj.attrs['stored']:
                     output_array.append(str(pname))
-                    array.add_property(
-                            prop_name, type_, default, numpy.array(h5obj))
+                restore = dict(
+                    (k[len('precision_'):], v) for k, v in h5obj.attrs.items()
+                    if k.startswith('precision_')
+                )
+                if restore:
+                    restore['dtype'] = str(restore['dtype'])
+                    precision[prop_name] = restore
+            array_info = dict(
+                constants=constants, properties=properties,
+                output_property_arrays=output_array
+            )
+
+            def reader(prop, path=prop_array.name + '/arrays/'):
+                if lazy:
+                    return _read_hdf5_dataset(fname, path + prop)
                 else:
-                    array.add_property(prop_name, type_)
-            array.set_output_arrays(output_array)
-            particles[str(name)] = array
+                    return self._read_data(arrays_grp[prop])
+
+            reader = _get_restoring_reader(reader, precision)
+            maker = _make_lazy_array if lazy else _make_particle_array
+            particles[str(name)] = maker(
+                str(name), array_info, None, reader, output_array
+            )
         return particles
 
+    def _read_data(self, dataset):
+        return numpy.array(dataset)
+
     def _get_solver_data(self, grp):
         solver_data = {}
         for name, value in grp.attrs.items():
@@ -203,6 +346,7 @@ class HDFOutput(Output):
             constGroup.create_dataset(constName, data=constArray)
 
     def _set_properties(self, pdata, ptype_grp, data):
+        precision = pdata.get('precision', {})
         for propname, attributes in pdata['properties'].items():
             if propname in data:
                 array = data[propname]
@@ -216,6 +360,8 @@ class HDFOutput(Output):
                             )
 
                 prop.attrs['stored'] = True
+                for key, value in precision.get(propname, {}).items():
+                    prop.attrs['precision_' + key] = value
             else:
                 prop = ptype_grp.create_dataset(propname, (0,))
                 prop.attrs['stored'] = False
@@ -230,14 +376,545 @@ class HDFOutput(Output):
             grp.attrs[name] = data
 
 
-def load(fname):
+class ParallelHDFOutput(HDFOutput):
+    """Write a single HDF5 file from all the processors using MPI-IO.
+
+    Instead of gathering the data on the root, each processor writes its
+    local particles into its own slice of the datasets, the offsets are found
+    using an exclusive scan of the local number of particles.  The layout of
+    the file is the same as that written by :py:class:`HDFOutput`.  When
+    loading, each processor reads an equal part of the particles.
+
+    This requires h5py built with MPI support.  The data is not compressed
+    and its precision cannot be reduced.
+    """
+    def __init__(self, detailed_output=False, only_real=True, mpi_comm=None,
+                 compress=False, precision=None):
+        if precision:
+            # The reduced data and the information to restore it would
+            # differ between the processors.
+            raise RuntimeError(
+                'Reduced precision is not supported with parallel output.'
+            )
+        if not has_parallel_h5py():
+            raise RuntimeError('Parallel output requires h5py with MPI.')
+        if mpi_comm is None:
+            raise RuntimeError('Parallel output requires an MPI communicator.')
+        super(ParallelHDFOutput, self).__init__(
+            detailed_output, only_real, mpi_comm, compress
+        )
+
+    def snapshot(self, particles, solver_data, copy=False):
+        super(ParallelHDFOutput, self).snapshot(particles, solver_data, copy)
+        # Every processor writes its own part of the data.
+        return True
+
+    def _gather_array_data(self, all_array_data, comm):
+        return all_array_data
+
+    def _open(self, filename, mode):
+        import h5py
+        return h5py.File(filename, mode, driver='mpio', comm=self.mpi_comm)
+
+    def _load(self, fname, arrays=None, props=None, lazy=False):
+        return super(ParallelHDFOutput, self)._load(
+            fname, arrays, props, lazy=False
+        )
+
+    def _read_data(self, dataset):
+        comm = self.mpi_comm
+        rank, size = comm.Get_rank(), comm.Get_size()
+        total = dataset.shape[0]
+        start, end = total*rank//size, total*(rank + 1)//size
+        return dataset[start:end]
+
+    def _set_properties(self, pdata, ptype_grp, data):
+        from mpi4py import MPI
+        comm = self.mpi_comm
+        n_local = len(next(iter(data.values()))) if len(data) > 0 else 0
+        offset = comm.exscan(n_local)
+        if offset is None:
+            offset = 0
+        total = comm.allreduce(n_local)
+        # Collective writes need every processor to write some data.
+        collective = comm.allreduce(n_local, op=MPI.MIN) > 0
+
+        # The datasets must be created in the same order on all processors.
+        for propname in sorted(pdata['properties']):
+            attributes = pdata['properties'][propname]
+            if propname in data:
+                array = data[propname]
+                prop = ptype_grp.create_dataset(
+                    propname, (total,), dtype=array.dtype
+                )
+                if collective:
+                    with prop.collective:
+                        prop[offset:offset + n_local] = array
+                elif n_local > 0:
+                    prop[offset:offset + n_local] = array
+                prop.attrs['stored'] = True
+            else:
+                prop = ptype_grp.create_dataset(propname, (0,))
+                prop.attrs['stored'] = False
+
+            for attname, value in attributes.items():
+                if value is None:
+                    value = 'None'
+                prop.attrs[attname] = value
+
+
+class SeriesOutput(NumpyOutput):
+    """Append the snapshots to a few large segment files with an index
+    instead of writing a file for each output.
+
+    The output for ``<fname>_<count>.series`` is appended to the segment
+    files ``<fname>.series.0``, ``<fname>.series.1``, ... and is recorded in
+    the index file ``<fname>.series``.  A new segment is started when a
+    segment exceeds `max_segment_size` bytes.  Each snapshot is stored in
+    the npz format.  The snapshots are loaded using the same names, see
+    :py:func:`get_series_files`.  Writing a snapshot with an iteration count
+    that is not larger than the last one in the index discards the later
+    snapshots, for example when a simulation is restarted.
+    """
+    max_segment_size = 2**30
+
+    def _dump(self, filename):
+        index_fname, count = parse_series_name(filename)
+        buf = BytesIO()
+        self._save(buf)
+        data = buf.getvalue()
+
+        entries = []
+        if os.path.isfile(index_fname):
+            entries = get_series_entries(index_fname)
+        keep = [e for e in entries if e.count < count]
+        if len(keep) > 0:
+            last = keep[-1]
+            segment, offset = last.segment, last.offset + last.size
+            if offset + len(data) > self.max_segment_size:
+                segment, offset = segment + 1, 0
+        else:
+            segment, offset = 0, 0
+
+        seg_fname = '%s.%d' % (index_fname, segment)
+        mode = 'r+b' if offset > 0 else 'wb'
+        with open(seg_fname, mode) as f:
+            f.seek(offset)
+            f.write(data)
+            f.truncate()
+
+        entry = SeriesEntry(
+            count, float(self.solver_data.get('t', 0.0)),
+            float(self.solver_data.get('dt', 0.0)), segment, offset,
+            len(data)
+        )
+        if len(keep) < len(entries) or len(entries) == 0:
+            _write_series_index(index_fname, keep + [entry])
+        else:
+            _write_series_index(index_fname, [entry], mode='a')
+
+    def _load(self, fname, arrays=None, props=None, lazy=False):
+        index_fname, count = parse_series_name(fname)
+        if not os.path.isfile(index_fname):
+            raise RuntimeError("Series index %s not present" % index_fname)
+        for entry in get_series_entries(index_fname):
+            if entry.count == count:
+                break
+        else:
+            msg = "Iteration %d not found in series %s" % (count, index_fname)
+            raise RuntimeError(msg)
+        seg_fname = '%s.%d' % (index_fname, entry.segment)
+        return self._load_npz(seg_fname, arrays, props, lazy,
+                              entry.offset, entry.size)
+
+
+class LazyParticleArray(object):
+    """A particle array in an output file whose properties are only read
+    from the file when they are first accessed.
+
+    The properties and constants are available as attributes or using
+    :py:meth:`get`, like with a :py:class:`ParticleArray`.  The properties
+    of uncompressed npz files are memory mapped.  Use
+    :py:meth:`get_particle_array` to create a full particle array.
+    """
+    def __init__(self, name, constants, properties, output_property_arrays,
+                 reader):
+        self.name = name
+        self.constants = constants
+        self.properties = properties
+        self.output_property_arrays = output_property_arrays
+        self._reader = reader
+        self._data = {}
+
+    def __getattr__(self, name):
+        if name in self.__dict__.get('properties', {}):
+            return self._get_data(name)
+        elif name in self.__dict__.get('constants', {}):
+            return self.constants[name]
+        raise AttributeError(
+            "'LazyParticleArray' object has no attribute '%s'" % name
+        )
+
+    def __repr__(self):
+        return 'LazyParticleArray(name=%r)' % self.name
+
+    def _get_data(self, prop):
+        if prop not in self._data:
+            if prop in self.output_property_arrays:
+                data = self._reader(prop)
+            else:
+                info = self.properties[prop]
+                data = numpy.empty(
+                    self.get_number_of_particles(),
+                    dtype=_numpy_types.get(info['type'], numpy.float64)
+                )
+                data[:] = info['default']
+            self._data[prop] = data
+        return self._data[prop]
+
+    def get(self, *props):
+        """Return the arrays for the given properties, reading them from the
+        file if needed.
+        """
+        result = [getattr(self, x) for x in props]
+        return result[0] if len(result) == 1 else result
+
+    def get_number_of_particles(self):
+        if len(self.output_property_arrays) == 0:
+            return 0
+        return len(self._get_data(self.output_property_arrays[0]))
+
+    def get_particle_array(self):
+        """Read all the properties and return a :py:class:`ParticleArray`.
+        """
+        return _make_particle_array(
+            self.name, dict(constants=self.constants,
+                            properties=self.properties,
+                            output_property_arrays=self.output_property_arrays),
+            None, self._get_data, self.output_property_arrays
+        )
+
+
+_numpy_types = {
+    'double': numpy.float64, 'float': numpy.float32, 'int': numpy.intc,
+    'unsigned int': numpy.uintc, 'long': numpy.int_
+}
+
+
+def _get_selected(names, selection):
+    """Return the names which are in the selection, all if it is None."""
+    if selection is None:
+        return list(names)
+    return [x for x in names if x in selection]
+
+
+def _get_selected_props(names, props):
+    # The tag is needed to find the number of real particles.
+    return _get_selected(
+        names, None if props is None else set(props) | set(['tag'])
+    )
+
+
+def _make_particle_array(name, array_info, props, reader, stored):
+    """Create a ParticleArray with the selected properties given the array
+    information and a function to read the data of the stored properties.
+    """
+    properties = array_info["properties"]
+    selected = _get_selected_props(properties, props)
+    arrays = dict((x, reader(x)) for x in selected if x in stored)
+    array = ParticleArray(name=name, constants=array_info["constants"],
+                          **arrays)
+    array.set_output_arrays([
+        x for x in array_info.get('output_property_arrays', [])
+        if x in selected
+    ])
+    for prop in selected:
+        if prop not in arrays:
+            array.add_property(**properties[prop])
+    return array
+
+
+def _make_lazy_array(name, array_info, props, reader, stored):
+    properties = array_info["properties"]
+    selected = _get_selected_props(properties, props)
+    return LazyParticleArray(
+        name, array_info["constants"],
+        dict((x, properties[x]) for x in selected),
+        [x for x in stored if x in selected], reader
+    )
+
+
+def _get_npz_key(array_name, prop):
+    return 'arrays/%s/%s' % (array_name, prop)
+
+
+def _parse_precision(spec):
+    """Return the kind of precision reduction and its value given a
+    specification which is either 'float32' or 'float16' to cast the data, a
+    number or 'abs:<tol>' for an absolute tolerance or 'rel:<tol>' for a
+    tolerance relative to the largest magnitude of the data.
+    """
+    if spec in ('float32', 'float16', numpy.float32, numpy.float16):
+        return 'cast', numpy.dtype(spec).name
+    if isinstance(spec, tuple):
+        kind, value = spec
+    elif isinstance(spec, str):
+        kind, _, value = spec.rpartition(':')
+        kind = kind or 'abs'
+    else:
+        kind, value = 'abs', spec
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = -1.0
+    if kind not in ('abs', 'rel') or not value > 0:
+        raise ValueError('Invalid precision %r' % (spec,))
+    return kind, value
+
+
+def _reduce_precision(data, spec):
+    """Reduce the precision of the floating point data as per the parsed
+    `spec`.  Returns the new data and a dictionary of the information needed
+    to restore it or None if the data is left as is.
+
+    For a tolerance, the data is quantized to the smallest unsigned integer
+    type that can hold ``(data - offset)/scale`` where ``scale`` is twice
+    the tolerance so the error is at most the tolerance.
+    """
+    kind, value = spec
+    if data.dtype.kind != 'f' or len(data) == 0:
+        return None
+    restore = dict(dtype=data.dtype.str)
+    if kind == 'cast':
+        if numpy.dtype(value).itemsize >= data.itemsize:
+            return None
+        return data.astype(value), restore
+
+    tol = value if kind == 'abs' else value*numpy.abs(data).max()
+    offset = float(data.min())
+    span = float(data.max()) - offset
+    if tol <= 0.0 or not numpy.isfinite(span):
+        return None
+    scale = 2.0*tol
+    nmax = numpy.rint(span/scale)
+    for dtype in (numpy.uint8, numpy.uint16, numpy.uint32):
+        if nmax <= numpy.iinfo(dtype).max:
+            break
+    else:
+        return None
+    if numpy.dtype(dtype).itemsize >= data.itemsize:
+        return None
+    result = numpy.rint((data - offset)/scale).astype(dtype)
+    restore.update(offset=offset, scale=scale)
+    return result, restore
+
+
+def _restore_precision(data, restore):
+    """Restore the data written with a reduced precision."""
+    if 'scale' in restore:
+        data = restore['offset'] + data*restore['scale']
+    return data.astype(restore['dtype'])
+
+
+def _get_restoring_reader(reader, precision):
+    """Wrap the reader of the property data so it restores the data written
+    with a reduced precision.
+    """
+    if not precision:
+        return reader
+
+    def _reader(prop):
+        data = reader(prop)
+        if prop in precision:
+            data = _restore_precision(data, precision[prop])
+        return data
+    return _reader
+
+
+def _numpy_load(fobj):
+    """Load an npz file allowing pickled object arrays, the particle and
+    solver data (and all the data of the older versions) are stored as these.
+    """
+    try:
+        return numpy.load(fobj, allow_pickle=True)
+    except TypeError:
+        # numpy < 1.10 has no allow_pickle and always unpickles the data.
+        return numpy.load(fobj)
+
+
+def _read_npz_member(fname, key, offset=0, size=None):
+    """Read the array stored with the given key in an npz file (or in `size`
+    bytes starting at `offset` in the file if `size` is given).  The array is
+    memory mapped if it is not compressed.
+    """
+    f = open(fname, 'rb') if size is None else _FileSection(fname, offset, size)
+    with f:
+        with zipfile.ZipFile(f) as zf:
+            info = zf.getinfo(key + '.npy')
+            if info.compress_type != zipfile.ZIP_STORED:
+                with zf.open(info) as member:
+                    return numpy.lib.format.read_array(member)
+
+        # Skip the local file header, see the zip file specification.
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack('<HH', f.read(4))
+        f.seek(name_len + extra_len, os.SEEK_CUR)
+        version = numpy.lib.format.read_magic(f)
+        if version == (1, 0):
+            header = numpy.lib.format.read_array_header_1_0(f)
+        else:
+            header = numpy.lib.format.read_array_header_2_0(f)
+        shape, fortran_order, dtype = header
+        data_offset = offset + f.tell()
+    if numpy.prod(shape) == 0:
+        return numpy.empty(shape, dtype=dtype)
+    return numpy.memmap(fname, dtype=dtype, mode='r', offset=data_offset,
+                        shape=shape, order='F' if fortran_order else 'C')
+
+
+class _FileSection(object):
+    """A read-only file object for `size` bytes starting at `offset` in the
+    given file.
+    """
+    def __init__(self, fname, offset, size):
+        self._file = open(fname, 'rb')
+        self._start = offset
+        self._size = size
+        self._file.seek(offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, n=-1):
+        remaining = max(self._size - self.tell(), 0)
+        if n is None or n < 0 or n > remaining:
+            n = remaining
+        return self._file.read(n)
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            pos += self.tell()
+        elif whence == os.SEEK_END:
+            pos += self._size
+        self._file.seek(self._start + pos)
+        return pos
+
+    def tell(self):
+        return self._file.tell() - self._start
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self._file.close()
+
+
+def _read_hdf5_dataset(fname, path):
+    import h5py
+    with h5py.File(fname, 'r') as f:
+        return numpy.array(f[path])
+
+
+SeriesEntry = namedtuple(
+    'SeriesEntry', ['count', 't', 'dt', 'segment', 'offset', 'size']
+)
+
+# The parsed index files keyed on the filename, each value is a tuple of the
+# (mtime, size) of the file and the list of entries.
+_series_index_cache = {}
+
+
+def is_series_entry(fname):
+    """Return True if the name refers to a snapshot in a series, i.e. it is
+    of the form ``<fname>_<count>.series`` and is not a file.
+    """
+    return fname.endswith('.series') and not os.path.isfile(fname)
+
+
+def parse_series_name(fname):
+    """Return the index filename and the iteration count given the name of a
+    snapshot in a series, for example ``('sim.series', 10)`` for
+    ``'sim_10.series'``.
+    """
+    base = os.path.splitext(fname)[0]
+    idx = base.rfind('_')
+    try:
+        count = int(base[idx + 1:])
+    except ValueError:
+        raise RuntimeError('Invalid series snapshot name: %s' % fname)
+    return base[:idx] + '.series', count
+
+
+def get_series_entries(index_fname):
+    """Return a list of the :py:class:`SeriesEntry` instances for all the
+    snapshots in the given series index file.
+    """
+    stat = os.stat(index_fname)
+    key = (stat.st_mtime, stat.st_size)
+    cached = _series_index_cache.get(index_fname)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    entries = []
+    with open(index_fname) as f:
+        for line in f:
+            if line.startswith('#') or len(line.strip()) == 0:
+                continue
+            count, t, dt, segment, offset, size = line.split()
+            entries.append(SeriesEntry(
+                int(count), float(t), float(dt), int(segment), int(offset),
+                int(size)
+            ))
+    _series_index_cache[index_fname] = (key, entries)
+    return entries
+
+
+def get_series_files(index_fname):
+    """Return the names of all the snapshots in a series given the index
+    file.  These names can be passed to :py:func:`load`.
+    """
+    base = os.path.splitext(index_fname)[0]
+    return ['%s_%d.series' % (base, e.count)
+            for e in get_series_entries(index_fname)]
+
+
+def _write_series_index(index_fname, entries, mode='w'):
+    with open(index_fname, mode) as f:
+        if mode == 'w':
+            f.write('# count t dt segment offset size\n')
+        for e in entries:
+            f.write('%d %r %r %d %d %d\n' % tuple(e))
+
+
+def load(fname, arrays=None, props=None, lazy=False, mpi_comm=None):
     """
     Load the output data
 
     Parameters
     ----------
     fname: str
-        Name of the file or full path
+        Name of the file or full path, or the name of a snapshot in a series
+        of the form ``<fname>_<count>.series``, see :py:class:`SeriesOutput`.
+
+    arrays: sequence
+        Names of the only particle arrays to load, all are loaded if None.
+
+    props: sequence
+        Names of the only properties to load, all are loaded if None.  The
+        'tag' property is always loaded.
+
+    lazy: bool
+        If True, return :py:class:`LazyParticleArray` instances whose
+        properties are only read when accessed.  This is only supported for
+        HDF5 files and npz files written with PySPH 1.0b1 or later, older
+        files are loaded as usual.
+
+    mpi_comm: mpi4pi.MPI.Intracomm
+        If passed, an HDF5 file is read in parallel using MPI-IO and each
+        processor gets an equal part of the particles.  This requires h5py
+        with MPI support.
 
 
     Examples
@@ -255,19 +932,55 @@ def load(fname):
     {'count': 100, 'dt': 4.6416394784204199e-05, 't': 0.0039955855395528766}
     """
 
-    if fname.endswith('npz'):
+    if is_series_entry(fname):
+        return SeriesOutput().load(fname, arrays, props, lazy)
+    elif fname.endswith('npz'):
         output = NumpyOutput()
     elif fname.endswith('hdf5'):
-        output = HDFOutput()
+        if mpi_comm is None:
+            output = HDFOutput()
+        else:
+            output = ParallelHDFOutput(mpi_comm=mpi_comm)
     if os.path.isfile(fname):
-        return output.load(fname)
+        return output.load(fname, arrays, props, lazy)
     else:
         msg = "File not present"
         raise RuntimeError(msg)
 
 
+def _get_output(filename, detailed_output=False, only_real=True,
+                mpi_comm=None, compress=False, parallel_io=False,
+                precision=None):
+    """Return a suitable Output instance and the full filename to write.
+    """
+    if filename.endswith(output_formats):
+        fname = os.path.splitext(filename)[0]
+    else:
+        fname = filename
+        filename = fname + '.hdf5'
+    if parallel_io and mpi_comm is not None:
+        file_format = 'hdf5'
+        output = ParallelHDFOutput(detailed_output, only_real, mpi_comm,
+                                   precision=precision)
+    elif filename.endswith('series'):
+        file_format = 'series'
+        output = SeriesOutput(detailed_output, only_real, mpi_comm, compress,
+                              precision)
+    elif filename.endswith('hdf5') and has_h5py():
+        file_format = 'hdf5'
+        output = HDFOutput(detailed_output, only_real, mpi_comm, compress,
+                           precision)
+    else:
+        output = NumpyOutput(detailed_output, only_real, mpi_comm, compress,
+                             precision)
+        file_format = 'npz'
+    filename = fname + '.' + file_format
+    return output, filename
+
+
 def dump(filename, particles, solver_data, detailed_output=False,
-         only_real=True, mpi_comm=None, compress=False):
+         only_real=True, mpi_comm=None, compress=False, parallel_io=False,
+         precision=None):
 
     """
     Dump the given particles and solver data to the given filename.
@@ -296,20 +1009,110 @@ def dump(filename, particles, solver_data, detailed_output=False,
     compress: bool
         Specify if the  file is to be compressed or not.
 
+    parallel_io: bool
+        Write a single HDF5 file from all the processors using MPI-IO, see
+        :py:class:`ParallelHDFOutput`.  Only used if `mpi_comm` is passed.
+
+    precision: dict
+        Reduce the precision of the floating point properties to save space.
+        The keys are property names (or 'array.property' for a particular
+        array) and the values are either 'float32' or 'float16' to cast the
+        data, a number or 'abs:<tol>' to quantize the data to the given
+        absolute tolerance or 'rel:<tol>' for a tolerance relative to the
+        largest magnitude of the data.  The data is restored to its original
+        type when loaded.  This cannot be used with `parallel_io`.
+
     If `mpi_comm` is not passed or is set to None the local particles alone
-    are dumped, otherwise only rank 0 dumps the output.
+    are dumped, otherwise only rank 0 dumps the output unless `parallel_io`
+    is True.
 
     """
-    if filename.endswith(output_formats):
-        fname = os.path.splitext(filename)[0]
-    else:
-        fname = filename
-        filename = fname + '.hdf5'
-    if filename.endswith('hdf5') and has_h5py():
-        file_format = 'hdf5'
-        output = HDFOutput(detailed_output, only_real, mpi_comm, compress)
-    else:
-        output = NumpyOutput(detailed_output, only_real, mpi_comm, compress)
-        file_format = 'npz'
-    filename = fname + '.' + file_format
+    output, filename = _get_output(
+        filename, detailed_output, only_real, mpi_comm, compress, parallel_io,
+        precision
+    )
     output.dump(filename, particles, solver_data)
+
+
+class AsyncOutputWriter(object):
+    """Write output files from a background thread.
+
+    The data to be written is copied when :py:meth:`dump` is called so the
+    simulation can continue while the file is written.  At most
+    `max_pending` snapshots are held in memory, if these are all waiting to
+    be written :py:meth:`dump` blocks until one of them is done.
+
+    Any error raised when writing a file is raised again by the next call to
+    :py:meth:`dump` or :py:meth:`flush`.
+
+    Examples
+    --------
+
+    >>> writer = AsyncOutputWriter()
+    >>> writer.dump('elliptical_drop_100', particles, solver_data)
+    >>> # Wait till all the pending files are written.
+    >>> writer.flush()
+
+    """
+    def __init__(self, max_pending=2):
+        self.max_pending = max_pending
+        self._queue = Queue(maxsize=max_pending)
+        self._thread = None
+        self._error = None
+
+    def dump(self, filename, particles, solver_data, detailed_output=False,
+             only_real=True, mpi_comm=None, compress=False, precision=None):
+        """Queue the given particles and solver data to be written, the
+        arguments are the same as those of the :py:func:`dump` function.
+        """
+        self._check_error()
+        output, filename = _get_output(
+            filename, detailed_output, only_real, mpi_comm, compress,
+            precision=precision
+        )
+        if output.snapshot(particles, solver_data, copy=True):
+            self._start()
+            self._queue.put((output, filename))
+
+    def flush(self):
+        """Wait for all the queued output to be written.
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self._check_error()
+
+    def close(self):
+        """Write any pending output and stop the background thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._check_error()
+
+    def _check_error(self):
+        if self._error is not None:
+            filename, error = self._error
+            self._error = None
+            raise RuntimeError(
+                'Error writing output to %s: %s' % (filename, error)
+            )
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                output, filename = item
+                output._dump(filename)
+            except Exception:
+                self._error = (filename, sys.exc_info()[1])
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,260 @@
+"""
+In-situ reductions of the particle data written as a time series.
+
+Many simulations only need a few integrated quantities (the kinetic energy,
+the maximum velocity, the pressure at a few probe points etc.) at a high
+frequency.  Instead of dumping all the particle data this often, the
+quantities can be registered with a :py:class:`Reductions` instance which is
+set on the solver.  These are evaluated every `freq` iterations, buffered and
+written as a CSV or HDF5 file with a column for each quantity.
+
+Examples
+--------
+
+>>> reductions = Reductions(freq=10)
+>>> reductions.add(
+...     'ke', 'fluid', lambda pa: 0.5*pa.m*(pa.u**2 + pa.v**2), op='sum'
+... )
+>>> reductions.add('u_max', 'fluid', 'u', op='max')
+>>> reductions.add_probe('p_probe', 'fluid', 'p', x=[0.5, 1.0], y=[0.1, 0.1])
+>>> solver.set_reductions(reductions)
+
+The results can be read using :py:func:`load_reductions`.
+"""
+
+import numpy as np
+
+from pysph import has_h5py
+from pysph.base.kernels import CubicSpline, get_compiled_kernel
+from pysph.base.particle_array import get_remote_tag
+from pysph.base.reduce_array import (mpi_reduce_array, serial_reduce_array,
+                                     _check_operation)
+from pysph.base.utils import get_particle_array
+
+_identity = {'sum': 0.0, 'prod': 1.0, 'max': -np.inf, 'min': np.inf}
+
+
+class Reduction(object):
+    """Reduce a property (or a function of the particle array) of the real
+    particles of an array using one of 'sum', 'max', 'min' or 'prod'.
+    """
+    def __init__(self, name, array_name, expr, op='sum'):
+        _check_operation(op)
+        self.name = name
+        self.array_name = array_name
+        self.expr = expr
+        self.op = op
+
+    def get_columns(self):
+        return [self.name]
+
+    def evaluate(self, pa, parallel=False):
+        if callable(self.expr):
+            data = np.asarray(self.expr(pa))
+        else:
+            data = pa.get(self.expr, only_real_particles=False)
+        # Only the real particles are reduced so parallel runs do not count
+        # the remote particles twice.
+        data = data[:pa.num_real_particles]
+        if len(data) == 0:
+            result = _identity[self.op]
+        else:
+            result = serial_reduce_array(data, self.op)
+        if parallel:
+            result = mpi_reduce_array(result, self.op)
+        return [float(result)]
+
+
+class Probe(object):
+    """Evaluate the SPH (Shepard) interpolant of a property at fixed points.
+
+    The neighbors of the points are found using an NNPS which is built once
+    and updated for each evaluation.  In parallel, the kernel sums over the
+    local particles are added up on all the processors.
+    """
+    def __init__(self, name, array_name, prop, x, y=None, z=None,
+                 kernel=None):
+        self.name = name
+        self.array_name = array_name
+        self.prop = prop
+        x = np.asarray(x, dtype=float)
+        zeros = np.zeros_like(x)
+        y = zeros if y is None else np.asarray(y, dtype=float)
+        z = zeros if z is None else np.asarray(z, dtype=float)
+        self.points = get_particle_array(name=name + '_probe', x=x, y=y, z=z)
+        self.kernel = kernel
+        self.nnps = None
+        self._array = None
+
+    def get_columns(self):
+        n = self.points.get_number_of_particles()
+        return ['%s_%d' % (self.name, i) for i in range(n)]
+
+    def evaluate(self, pa, parallel=False):
+        from pysph.base.nnps import LinkedListNNPS
+        points = self.points
+        n_src = pa.get_number_of_particles()
+        h_max = pa.h.max() if n_src > 0 else 0.0
+        if parallel:
+            # All the processors must use the same smoothing length for the
+            # sums over their particles to add up to the serial result.
+            h_max = mpi_reduce_array(h_max, 'max')
+        points.h[:] = h_max
+        if self.kernel is None:
+            self.kernel = CubicSpline(dim=3)
+        if self.nnps is None or self._array is not pa:
+            self._array = pa
+            self.nnps = LinkedListNNPS(
+                dim=self.kernel.dim, particles=[pa, points],
+                radius_scale=self.kernel.radius_scale
+            )
+        else:
+            self.nnps.update()
+
+        n_dst = points.get_number_of_particles()
+        numerator = np.zeros(n_dst)
+        denominator = np.zeros(n_dst)
+        if n_src > 0:
+            indptr, cols = self.nnps.get_neighbor_lists(0, 1)
+            rows = np.repeat(np.arange(n_dst), np.diff(indptr))
+            keep = pa.tag[cols] != get_remote_tag()
+            rows, cols = rows[keep], cols[keep]
+            kernel = get_compiled_kernel(self.kernel)
+            w = kernel.kernel_array(
+                points.x[rows] - pa.x[cols], points.y[rows] - pa.y[cols],
+                points.z[rows] - pa.z[cols], 0.5*(points.h[rows] + pa.h[cols])
+            )
+            data = pa.get(self.prop, only_real_particles=False)
+            numerator = np.bincount(rows, w*data[cols], minlength=n_dst)
+            denominator = np.bincount(rows, w, minlength=n_dst)
+        if parallel:
+            numerator = mpi_reduce_array(numerator, 'sum')
+            denominator = mpi_reduce_array(denominator, 'sum')
+        # This is consistent with the Interpolator.
+        factor = np.where(denominator > 1e-12, denominator, 1.0)
+        return list(numerator/factor)
+
+
+class Reductions(object):
+    """Evaluate the registered reductions every `freq` iterations and write
+    them to a CSV or HDF5 file.
+
+    The results are buffered and written once `buffer_size` rows are
+    available or when :py:meth:`flush` is called.  Each row has the time,
+    the iteration count and a column for each reduction (and for each point
+    of a probe).  If `fname` is not given, the solver writes the file
+    ``<fname>_reductions.csv`` in its output directory.  In parallel, all
+    the processors evaluate the reductions and only the root writes them.
+    """
+    def __init__(self, fname=None, freq=1, buffer_size=100):
+        self.fname = fname
+        self.freq = freq
+        self.buffer_size = buffer_size
+        self.reductions = []
+        self._rows = []
+        self._last_count = None
+        self._started = False
+
+    def add(self, name, array_name, expr, op='sum'):
+        """Add a reduction.
+
+        Parameters
+        ----------
+
+        name: str
+            Name of the column.
+        array_name: str
+            Name of the particle array.
+        expr: str or callable
+            The property to reduce or a function which is passed the particle
+            array and returns an array of values for each particle.
+        op: str
+            One of 'sum', 'max', 'min' or 'prod'.
+        """
+        self.reductions.append(Reduction(name, array_name, expr, op))
+
+    def add_probe(self, name, array_name, prop, x, y=None, z=None,
+                  kernel=None):
+        """Add a probe that interpolates the property `prop` of the given
+        array at the points (`x`, `y`, `z`).  A column is added for each
+        point, named ``<name>_<index>``.  The kernel defaults to that of the
+        solver.
+        """
+        self.reductions.append(
+            Probe(name, array_name, prop, x, y, z, kernel)
+        )
+
+    def get_columns(self):
+        columns = ['t', 'count']
+        for reduction in self.reductions:
+            columns.extend(reduction.get_columns())
+        return columns
+
+    def evaluate(self, solver):
+        """Evaluate the reductions for the current state of the solver.
+        """
+        if solver.count == self._last_count:
+            return
+        self._last_count = solver.count
+        arrays = dict((pa.name, pa) for pa in solver.particles)
+        row = [solver.t, solver.count]
+        for reduction in self.reductions:
+            if isinstance(reduction, Probe) and reduction.kernel is None:
+                reduction.kernel = solver.kernel
+            pa = arrays[reduction.array_name]
+            row.extend(reduction.evaluate(pa, solver.in_parallel))
+        if solver.rank == 0:
+            self._rows.append(row)
+            if len(self._rows) >= self.buffer_size:
+                self.flush()
+
+    def evaluate_if_needed(self, solver):
+        if self.freq > 0 and solver.count % self.freq == 0:
+            self.evaluate(solver)
+
+    def flush(self):
+        """Write any buffered results to the file.
+        """
+        if len(self._rows) == 0 or self.fname is None:
+            return
+        rows = np.asarray(self._rows, dtype=float)
+        columns = self.get_columns()
+        mode = 'a' if self._started else 'w'
+        if self.fname.endswith('.hdf5'):
+            _append_hdf5(self.fname, mode, columns, rows)
+        else:
+            with open(self.fname, mode) as f:
+                if not self._started:
+                    f.write(','.join(columns) + '\n')
+                np.savetxt(f, rows, delimiter=',', fmt='%.17g')
+        self._started = True
+        self._rows = []
+
+
+def _append_hdf5(fname, mode, columns, rows):
+    if not has_h5py():
+        raise ImportError("Install h5py to write the reductions as HDF5")
+    import h5py
+    with h5py.File(fname, mode) as f:
+        for i, column in enumerate(columns):
+            if column not in f:
+                f.create_dataset(column, (0,), maxshape=(None,), dtype=float)
+            dset = f[column]
+            n = dset.shape[0]
+            dset.resize((n + len(rows),))
+            dset[n:] = rows[:, i]
+
+
+def load_reductions(fname):
+    """Load the reductions written to the given CSV or HDF5 file.
+
+    Returns a dictionary of arrays keyed on the column names.
+    """
+    if fname.endswith('.hdf5'):
+        import h5py
+        with h5py.File(fname, 'r') as f:
+            return dict((str(k), np.array(v)) for k, v in f.items())
+    with open(fname) as f:
+        columns = f.readline().strip().split(',')
+    data = np.loadtxt(fname, delimiter=',', skiprows=1, ndmin=2)
+    return dict((name, data[:, i]) for i, name in enumerate(columns))
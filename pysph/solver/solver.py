@@ -6,10 +6,12 @@ import numpy
 
 # PySPH imports
 from pysph.base.kernels import CubicSpline
+from pysph.base.profiler import profile_ctx
 from pysph.sph.acceleration_eval import AccelerationEval
 from pysph.sph.sph_compiler import SPHCompiler
 
 from pysph.solver.utils import FloatPBar, load, dump
+from pysph.solver.output import AsyncOutputWriter, get_series_entries
 
 import logging
 logger = logging.getLogger(__name__)
@@ -62,6 +64,10 @@ class Solver(object):
         pfreq : int
             Output files dumping frequency.
 
+        reorder_freq : int
+            Frequency (in iterations) at which the particles are spatially
+            reordered, zero disables the reordering.
+
         output_at_times : list/array
             Optional list of output times to force dump the output file
 
@@ -91,6 +97,10 @@ class Solver(object):
 
         # Set the AccelerationEval instance to None.
         self.acceleration_eval = None
+        self.sph_compiler = None
+
+        # The NNPS is set in setup.
+        self.nnps = None
 
         # solver time and iteration count
         self.t = 0
@@ -108,10 +118,29 @@ class Solver(object):
         # default output printing frequency
         self.pfreq = 100
 
+        # frequency of the spatial reordering of the particles (0 disables)
+        self.reorder_freq = 0
+
         # Compress generated files.
         self.compress_output = False
+        # Reduced precision of the properties written, see set_output_precision
+        self.output_precision = None
         self.disable_output = False
 
+        # Write the output files in the background.
+        self.async_output = False
+        self._output_writer = None
+
+        # Append the output to a series instead of separate files.
+        self.series_output = False
+
+        # In-situ reductions evaluated periodically, see set_reductions.
+        self.reductions = None
+
+        # Checkpoint frequency (0 disables) and number of checkpoints kept.
+        self.checkpoint_freq = 0
+        self.checkpoint_keep = 2
+
         # the process id for parallel runs
         self.pid = None
 
@@ -160,6 +189,8 @@ class Solver(object):
         self._prev_dt = None
         self._damping_factor = 1.0
         self._epsilon = EPSILON*tf
+        # Set when the state is restored from a checkpoint.
+        self._restored_state = False
 
         # flag for constant smoothing lengths
         self.fixed_h = fixed_h
@@ -205,12 +236,13 @@ class Solver(object):
             'Using integrator:\n%s\n  %s\n%s'%(sep, self.integrator, sep)
         )
 
-        sph_compiler = SPHCompiler(
+        self.sph_compiler = SPHCompiler(
             self.acceleration_eval, self.integrator
         )
-        sph_compiler.compile()
+        self.sph_compiler.compile()
 
         # Set the nnps for all concerned objects.
+        self.nnps = nnps
         self.acceleration_eval.set_nnps(nnps)
         self.integrator.set_nnps(nnps)
 
@@ -321,11 +353,47 @@ class Solver(object):
         """ Set the output print frequency """
         self.pfreq = n
 
+    def set_reorder_freq(self, n):
+        """Spatially reorder the particles every `n` iterations, a value of
+        zero disables the reordering.
+        """
+        self.reorder_freq = n
+
     def set_disable_output(self, value):
         """Disable file output.
         """
         self.disable_output = value
 
+    def set_async_output(self, value, max_pending=2):
+        """Write the output files from a background thread.  At most
+        `max_pending` snapshots of the data are kept in memory waiting to be
+        written, after which the simulation waits for the writes to finish.
+        """
+        self.async_output = value
+        if value:
+            self._output_writer = AsyncOutputWriter(max_pending)
+        else:
+            self._output_writer = None
+
+    def set_reductions(self, reductions):
+        """Set a :py:class:`pysph.solver.reductions.Reductions` instance
+        which is evaluated periodically as the simulation proceeds.  If it
+        has no filename, the results are written to
+        ``<fname>_reductions.csv`` in the output directory.
+        """
+        self.reductions = reductions
+
+    def set_checkpoint(self, freq, keep=2):
+        """Write a checkpoint every `freq` iterations keeping only the last
+        `keep` checkpoints.  A `freq` of zero disables checkpointing.
+
+        The checkpoints are written to the ``checkpoints`` directory inside
+        the output directory and can be passed to :py:meth:`restore_checkpoint`
+        to restart the simulation.
+        """
+        self.checkpoint_freq = freq
+        self.checkpoint_keep = keep
+
     def set_arrays_to_print(self, array_names=None):
         """Only print the arrays with the given names.
         """
@@ -370,11 +438,26 @@ class Solver(object):
         """
         self.max_steps = max_steps
 
+    def set_series_output(self, value):
+        """Append the output to a few large files with an index instead of
+        writing a separate file for each output.  See
+        :py:class:`pysph.solver.output.SeriesOutput`.
+        """
+        self.series_output = value
+
     def set_compress_output(self, compress):
         """Compress the dumped output files.
         """
         self.compress_output = compress
 
+    def set_output_precision(self, precision):
+        """Reduce the precision of the floating point properties written to
+        the output files.  `precision` is a dictionary keyed on the property
+        names, see the `precision` argument of
+        :py:func:`pysph.solver.output.dump` for the supported values.
+        """
+        self.output_precision = precision
+
     def set_parallel_output_mode(self, mode="collected"):
         """Set the default solver dump mode in parallel.
 
@@ -386,8 +469,11 @@ class Solver(object):
 
         distributed : Each processor dumps a file locally.
 
+        parallel : Every processor writes its particles to a single HDF5 file
+                   using MPI-IO, this requires h5py with MPI support.
+
         """
-        assert mode in ("collected", "distributed")
+        assert mode in ("collected", "distributed", "parallel")
         self.parallel_output_mode = mode
 
     def set_command_handler(self, callable, command_interval=1):
@@ -422,26 +508,50 @@ class Solver(object):
         else:
             show = show_progress
         bar = FloatPBar(self.t, self.tf, show=show)
-        self._epsilon = EPSILON*self.tf
-
+        self._epsilon = EPSILON*self.tf*max(self.count, 1)
+
+        completed = False
+        try:
+            self._solve(bar)
+            completed = True
+        finally:
+            # Write any output pending in the background and stop the writer.
+            if completed:
+                self._close_output()
+            else:
+                # Do not hide the error that stopped the simulation.
+                try:
+                    self._close_output()
+                except Exception:
+                    logger.exception('Error writing the pending output.')
+            if self.reductions is not None:
+                self.reductions.flush()
+
+    def _solve(self, bar):
         # Initial solution
         self.dump_output()
         self.barrier() # everybody waits for this to complete
+        self._reduce_if_needed()
 
         # Compute the accelerations once for the predictor corrector
         # integrator to work correctly at the first time step.
         self.acceleration_eval.compute(self.t, self.dt)
 
         # Now get a suitable adaptive (if requested) and damped timestep to
-        # integrate with.
-        self.dt = self._get_timestep()
+        # integrate with.  When restarting from a checkpoint the saved
+        # timestep is used as is.
+        if self._restored_state:
+            self._restored_state = False
+        else:
+            self.dt = self._get_timestep()
 
         while (self.tf - self.t) > self._epsilon and \
               (self.count < self.max_steps):
 
             # perform any pre step functions
-            for callback in self.pre_step_callbacks:
-                callback(self)
+            with profile_ctx('Solver.pre_step_callbacks'):
+                for callback in self.pre_step_callbacks:
+                    callback(self)
 
             if self.rank == 0:
                 logger.debug(
@@ -450,11 +560,13 @@ class Solver(object):
                 )
             # perform the integration and update the time.
             #print 'Solver Iteration', self.count, self.dt, self.t
-            self.integrator.step(self.t, self.dt)
+            with profile_ctx('Integrator.step'):
+                self.integrator.step(self.t, self.dt)
 
             # perform any post step functions
-            for callback in self.post_step_callbacks:
-                callback(self)
+            with profile_ctx('Solver.post_step_callbacks'):
+                for callback in self.post_step_callbacks:
+                    callback(self)
 
             # update time and iteration counters if successfully
             # integrated
@@ -462,6 +574,9 @@ class Solver(object):
             self.count += 1
             self._epsilon = EPSILON*self.tf*self.count
 
+            # Reorder the particles to improve their memory locality.
+            self._reorder_particles_if_needed()
+
             # Compute the next timestep.
             self.dt = self._get_timestep()
 
@@ -474,6 +589,9 @@ class Solver(object):
             # update the time for all arrays
             self.update_particle_time()
 
+            self._reduce_if_needed()
+            self._checkpoint_if_needed()
+
             if self.execute_commands is not None:
                 if self.count % self.command_interval == 0:
                     self.execute_commands(self)
@@ -483,6 +601,8 @@ class Solver(object):
 
         # final output save
         self.dump_output()
+        if self.reductions is not None:
+            self.reductions.evaluate(self)
 
     def update_particle_time(self):
         for array in self.particles:
@@ -533,15 +653,47 @@ class Solver(object):
 
         fname = os.path.join(self.output_directory,
                              self.fname  + '_' + str(self.count))
+        if self.series_output:
+            fname += '.series'
 
         comm = None
-        if self.parallel_output_mode == "collected" and self.in_parallel:
-            comm = self.comm
+        parallel_io = False
+        if self.in_parallel:
+            if self.parallel_output_mode == "collected":
+                comm = self.comm
+            elif self.parallel_output_mode == "parallel":
+                comm = self.comm
+                parallel_io = True
+
+        with profile_ctx('Solver.dump_output'):
+            if self.async_output and not parallel_io:
+                self._output_writer.dump(
+                    fname, self.particles, self._get_solver_data(),
+                    detailed_output=self.detailed_output,
+                    only_real=self.output_only_real, mpi_comm=comm,
+                    compress=self.compress_output,
+                    precision=self.output_precision
+                )
+            else:
+                # Parallel output uses collective MPI calls and is always
+                # written from the main thread.
+                dump(fname, self.particles, self._get_solver_data(),
+                     detailed_output=self.detailed_output,
+                     only_real=self.output_only_real, mpi_comm=comm,
+                     compress=self.compress_output, parallel_io=parallel_io,
+                     precision=self.output_precision)
+
+    def flush_output(self):
+        """Wait till any output being written in the background is done.
+        """
+        if self._output_writer is not None:
+            with profile_ctx('Solver.flush_output'):
+                self._output_writer.flush()
 
-        dump(fname, self.particles, self._get_solver_data(),
-             detailed_output=self.detailed_output,
-             only_real=self.output_only_real, mpi_comm=comm,
-             compress=self.compress_output)
+    def _close_output(self):
+        if self._output_writer is not None:
+            with profile_ctx('Solver.flush_output'):
+                self._output_writer.close()
 
     def load_output(self, count):
         """Load particle data from dumped output file.
@@ -558,13 +710,27 @@ class Solver(object):
         Data is loaded from the :py:attr:`output_directory` using the same format
         as stored by the :py:meth:`dump_output` method.
         Proper functioning required that all the relevant properties of arrays be
-        dumped.
+        dumped.  With series output, the available iteration counts are read
+        from the series index.
 
         """
+        self.flush_output()
+
         # get the list of available files
-        available_files = [i.rsplit('_',1)[1][:-4]
-                            for i in os.listdir(self.output_directory)
-                             if i.startswith(self.fname) and i.endswith('.npz')]
+        if self.series_output:
+            ext = '.series'
+            index_fname = os.path.join(self.output_directory,
+                                       self.fname + ext)
+            if os.path.exists(index_fname):
+                available_files = [str(e.count) for e in
+                                   get_series_entries(index_fname)]
+            else:
+                available_files = []
+        else:
+            ext = '.npz'
+            available_files = [i.rsplit('_',1)[1][:-4]
+                                for i in os.listdir(self.output_directory)
+                                 if i.startswith(self.fname) and i.endswith(ext)]
 
         if count == '?':
             return sorted(set(available_files), key=int)
@@ -580,7 +746,7 @@ class Solver(object):
 
         # load the output file
         data = load(os.path.join(self.output_directory,
-                                 self.fname+'_'+str(count)+'.npz'))
+                                 self.fname+'_'+str(count)+ext))
 
         arrays = [ data["arrays"][i] for i in array_names ]
 
@@ -657,6 +823,82 @@ class Solver(object):
 
         return dt*self._damping_factor
 
+    def get_checkpoint_dir(self):
+        return os.path.join(self.output_directory, 'checkpoints')
+
+    def get_state(self):
+        """Return the state of the solver needed to continue the
+        simulation exactly.
+        """
+        return {
+            't': self.t, 'dt': self.dt, 'count': self.count,
+            'prev_dt': self._prev_dt, 'damping_factor': self._damping_factor
+        }
+
+    def set_state(self, state):
+        """Set the state of the solver as returned by :py:meth:`get_state`.
+        """
+        self.t = state['t']
+        self.dt = state['dt']
+        self.count = state['count']
+        self._prev_dt = state['prev_dt']
+        self._damping_factor = state['damping_factor']
+        self._restored_state = True
+
+    def checkpoint(self):
+        """Write a checkpoint of the particles and the solver state and
+        remove the older checkpoints.
+        """
+        from pysph.solver.checkpoint import (dump_checkpoint,
+                                             remove_old_checkpoints)
+        dirname = self.get_checkpoint_dir()
+        if self.rank == 0 and not os.path.exists(dirname):
+            os.mkdir(dirname)
+        fname = os.path.join(
+            dirname, '%s_%d.npz' % (self.fname, self.count)
+        )
+        comm = self.comm if self.in_parallel else None
+        with profile_ctx('Solver.checkpoint'):
+            dump_checkpoint(fname, self.particles, self.get_state(), comm)
+            if self.rank == 0:
+                remove_old_checkpoints(dirname, self.checkpoint_keep)
+
+    def restore_checkpoint(self, filename):
+        """Restore the particle data and the solver state from the given
+        checkpoint file.  The particles must already be setup.  This is
+        only meant for serial runs, parallel runs should be restarted using
+        the ``--restart-file`` option of the application.
+        """
+        from pysph.solver.checkpoint import load_checkpoint
+        data = load_checkpoint(filename)
+        for pa in self.particles:
+            saved = data['arrays'][pa.name]
+            pa.resize(saved.get_number_of_particles())
+            for prop in saved.properties:
+                if prop in pa.properties:
+                    pa.get_carray(prop).set_data(saved.get(prop))
+            for const in saved.constants:
+                if const in pa.constants:
+                    pa.get_carray(const).set_data(saved.get(const))
+        self.set_state(data['solver_state'])
+        self.nnps.update()
+
+    def _reduce_if_needed(self):
+        reductions = self.reductions
+        if reductions is not None:
+            if reductions.fname is None:
+                reductions.fname = os.path.join(
+                    self.output_directory, self.fname + '_reductions.csv'
+                )
+            with profile_ctx('Solver.reductions'):
+                reductions.evaluate_if_needed(self)
+
+    def _checkpoint_if_needed(self):
+        if self.checkpoint_freq > 0 and \
+           self.count % self.checkpoint_freq == 0:
+            self.checkpoint()
+            self.barrier()
+
     def _dump_output_if_needed(self):
         """Dump output if needed while solve is running.
 
@@ -709,6 +951,11 @@ class Solver(object):
             self.dump_output()
             self.barrier()
 
+    def _reorder_particles_if_needed(self):
+        if self.reorder_freq > 0 and self.count % self.reorder_freq == 0:
+            with profile_ctx('NNPS.reorder_particles'):
+                self.nnps.reorder_particles()
+
     def _get_solver_data(self):
         if self._prev_dt is not None:
             dt = self._prev_dt/self._damping_factor
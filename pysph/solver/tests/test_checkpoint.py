@@ -0,0 +1,136 @@
+import os
+import shutil
+from os.path import join
+from tempfile import mkdtemp
+from unittest import TestCase, main
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import numpy as np
+
+from pysph.base.utils import get_particle_array
+from pysph.solver.checkpoint import (dump_checkpoint, get_checkpoint_files,
+                                     is_checkpoint, load_checkpoint,
+                                     load_latest_checkpoint,
+                                     remove_old_checkpoints)
+from pysph.solver.utils import dump
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self):
+        self.root = mkdtemp()
+        x = np.linspace(0, 1.0, 10)
+        self.pa = get_particle_array(name='fluid', x=x, u=2*x, au=3*x)
+        self.pa.add_constant('c', [1.0, 2.0])
+        # Only x is output normally.
+        self.pa.set_output_arrays(['x'])
+        self.state = dict(t=0.5, dt=0.01, count=50, prev_dt=None,
+                          damping_factor=1.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _dump(self, count):
+        fname = join(self.root, 'sim_%d.npz' % count)
+        state = dict(self.state, count=count)
+        dump_checkpoint(fname, [self.pa], state)
+        return fname
+
+    def test_dump_and_load_checkpoint(self):
+        # When
+        fname = self._dump(50)
+        data = load_checkpoint(fname)
+
+        # Then
+        self.assertTrue(is_checkpoint(fname))
+        self.assertEqual(data['solver_state'], self.state)
+        self.assertEqual(data['solver_data']['count'], 50)
+        fluid = data['arrays']['fluid']
+        for prop in ('x', 'u', 'au'):
+            self.assertTrue(np.all(fluid.get(prop) == self.pa.get(prop)))
+        self.assertTrue(np.all(fluid.c == [1.0, 2.0]))
+        self.assertFalse(os.path.exists(fname + '.tmp'))
+
+    def test_output_file_is_not_a_checkpoint(self):
+        # Given
+        fname = join(self.root, 'out_0.npz')
+        dump(fname, [self.pa], solver_data=dict(t=0, dt=0.1, count=0))
+
+        # When/Then
+        self.assertFalse(is_checkpoint(fname))
+        self.assertRaises(RuntimeError, load_checkpoint, fname)
+
+    def test_corrupt_data_is_detected(self):
+        # Given
+        fname = self._dump(50)
+        data = open(fname, 'rb').read()
+        x = self.pa.x.tobytes()
+        corrupt = data.replace(x, x[:-1] + b'\x01')
+        self.assertNotEqual(corrupt, data)
+        with open(fname, 'wb') as f:
+            f.write(corrupt)
+
+        # When/Then
+        self.assertRaises(RuntimeError, load_checkpoint, fname)
+
+    def test_latest_valid_checkpoint_is_loaded(self):
+        # Given
+        for count in (10, 20, 100):
+            self._dump(count)
+        with open(join(self.root, 'sim_100.npz'), 'wb') as f:
+            f.write(b'garbage')
+
+        # When
+        with mock.patch('pysph.solver.checkpoint.logger') as logger:
+            fname, data = load_latest_checkpoint(self.root)
+
+        # Then
+        self.assertEqual(fname, join(self.root, 'sim_20.npz'))
+        self.assertEqual(data['solver_state']['count'], 20)
+        self.assertEqual(logger.warning.call_count, 1)
+        self.assertEqual(logger.warning.call_args[0][1],
+                         join(self.root, 'sim_100.npz'))
+
+    def test_skipped_checkpoints_are_reported(self):
+        # Given
+        for count in (10, 20):
+            with open(join(self.root, 'sim_%d.npz' % count), 'wb') as f:
+                f.write(b'garbage')
+
+        # When/Then
+        with mock.patch('pysph.solver.checkpoint.logger'):
+            with self.assertRaises(RuntimeError) as cm:
+                load_latest_checkpoint(self.root)
+        self.assertIn('sim_20.npz, sim_10.npz', str(cm.exception))
+
+    def test_unexpected_errors_are_not_hidden(self):
+        # Given
+        self._dump(10)
+
+        # When/Then
+        with mock.patch('pysph.solver.checkpoint.load_checkpoint',
+                        side_effect=TypeError('bug')):
+            self.assertRaises(TypeError, load_latest_checkpoint, self.root)
+
+    def test_old_checkpoints_are_removed(self):
+        # Given
+        for count in (10, 20, 100, 200):
+            self._dump(count)
+
+        # When
+        remove_old_checkpoints(self.root, keep=2)
+
+        # Then
+        self.assertEqual(
+            get_checkpoint_files(self.root),
+            [join(self.root, 'sim_%d.npz' % i) for i in (100, 200)]
+        )
+        self.assertRaises(RuntimeError, load_latest_checkpoint,
+                          join(self.root, 'missing'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+from unittest import TestCase, main
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import numpy as np
+
+from pysph.base.kernels import CubicSpline
+from pysph.base.particle_array import get_remote_tag
+from pysph.base.utils import get_particle_array
+from pysph.solver.reductions import Probe, Reduction
+
+
+class TestReductions(TestCase):
+    def setUp(self):
+        dx = 0.05
+        x, y = np.mgrid[dx/2:1:dx, dx/2:1:dx]
+        x, y = x.ravel(), y.ravel()
+        self.pa = get_particle_array(
+            name='fluid', x=x, y=y, h=1.3*dx, m=dx*dx, p=2*x + y
+        )
+
+    def test_reduction_only_uses_real_particles(self):
+        # Given
+        x, y = self.pa.x, self.pa.y
+        n = len(x)
+        p = 2*x + y
+        p[-1] = 100.0
+        m = np.ones(n)*0.05**2
+        m[-1] = 1.0
+        tag = np.zeros(n, dtype=int)
+        tag[-1] = get_remote_tag()
+        # The remote particle is kept at the end of the array.
+        pa = get_particle_array(name='fluid', x=x, y=y, m=m, p=p, tag=tag)
+        self.assertEqual(pa.num_real_particles, n - 1)
+        self.assertEqual(pa.get_number_of_particles(real=False), n)
+
+        # When
+        p_max = Reduction('p_max', 'fluid', 'p', op='max').evaluate(pa)
+        mass = Reduction(
+            'mass', 'fluid', lambda pa: pa.get('m', only_real_particles=False)
+        ).evaluate(pa)
+
+        # Then
+        self.assertEqual(p_max, [np.max(2*x[:-1] + y[:-1])])
+        self.assertNotEqual(p_max, [np.max(p)])
+        self.assertAlmostEqual(mass[0], (n - 1)*0.05**2)
+        self.assertNotAlmostEqual(mass[0], np.sum(m))
+        self.assertRaises(RuntimeError, Reduction, 'a', 'fluid', 'p', 'avg')
+
+    def test_probe_interpolates_at_points(self):
+        # Given
+        xp, yp = [0.3, 0.5, 0.72], [0.4, 0.5, 0.61]
+        probe = Probe('p', 'fluid', 'p', x=xp, y=yp,
+                      kernel=CubicSpline(dim=2))
+
+        # When
+        result = probe.evaluate(self.pa)
+
+        # Then
+        self.assertEqual(probe.get_columns(), ['p_0', 'p_1', 'p_2'])
+        expected = 2*np.asarray(xp) + np.asarray(yp)
+        np.testing.assert_allclose(result, expected, atol=1e-3)
+
+        # When the particles move the NNPS is updated.
+        self.pa.x[:] += 0.1
+        self.pa.p[:] = 2*self.pa.x + self.pa.y
+        result = probe.evaluate(self.pa)
+
+        # Then
+        np.testing.assert_allclose(result, expected, atol=1e-3)
+
+    def test_probe_uses_the_global_smoothing_length_in_parallel(self):
+        # Given
+        probe = Probe('p', 'fluid', 'p', x=[0.5], y=[0.5],
+                      kernel=CubicSpline(dim=2))
+        h_global = 2.0*self.pa.h.max()
+
+        def _reduce(data, op):
+            # Another processor has particles with a larger h.
+            return h_global if op == 'max' else data
+
+        # When
+        with mock.patch('pysph.solver.reductions.mpi_reduce_array',
+                        side_effect=_reduce) as m:
+            result = probe.evaluate(self.pa, parallel=True)
+
+        # Then
+        self.assertEqual(m.call_args_list[0], mock.call(self.pa.h.max(),
+                                                        'max'))
+        np.testing.assert_allclose(probe.points.h, [h_global])
+        np.testing.assert_allclose(result, [1.5], atol=1e-3)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,9 +9,15 @@ try:
 except ImportError:
     import mock
 
+import os
+import shutil
+from tempfile import mkdtemp
+
 import numpy as np
 import numpy.testing as npt
 
+from pysph.base.utils import get_particle_array
+from pysph.solver.reductions import Reductions, load_reductions
 from pysph.solver.solver import Solver
 
 
@@ -108,5 +114,170 @@ class TestSolver(TestCase):
         )
 
 
+    def test_solver_reorders_particles_at_given_frequency(self):
+        # Given
+        dt = 0.1
+        tf = 1.0
+        solver = Solver(
+            integrator=self.integrator, tf=tf, dt=dt, adaptive_timestep=False
+        )
+        solver.set_reorder_freq(3)
+        solver.acceleration_eval = self.a_eval
+        solver.particles = []
+        solver.nnps = mock.Mock()
+        record = []
+        def _mock_reorder_particles():
+            record.append(solver.count)
+        solver.nnps.reorder_particles = mock.Mock(
+            side_effect=_mock_reorder_particles
+        )
+        solver.dump_output = mock.Mock()
+
+        # When
+        solver.solve(show_progress=False)
+
+        # Then
+        self.assertEqual(record, [3, 6, 9])
+
+    def test_solver_evaluates_reductions_at_given_frequency(self):
+        # Given
+        dt = 0.1
+        tf = 1.0
+        solver = Solver(
+            integrator=self.integrator, tf=tf, dt=dt, adaptive_timestep=False
+        )
+        solver.acceleration_eval = self.a_eval
+        solver.particles = [
+            get_particle_array(name='fluid', x=[0.0, 1.0], u=[1.0, 3.0])
+        ]
+        solver.dump_output = mock.Mock()
+        root = mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        fname = os.path.join(root, 'reductions.csv')
+        reductions = Reductions(fname=fname, freq=3, buffer_size=2)
+        reductions.add('u_max', 'fluid', 'u', op='max')
+        reductions.add('ke', 'fluid', lambda pa: 0.5*pa.u**2)
+        solver.set_reductions(reductions)
+
+        # When
+        solver.solve(show_progress=False)
+
+        # Then
+        data = load_reductions(fname)
+        self.assertEqual(sorted(data.keys()), ['count', 'ke', 't', 'u_max'])
+        npt.assert_array_equal(data['count'], [0, 3, 6, 9, 10])
+        npt.assert_array_almost_equal(data['t'], [0.0, 0.3, 0.6, 0.9, 1.0])
+        npt.assert_array_equal(data['u_max'], [3.0]*5)
+        npt.assert_array_equal(data['ke'], [5.0]*5)
+
+    def test_load_output_with_series_output(self):
+        # Given
+        solver = Solver(integrator=self.integrator, tf=1.0, dt=0.1)
+        root = mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        solver.output_directory = root
+        solver.fname = 'sim'
+        solver.set_series_output(True)
+        solver.particles = [
+            get_particle_array(name='fluid', x=[0.0, 1.0], u=[1.0, 3.0])
+        ]
+        for count in (0, 5):
+            solver.t, solver.count = 0.1*count, count
+            solver.dump_output()
+        solver.particles[0].u[:] = 0.0
+
+        # When
+        counts = solver.load_output('?')
+        solver.load_output('0')
+
+        # Then
+        self.assertEqual(counts, ['0', '5'])
+        self.assertEqual(solver.count, 0)
+        npt.assert_array_equal(solver.particles[0].u, [1.0, 3.0])
+        self.assertRaises(IOError, solver.load_output, '3')
+
+    def test_solver_closes_async_output_writer(self):
+        # Given
+        solver = Solver(integrator=self.integrator, tf=1.0, dt=0.1)
+        solver.set_async_output(True)
+        solver._solve = mock.Mock()
+        writer = solver._output_writer = mock.Mock()
+
+        # When
+        solver.solve(show_progress=False)
+
+        # Then
+        writer.close.assert_called_once_with()
+
+    def test_restore_checkpoint_restores_particles_and_state(self):
+        # Given
+        def _make_particles():
+            pa = get_particle_array(
+                name='fluid', x=[0.0, 1.0, 2.0], u=[1.0, 3.0, 5.0]
+            )
+            pa.add_constant('c', [1.0, 2.0])
+            return [pa]
+
+        solver = Solver(
+            integrator=self.integrator, tf=0.5, dt=0.1,
+            adaptive_timestep=False
+        )
+        solver.acceleration_eval = self.a_eval
+        solver.particles = _make_particles()
+        pa = solver.particles[0]
+
+        def _step(t, dt):
+            pa.x[:] += dt*pa.u
+            pa.u[:] += 1.0
+            pa.c[:] += 1.0
+        self.integrator.step.side_effect = _step
+        root = mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        solver.output_directory = root
+        solver.fname = 'sim'
+        solver.dump_output = mock.Mock()
+        solver.set_checkpoint(5, keep=1)
+        solver.solve(show_progress=False)
+        fname = os.path.join(solver.get_checkpoint_dir(), 'sim_5.npz')
+        self.assertEqual(os.listdir(solver.get_checkpoint_dir()),
+                         ['sim_5.npz'])
+
+        # When
+        new_solver = Solver(integrator=self.integrator, tf=1.0, dt=0.01)
+        new_solver.particles = _make_particles()
+        new_solver.nnps = mock.Mock()
+        new_solver.restore_checkpoint(fname)
+
+        # Then
+        new_pa = new_solver.particles[0]
+        for prop in pa.properties:
+            npt.assert_array_equal(new_pa.get(prop), pa.get(prop))
+        npt.assert_array_equal(new_pa.c, [6.0, 7.0])
+        npt.assert_array_almost_equal(new_pa.x, [1.5, 3.5, 5.5])
+        self.assertAlmostEqual(new_solver.t, solver.t)
+        self.assertAlmostEqual(new_solver.t, 0.5)
+        self.assertEqual(new_solver.dt, solver.dt)
+        self.assertEqual(new_solver.count, 5)
+        new_solver.nnps.update.assert_called_once_with()
+
+    def test_output_error_does_not_hide_solver_error(self):
+        # Given
+        solver = Solver(integrator=self.integrator, tf=1.0, dt=0.1)
+        solver.set_async_output(True)
+        solver._solve = mock.Mock(side_effect=ValueError('step failed'))
+        writer = solver._output_writer = mock.Mock()
+        writer.close.side_effect = RuntimeError('write failed')
+
+        # When/Then
+        with mock.patch('pysph.solver.solver.logger') as logger:
+            self.assertRaises(ValueError, solver.solve, show_progress=False)
+        writer.close.assert_called_once_with()
+        self.assertEqual(logger.exception.call_count, 1)
+
+        # When/Then
+        solver._solve = mock.Mock()
+        self.assertRaises(RuntimeError, solver.solve, show_progress=False)
+
+
 if __name__ == '__main__':
     main()
@@ -3,7 +3,7 @@ import shutil
 import os
 from os.path import join
 from tempfile import mkdtemp
-from pysph import has_h5py
+from pysph import has_h5py, has_parallel_h5py
 
 try:
     # This is for Python-2.6.x
@@ -11,8 +11,12 @@ try:
 except ImportError:
     from unittest import TestCase, main, skipUnless
 
-from pysph.base.utils import get_particle_array, get_particle_array_wcsph
-from pysph.solver.utils import dump, load, dump_v1, get_files
+from pysph.base.utils import (get_particle_array, get_particle_array_wcsph,
+                              get_particles_info)
+from pysph.solver.utils import (dump, load, dump_v1, get_files, iter_output,
+                                iter_output_parallel)
+from pysph.solver.output import (AsyncOutputWriter, ParallelHDFOutput,
+                                 SeriesOutput, get_series_entries)
 
 
 class TestGetFiles(TestCase):
@@ -48,6 +52,65 @@ class TestGetFiles(TestCase):
         shutil.rmtree(self.root)
 
 
+def _get_t_and_u_max(solver_data, fluid):
+    return solver_data['t'], fluid.u.max()
+
+
+class TestIterOutputParallel(TestCase):
+    def setUp(self):
+        self.root = mkdtemp()
+        self.files = []
+        for i in range(7):
+            x = np.linspace(0, 1.0, 10)
+            fluid = get_particle_array(name='fluid', x=x, u=x*i)
+            solid = get_particle_array(name='solid', x=x)
+            fname = join(self.root, 'sim_%d.npz' % i)
+            dump(fname, [fluid, solid], dict(t=0.1*i, dt=0.1, count=i))
+            self.files.append(fname)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_results_are_ordered_and_match_iter_output(self):
+        # Given
+        expect = [_get_t_and_u_max(sd, fluid)
+                  for sd, fluid in iter_output(self.files, 'fluid')]
+
+        for workers, prefetch in [(1, None), (2, None), (3, 1)]:
+            # When
+            result = list(iter_output_parallel(
+                self.files, _get_t_and_u_max, ['fluid'], workers=workers,
+                prefetch=prefetch
+            ))
+
+            # Then
+            self.assertEqual(result, expect)
+
+    def test_selects_arrays_and_properties(self):
+        # When
+        result = list(iter_output_parallel(
+            self.files, arrays=['fluid'], props=['x', 'u'], workers=2
+        ))
+
+        # Then
+        self.assertEqual(len(result), len(self.files))
+        for i, (solver_data, fluid) in enumerate(result):
+            self.assertEqual(solver_data['count'], i)
+            self.assertTrue('u' in fluid.properties)
+            self.assertFalse('v' in fluid.properties)
+            self.assertTrue(np.allclose(fluid.u, fluid.x*i))
+
+        # When
+        solver_data, arrays = next(iter_output_parallel(
+            self.files, props=['x'], workers=1
+        ))
+
+        # Then
+        self.assertEqual(sorted(arrays.keys()), ['fluid', 'solid'])
+        self.assertTrue('x' in arrays['solid'].properties)
+        self.assertFalse('u' in arrays['solid'].properties)
+
+
 class TestOutputNumpy(TestCase):
     def setUp(self):
         self.root = mkdtemp()
@@ -97,6 +160,37 @@ class TestOutputNumpy(TestCase):
         self.assertTrue(np.allclose(pa.x, pa1.x, atol=1e-14))
         self.assertTrue(np.allclose(pa.y, pa1.y, atol=1e-14))
 
+    def test_dump_and_load_with_reduced_precision(self):
+        # Given
+        x = np.linspace(0, 1.0, 1000)
+        pa = get_particle_array(name='fluid', x=x, y=2*x, u=x**2, p=1e5*x,
+                                rho=1000 + x)
+        precision = {'x': 1e-6, 'y': 'abs:1e-4', 'p': 'rel:1e-4',
+                     'u': 'float16', 'fluid.rho': 'float32'}
+        fname = self._get_filename('simple')
+        dump(fname, [pa], solver_data={}, detailed_output=True)
+        fname_p = self._get_filename('precision')
+
+        # When
+        dump(fname_p, [pa], solver_data={}, detailed_output=True,
+             precision=precision)
+        for lazy in (False, True):
+            data = load(fname_p, lazy=lazy)
+            pa1 = data['arrays']['fluid']
+
+            # Then
+            for prop in ('x', 'y', 'u', 'p', 'rho', 'tag'):
+                self.assertEqual(pa1.get(prop).dtype, pa.get(prop).dtype)
+            self.assertTrue(np.max(np.abs(pa1.x - x)) <= 1e-6)
+            self.assertTrue(np.max(np.abs(pa1.y - 2*x)) <= 1e-4)
+            self.assertTrue(np.max(np.abs(pa1.p - 1e5*x)) <= 10.0)
+            self.assertTrue(np.allclose(pa1.u, x**2, atol=1e-3))
+            self.assertTrue(np.allclose(pa1.rho, 1000 + x, rtol=1e-7))
+            self.assertTrue(np.all(pa1.tag == pa.tag))
+        self.assertTrue(os.stat(fname_p).st_size < os.stat(fname).st_size)
+        self.assertRaises(ValueError, dump, fname_p, [pa], {},
+                          precision={'x': 'rel:-1'})
+
     def test_dump_and_load_with_partial_data_dump(self):
         x = np.linspace(0, 1.0, 10)
         y = x*2.0
@@ -150,6 +244,179 @@ class TestOutputNumpy(TestCase):
         self.assertEqual(set(pa.output_property_arrays), set(output_arrays))
         self.assertEqual(set(pa1.output_property_arrays), set(output_arrays))
 
+    def test_load_selected_arrays_and_properties(self):
+        # Given
+        x = np.linspace(0, 1.0, 10)
+        fluid = get_particle_array(name='fluid', x=x, y=x*2.0, u=x*3.0)
+        solid = get_particle_array(name='solid', x=x)
+        fname = self._get_filename('simple')
+        dump(fname, [fluid, solid], solver_data={'dt': 1.0})
+
+        # When
+        data = load(fname, arrays=['fluid'], props=['x', 'u'])
+
+        # Then
+        self.assertListEqual(list(data['arrays'].keys()), ['fluid'])
+        pa1 = data['arrays']['fluid']
+        self.assertTrue(np.allclose(pa1.x, x, atol=1e-14))
+        self.assertTrue(np.allclose(pa1.u, x*3.0, atol=1e-14))
+        self.assertFalse('y' in pa1.properties)
+        self.assertEqual(pa1.num_real_particles, 10)
+
+    def test_lazy_load_reads_properties_on_demand(self):
+        # Given
+        x = np.linspace(0, 1.0, 10)
+        pa = get_particle_array_wcsph(name='fluid', x=x, y=x*2.0,
+                                      constants={'c1': 1.0})
+        pa.set_output_arrays(['x', 'y'])
+        fname = self._get_filename('simple')
+        fnamez = self._get_filename('simplez')
+        dump(fname, [pa], solver_data={'dt': 1.0})
+        dump(fnamez, [pa], solver_data={'dt': 1.0}, compress=True)
+
+        for f in (fname, fnamez):
+            # When
+            data = load(f, lazy=True)
+            pa1 = data['arrays']['fluid']
+
+            # Then
+            self.assertEqual(data['solver_data']['dt'], 1.0)
+            self.assertEqual(pa1._data, {})
+            self.assertTrue(np.allclose(pa1.x, x, atol=1e-14))
+            self.assertEqual(list(pa1._data.keys()), ['x'])
+            y, p = pa1.get('y', 'p')
+            self.assertTrue(np.allclose(y, x*2.0, atol=1e-14))
+            self.assertTrue(np.allclose(p, 0.0))
+            self.assertTrue(np.allclose(pa1.c1, 1.0))
+            self.assertEqual(pa1.get_number_of_particles(), 10)
+            pa2 = pa1.get_particle_array()
+            self.assertListEqual(list(sorted(pa.properties.keys())),
+                                 list(sorted(pa2.properties.keys())))
+            self.assertTrue(np.allclose(pa2.y, x*2.0, atol=1e-14))
+
+        if fname.endswith('npz'):
+            pa1 = load(fname, lazy=True)['arrays']['fluid']
+            self.assertTrue(isinstance(pa1.x, np.memmap))
+
+    def test_async_writer_writes_a_snapshot_of_the_data(self):
+        x = np.linspace(0, 1.0, 10)
+        pa = get_particle_array(name='fluid', x=x, y=x*2.0)
+        writer = AsyncOutputWriter(max_pending=1)
+        fnames = [self._get_filename('async_%d' % i) for i in range(3)]
+        for i, fname in enumerate(fnames):
+            writer.dump(fname, [pa], solver_data={'count': i})
+            # Change the data while the file may still be written.
+            pa.x[:] += 1.0
+        writer.close()
+
+        for i, fname in enumerate(fnames):
+            data = load(fname)
+            pa1 = data['arrays']['fluid']
+            self.assertEqual(data['solver_data']['count'], i)
+            self.assertTrue(np.allclose(pa1.x, x + i, atol=1e-14))
+            self.assertTrue(np.allclose(pa1.y, x*2.0, atol=1e-14))
+
+    def test_async_writer_reports_errors(self):
+        pa = get_particle_array(name='fluid', x=np.linspace(0, 1.0, 10))
+        writer = AsyncOutputWriter()
+        fname = join(self.root, 'does_not_exist', 'simple')
+        writer.dump(self._get_filename(fname), [pa], solver_data={})
+        self.assertRaises(RuntimeError, writer.flush)
+        # The error is only reported once.
+        writer.flush()
+        writer.close()
+
+
+class TestSeriesOutput(TestCase):
+    def setUp(self):
+        self.root = mkdtemp()
+        self.x = np.linspace(0, 1.0, 10)
+
+    def tearDown(self):
+        SeriesOutput.max_segment_size = 2**30
+        shutil.rmtree(self.root)
+
+    def _dump(self, count, u=None):
+        pa = get_particle_array(name='fluid', x=self.x,
+                                u=self.x*count if u is None else u)
+        fname = join(self.root, 'sim_%d.series' % count)
+        dump(fname, [pa], solver_data=dict(t=0.1*count, dt=0.1, count=count))
+
+    def test_snapshots_are_appended_and_loaded(self):
+        # When
+        for count in (0, 10, 20):
+            self._dump(count)
+
+        # Then
+        self.assertEqual(
+            sorted(os.listdir(self.root)), ['sim.series', 'sim.series.0']
+        )
+        files = get_files(self.root, 'sim')
+        self.assertEqual(
+            files, [join(self.root, 'sim_%d.series' % i) for i in (0, 10, 20)]
+        )
+        for i, (solver_data, fluid) in enumerate(iter_output(files, 'fluid')):
+            self.assertEqual(solver_data['count'], 10*i)
+            self.assertTrue(np.allclose(fluid.u, self.x*10*i, atol=1e-14))
+
+        data = load(files[1], props=['x'], lazy=True)
+        fluid = data['arrays']['fluid']
+        self.assertTrue(isinstance(fluid.x, np.memmap))
+        self.assertTrue(np.allclose(fluid.x, self.x, atol=1e-14))
+        self.assertFalse('u' in fluid.properties)
+        self.assertRaises(RuntimeError, load, join(self.root, 'sim_5.series'))
+
+    def test_new_segments_are_created(self):
+        # Given
+        SeriesOutput.max_segment_size = 1
+
+        # When
+        for count in range(3):
+            self._dump(count)
+
+        # Then
+        entries = get_series_entries(join(self.root, 'sim.series'))
+        self.assertEqual([e.segment for e in entries], [0, 1, 2])
+        for count in range(3):
+            fluid = load(join(self.root, 'sim_%d.series' % count))['arrays'][
+                'fluid']
+            self.assertTrue(np.allclose(fluid.u, self.x*count, atol=1e-14))
+
+    def test_later_snapshots_are_discarded_when_overwritten(self):
+        # Given
+        for count in (0, 10, 20):
+            self._dump(count)
+
+        # When
+        self._dump(10, u=np.ones_like(self.x))
+
+        # Then
+        entries = get_series_entries(join(self.root, 'sim.series'))
+        self.assertEqual([e.count for e in entries], [0, 10])
+        fluid = load(join(self.root, 'sim_10.series'))['arrays']['fluid']
+        self.assertTrue(np.allclose(fluid.u, 1.0, atol=1e-14))
+        last = entries[-1]
+        seg_size = os.stat(join(self.root, 'sim.series.0')).st_size
+        self.assertEqual(seg_size, last.offset + last.size)
+
+
+class TestParallelHdf5Output(TestCase):
+    @skipUnless(not has_parallel_h5py(), "h5py has MPI support")
+    def test_parallel_output_requires_h5py_with_mpi(self):
+        self.assertRaises(RuntimeError, ParallelHDFOutput, mpi_comm=object())
+
+    def test_parallel_output_does_not_support_reduced_precision(self):
+        # Given
+        root = mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        pa = get_particle_array(name='fluid', x=[1.0, 2.0])
+
+        # When/Then
+        with self.assertRaises(RuntimeError) as cm:
+            dump(join(root, 'simple.hdf5'), [pa], {}, mpi_comm=object(),
+                 parallel_io=True, precision={'x': 'float32'})
+        self.assertIn('precision', str(cm.exception))
+
 
 class TestOutputHdf5(TestOutputNumpy):
     @skipUnless(has_h5py(), "h5py module is not present")
@@ -184,6 +451,30 @@ class TestOutputNumpyV1(TestCase):
         self.assertTrue(np.allclose(pa.x, pa1.x, atol=1e-14))
         self.assertTrue(np.allclose(pa.y, pa1.y, atol=1e-14))
 
+    def test_load_works_with_dump_version2(self):
+        # Given
+        x = np.linspace(0, 1.0, 10)
+        pa = get_particle_array_wcsph(name='fluid', x=x, y=x*2.0)
+        pa.set_output_arrays(['x', 'y'])
+        particle_data = dict(get_particles_info([pa]))
+        particle_data['fluid']['arrays'] = pa.get_property_arrays(all=False)
+        fname = self._get_filename('simple')
+        np.savez(fname, version=2, particles=particle_data,
+                 solver_data={'dt': 1.0})
+
+        # When
+        data = load(fname)
+        pa1 = data['arrays']['fluid']
+        pa2 = load(fname, props=['y'], lazy=True)['arrays']['fluid']
+
+        # Then
+        self.assertEqual(data['solver_data']['dt'], 1.0)
+        self.assertListEqual(list(sorted(pa.properties.keys())),
+                             list(sorted(pa1.properties.keys())))
+        self.assertTrue(np.allclose(pa.x, pa1.x, atol=1e-14))
+        self.assertTrue(np.allclose(pa.y, pa2.y, atol=1e-14))
+        self.assertFalse('rho' in pa2.properties)
+
 
 if __name__ == '__main__':
     main()
@@ -3,6 +3,8 @@ Module contains some common functions.
 """
 
 # standard imports
+from collections import deque
+import multiprocessing
 import pickle
 import numpy
 import sys
@@ -10,7 +12,7 @@ import os
 
 from pysph.base.particle_array import ParticleArray
 from pysph.base.utils import get_particle_array, get_particles_info
-from pysph.solver.output import load, dump, output_formats
+from pysph.solver.output import load, dump, output_formats, get_series_files
 
 HAS_PBAR = True
 try:
@@ -385,6 +387,15 @@ def get_files(dirname=None, fname=None, endswith=output_formats):
     files = [f for f in files if f.startswith(fname) and f.endswith(endswith)]
     files = [os.path.join(path, f) for f in files]
 
+    # Replace any series index files with the snapshots in them.
+    _files = []
+    for f in files:
+        if f.endswith('.series'):
+            _files.extend(get_series_files(f))
+        else:
+            _files.append(f)
+    files = _files
+
     # sort the files
     def _key_func(arg):
         a = os.path.splitext(arg)[0]
@@ -431,6 +442,97 @@ def iter_output(files, *arrays):
             _arrays = [data['arrays'][x] for x in arrays]
             yield [solver_data] + _arrays
 
+def _load_and_apply(fname, func, arrays, props):
+    """Load the file and apply func to the (selected) data.  If func is None
+    the data is returned, as done by :py:func:`iter_output`.
+    """
+    data = load(fname, arrays=arrays, props=props)
+    solver_data, selected = data['solver_data'], data['arrays']
+    if arrays is None:
+        args = [solver_data, selected]
+    else:
+        args = [solver_data] + [selected[x] for x in arrays]
+    if func is None:
+        return args
+    else:
+        return func(*args)
+
+
+def iter_output_parallel(files, func=None, arrays=None, props=None,
+                         workers=None, prefetch=None):
+    """Load the given files and apply the function to each in a pool of
+    processes, yielding the results in the order of the files.
+
+    This is the parallel version of :py:func:`iter_output`.  The function
+    should accept the same arguments that :py:func:`iter_output` yields,
+    i.e. the solver data followed by either a dictionary of the arrays (if
+    `arrays` is None) or the requested arrays.  As the files are loaded in
+    other processes, `func` must be picklable, i.e. a function defined at
+    the top-level of a module.
+
+    Parameters
+    ----------
+
+    files : iterable
+        Iterates over the list of desired files.
+
+    func : callable
+        Function applied to the data of each file.  If None, the (selected)
+        data is returned.
+
+    arrays : sequence
+        Optional names of the arrays to pass to the function.
+
+    props : sequence
+        Optional names of the only properties to retain in the arrays (the
+        'tag' property is always retained).  This reduces the data
+        transferred between processes when `func` is None.
+
+    workers : int
+        Number of processes to use, defaults to the number of CPUs.  If 1,
+        the files are processed in this process.
+
+    prefetch : int
+        The maximum number of files being processed at any time, this bounds
+        the memory used.  Defaults to twice the number of workers.
+
+    Examples
+    --------
+
+    >>> def get_max_u(solver_data, fluid):
+    ...     return solver_data['t'], fluid.u.max()
+    >>> files = get_files('elliptical_drop_output')
+    >>> for t, u_max in iter_output_parallel(files, get_max_u, ['fluid'],
+    ...                                      props=['u']):
+    ...     print(t, u_max)
+
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if workers == 1:
+        for fname in files:
+            yield _load_and_apply(fname, func, arrays, props)
+        return
+
+    if prefetch is None:
+        prefetch = 2*workers
+    prefetch = max(prefetch, 1)
+    pool = multiprocessing.Pool(workers)
+    pending = deque()
+    try:
+        for fname in files:
+            pending.append(pool.apply_async(
+                _load_and_apply, (fname, func, arrays, props)
+            ))
+            if len(pending) >= prefetch:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def _sort_key(arg):
     a = os.path.splitext(arg)[0]
     return int(a[a.rfind('_')+1:])
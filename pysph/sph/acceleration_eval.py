@@ -86,11 +86,15 @@ class MegaGroup(object):
         all_eqs is a Group of all equations having this destination.
 
     This is what is stored in the `data` attribute.
+
+    The sub-groups of a group that caches the pairs also have `cache_pairs`
+    set.
     """
-    def __init__(self, group, group_cls):
+    def __init__(self, group, group_cls, cache_pairs=False):
         self._orig_group = group
         self.Group = group_cls
         self._copy_props(group)
+        self.cache_pairs = cache_pairs or group.cache_pairs
         self.data = self._make_data(group)
 
     def get_converged_condition(self):
@@ -105,7 +109,8 @@ class MegaGroup(object):
         equations = group.equations
 
         if group.has_subgroups:
-            return [MegaGroup(g, self.Group) for g in equations]
+            return [MegaGroup(g, self.Group, self.cache_pairs)
+                    for g in equations]
 
         dest_list = []
         for equation in equations:
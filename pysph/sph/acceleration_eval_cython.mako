@@ -6,7 +6,7 @@ ${' '*4*level}${l}
 % endfor
 </%def>
 
-<%def name="do_group(helper, group, level=0)" buffered="True">
+<%def name="do_group(helper, group, level=0, label='')" buffered="True">
 #######################################################################
 ## Iterate over destinations in this group.
 #######################################################################
@@ -26,8 +26,11 @@ dst_array_index = dst.index
 #######################################################################
 % if all_eqs.has_initialize():
 # Initialization for destination ${dest}.
-for d_idx in range(NP_DEST):
-    ${indent(all_eqs.get_initialize_code(helper.object.kernel), 1)}
+${helper.get_parallel_block()}
+    thread_id = threadid()
+    ${indent(all_eqs.get_variable_array_setup(), 1)}
+    for d_idx in prange(NP_DEST):
+        ${indent(all_eqs.get_initialize_code(helper.object.kernel), 2)}
 % endif
 #######################################################################
 ## Handle all the equations that do not have a source.
@@ -35,8 +38,11 @@ for d_idx in range(NP_DEST):
 % if len(eqs_with_no_source.equations) > 0:
 % if eqs_with_no_source.has_loop():
 # SPH Equations with no sources.
-for d_idx in range(NP_DEST):
-    ${indent(eqs_with_no_source.get_loop_code(helper.object.kernel), 1)}
+${helper.get_parallel_block()}
+    thread_id = threadid()
+    ${indent(eqs_with_no_source.get_variable_array_setup(), 1)}
+    for d_idx in prange(NP_DEST):
+        ${indent(eqs_with_no_source.get_loop_code(helper.object.kernel), 2)}
 % endif
 % endif
 #######################################################################
@@ -54,11 +60,76 @@ ${indent(helper.get_src_array_setup(source, eq_group), 0)}
 src_array_index = src.index
 
 % if eq_group.has_loop():
+<% cache_idx = helper.get_pair_cache_index(eq_group) %>
 #######################################################################
 ## Iterate over destination particles.
 #######################################################################
 nnps.set_context(src_array_index, dst_array_index)
+% if helper.config.profile:
+_profile_t0 = timer()
+% endif
 
+% if source == dest and eq_group.has_symmetric():
+${helper.get_parallel_block()}
+    thread_id = threadid()
+    ${indent(eq_group.get_variable_array_setup(), 1)}
+    for _chunk in prange(_n_chunks):
+        ###############################################################
+        ## Each chunk owns a contiguous range of destinations and pairs
+        ## within it are evaluated once for the symmetric equations.
+        ###############################################################
+        _lo = (_chunk*NP_DEST)//_n_chunks
+        _hi = ((_chunk + 1)*NP_DEST)//_n_chunks
+        for d_idx in range(_lo, _hi):
+            nnps.get_nearest_neighbors(d_idx, <UIntArray>self.nbrs[thread_id])
+            for nbr_idx in range((<UIntArray>self.nbrs[thread_id]).length):
+                s_idx = <int>((<UIntArray>self.nbrs[thread_id]).data[nbr_idx])
+                ${indent(eq_group.get_symmetric_loop_code(helper.object.kernel), 4)}
+% elif cache_idx is not None:
+###################################################################
+## Store the neighbors and the cached precomputed symbols in the
+## first iteration and read them back in the others.
+###################################################################
+_cache_offsets = <LongArray>self._cache_offsets[${cache_idx}]
+_cache_nbrs = <UIntArray>self._cache_nbrs[${cache_idx}]
+_cache_data = <DoubleArray>self._cache_data[${cache_idx}]
+if _iteration_count == 1:
+    _cache_offsets.resize(NP_DEST + 1)
+    _pair_offsets = _cache_offsets.data
+    ${helper.get_parallel_block()}
+        thread_id = threadid()
+        for d_idx in prange(NP_DEST):
+            nnps.get_nearest_neighbors(d_idx, <UIntArray>self.nbrs[thread_id])
+            _pair_offsets[d_idx + 1] = (<UIntArray>self.nbrs[thread_id]).length
+    _pair_offsets[0] = 0
+    for d_idx in range(NP_DEST):
+        _pair_offsets[d_idx + 1] += _pair_offsets[d_idx]
+    _cache_nbrs.resize(_pair_offsets[NP_DEST])
+    _cache_data.resize(_pair_offsets[NP_DEST]*${eq_group.get_pair_cache_size()})
+    _pair_nbrs = _cache_nbrs.data
+    _pair_data = _cache_data.data
+    ${helper.get_parallel_block()}
+        thread_id = threadid()
+        ${indent(eq_group.get_variable_array_setup(), 2)}
+        for d_idx in prange(NP_DEST):
+            nnps.get_nearest_neighbors(d_idx, <UIntArray>self.nbrs[thread_id])
+            for nbr_idx in range((<UIntArray>self.nbrs[thread_id]).length):
+                s_idx = <int>((<UIntArray>self.nbrs[thread_id]).data[nbr_idx])
+                _pair_idx = _pair_offsets[d_idx] + nbr_idx
+                _pair_nbrs[_pair_idx] = s_idx
+                ${indent(eq_group.get_pair_cache_store_code(helper.object.kernel), 4)}
+else:
+    _pair_offsets = _cache_offsets.data
+    _pair_nbrs = _cache_nbrs.data
+    _pair_data = _cache_data.data
+    ${helper.get_parallel_block()}
+        thread_id = threadid()
+        ${indent(eq_group.get_variable_array_setup(), 2)}
+        for d_idx in prange(NP_DEST):
+            for _pair_idx in range(_pair_offsets[d_idx], _pair_offsets[d_idx + 1]):
+                s_idx = <int>_pair_nbrs[_pair_idx]
+                ${indent(eq_group.get_pair_cache_load_code(helper.object.kernel), 4)}
+% else:
 ${helper.get_parallel_block()}
     thread_id = threadid()
     ${indent(eq_group.get_variable_array_setup(), 1)}
@@ -74,6 +145,13 @@ ${helper.get_parallel_block()}
             ## Iterate over the equations for the same set of neighbors.
             ###########################################################
             ${indent(eq_group.get_loop_code(helper.object.kernel), 3)}
+% endif
+% if helper.config.profile:
+add_profile_info(
+    "${helper.get_loop_profile_name(label, dest, source, eq_group)}",
+    timer() - _profile_t0
+)
+% endif
 
 % endif ## if eq_group.has_loop():
 # Source ${source} done.
@@ -84,8 +162,11 @@ ${helper.get_parallel_block()}
 ###################################################################
 % if all_eqs.has_post_loop():
 # Post loop for destination ${dest}.
-for d_idx in range(NP_DEST):
-    ${indent(all_eqs.get_post_loop_code(helper.object.kernel), 1)}
+${helper.get_parallel_block()}
+    thread_id = threadid()
+    ${indent(all_eqs.get_variable_array_setup(), 1)}
+    for d_idx in prange(NP_DEST):
+        ${indent(all_eqs.get_post_loop_code(helper.object.kernel), 2)}
 % endif
 
 ###################################################################
@@ -133,36 +214,16 @@ from pysph.base.reduce_array import mpi_reduce_array as parallel_reduce_array
 % endif
 
 from pysph.base.nnps import get_number_of_threads
+% if helper.config.profile:
+from pysph.base.profiler import add_profile_info, timer
+% endif
 from pyzoltan.core.carray cimport (DoubleArray, FloatArray, IntArray, LongArray, UIntArray,
     aligned, aligned_free, aligned_malloc)
 
 ${helper.get_header()}
 
 # #############################################################################
-cdef class ParticleArrayWrapper:
-    cdef public int index
-    cdef public ParticleArray array
-    ${indent(helper.get_array_decl_for_wrapper(), 1)}
-    cdef public str name
-
-    def __init__(self, pa, index):
-        self.index = index
-        self.set_array(pa)
-
-    cpdef set_array(self, pa):
-        self.array = pa
-        props = set(pa.properties.keys())
-        props = props.union(['tag', 'pid', 'gid'])
-        for prop in props:
-            setattr(self, prop, pa.get_carray(prop))
-        for prop in pa.constants.keys():
-            setattr(self, prop, pa.get_carray(prop))
-
-        self.name = pa.name
-
-    cpdef long size(self, bint real=False):
-        return self.array.get_number_of_particles(real)
-
+${helper.get_particle_array_wrapper()}
 
 # #############################################################################
 cdef class AccelerationEval:
@@ -172,6 +233,10 @@ cdef class AccelerationEval:
     cdef public int n_threads
     cdef public list _nbr_refs
     cdef void **nbrs
+    # Cached pairs of iterative groups.
+    cdef public list _cache_offsets, _cache_nbrs, _cache_data
+    # Iteration limits of each group.
+    cdef public list _max_iterations, _min_iterations
     # CFL time step conditions
     cdef public double dt_cfl, dt_force, dt_viscous
     ${indent(helper.get_kernel_defs(), 1)}
@@ -194,6 +259,10 @@ cdef class AccelerationEval:
             self.nbrs[i] = <void*>_arr
             self._nbr_refs.append(_arr)
 
+        self._cache_offsets = [LongArray() for i in range(${helper.get_number_of_pair_caches()})]
+        self._cache_nbrs = [UIntArray() for i in range(${helper.get_number_of_pair_caches()})]
+        self._cache_data = [DoubleArray() for i in range(${helper.get_number_of_pair_caches()})]
+
         ${indent(helper.get_kernel_init(), 2)}
         ${indent(helper.get_equation_init(), 2)}
 
@@ -216,6 +285,26 @@ cdef class AccelerationEval:
 
         cdef int max_iterations, min_iterations, _iteration_count
 
+        # Used for the symmetric evaluation of pairs.
+        cdef long _chunk, _lo, _hi, _n_chunks
+        cdef bint _skip
+        cdef double _tmp
+
+        # Used for the cached pairs of iterative groups.
+        cdef LongArray _cache_offsets
+        cdef UIntArray _cache_nbrs
+        cdef DoubleArray _cache_data
+        cdef long* _pair_offsets
+        cdef unsigned int* _pair_nbrs
+        cdef double* _pair_data
+        cdef double* _pair_ptr
+        cdef long _pair_idx
+        % if helper.config.use_openmp:
+        _n_chunks = self.n_threads
+        % else:
+        _n_chunks = 1
+        % endif
+
         #######################################################################
         ##  Declare all the arrays.
         #######################################################################
@@ -227,6 +316,7 @@ cdef class AccelerationEval:
         # Variables.\
 
         cdef int src_array_index, dst_array_index
+        cdef double _profile_t0, _profile_group
         ${indent(helper.get_variable_declarations(), 2)}
         #######################################################################
         ## Iterate over groups:
@@ -239,9 +329,17 @@ cdef class AccelerationEval:
         % if len(group.data) > 0: # No equations in this group.
         # ---------------------------------------------------------------------
         # Group ${g_idx}.
+        % if helper.config.profile:
+        _profile_group = timer()
+        % endif
         % if group.iterate:
+        % if helper.config.specialize:
         max_iterations = ${group.max_iterations}
         min_iterations = ${group.min_iterations}
+        % else:
+        max_iterations = self._max_iterations[${g_idx}]
+        min_iterations = self._min_iterations[${g_idx}]
+        % endif
         _iteration_count = 1
         while True:
         % else:
@@ -251,11 +349,11 @@ cdef class AccelerationEval:
             % if group.has_subgroups:
             % for sg_idx, sub_group in enumerate(group.data):
             # Doing subgroup ${sg_idx}
-            ${indent(do_group(helper, sub_group, 3), 3)}
+            ${indent(do_group(helper, sub_group, 3, 'Group %d.%d' % (g_idx, sg_idx)), 3)}
             % endfor
 
             % else:
-            ${indent(do_group(helper, group, 3), 3)}
+            ${indent(do_group(helper, group, 3, 'Group %d' % g_idx), 3)}
             % endif
             #######################################################################
             ## Break the iteration for the group.
@@ -268,6 +366,9 @@ cdef class AccelerationEval:
             _iteration_count += 1
             % endif
 
+        % if helper.config.profile:
+        add_profile_info("Group ${g_idx}", timer() - _profile_group)
+        % endif
         # Group ${g_idx} done.
         # ---------------------------------------------------------------------
         % endif # (if len(group.data) > 0)
@@ -1,11 +1,13 @@
 from collections import defaultdict
 from os.path import dirname, join
+from textwrap import dedent
 
 from mako.template import Template
 from pyzoltan.core import carray
 
 from pysph.base.config import get_config
-from pysph.base.cython_generator import CythonGenerator, KnownType
+from pysph.base.cython_generator import (CythonGenerator, KnownType,
+                                         get_common_constants)
 from pysph.base.ext_module import ExtModule
 
 
@@ -53,10 +55,15 @@ def get_all_array_names(particle_arrays):
        {'DoubleArray': {'x'}, 'IntArray': {'pid', 'tag'}, 'UIntArray': {'gid'}}
     """
     props = defaultdict(set)
+    types = {}
     for array in particle_arrays:
         for properties in (array.properties, array.constants):
             for name, arr in properties.items():
                 a_type = arr.__class__.__name__
+                if types.setdefault(name, a_type) != a_type:
+                    msg = 'Property %s has different types (%s, %s) in '\
+                          'the particle arrays.' % (name, types[name], a_type)
+                    raise RuntimeError(msg)
                 props[a_type].add(name)
     return dict(props)
 
@@ -114,6 +121,28 @@ class AccelerationEvalCythonHelper(object):
         )
         self._ext_mod = None
         self._module = None
+        self._cached_loops = self._get_cached_loops()
+
+    ##########################################################################
+    # Non-public interface.
+    ##########################################################################
+    def _get_cached_loops(self):
+        """Return the groups of equations for a destination and source whose
+        pairs are cached, the index in this list identifies the cache.
+        """
+        loops = []
+        for group in self.object.mega_groups:
+            groups = group.data if group.has_subgroups else [group]
+            for g in groups:
+                if not g.cache_pairs:
+                    continue
+                for dest, (eqs, sources, all_eqs) in g.data.items():
+                    for source, eq_group in sources.items():
+                        symmetric = (source == dest and
+                                     eq_group.has_symmetric())
+                        if eq_group.has_loop() and not symmetric:
+                            loops.append(eq_group)
+        return loops
 
     ##########################################################################
     # Public interface.
@@ -131,13 +160,26 @@ class AccelerationEvalCythonHelper(object):
             object.kernel, object.all_group.equations,
             object.particle_arrays
         )
+        # The iteration limits of the groups are set at runtime unless the
+        # code is specialized.
+        acceleration_eval._max_iterations = [
+            g.max_iterations for g in object.mega_groups
+        ]
+        acceleration_eval._min_iterations = [
+            g.min_iterations for g in object.mega_groups
+        ]
         object.set_compiled_object(acceleration_eval)
 
-    def compile(self, code):
+    def get_ext_module(self, code):
+        """Return the ExtModule for the given code without building it.
+        """
         # Note, we do not add carray or particle_array as nnps_base would
         # have been rebuilt anyway if they changed.
         depends = ["pysph.base.nnps_base"]
-        self._ext_mod = ExtModule(code, verbose=True, depends=depends)
+        return ExtModule(code, verbose=True, depends=depends)
+
+    def compile(self, code):
+        self._ext_mod = self.get_ext_module(code)
         self._module = self._ext_mod.load()
         return self._module
 
@@ -156,6 +198,37 @@ class AccelerationEvalCythonHelper(object):
             )
         return '\n'.join(decl)
 
+    def get_particle_array_wrapper(self):
+        """Return the code for the ParticleArrayWrapper class, this is also
+        defined in the integrator module.
+        """
+        decl = self.get_array_decl_for_wrapper().replace('\n', '\n    ')
+        return dedent('''\
+            cdef class ParticleArrayWrapper:
+                cdef public int index
+                cdef public ParticleArray array
+                {decl}
+                cdef public str name
+
+                def __init__(self, pa, index):
+                    self.index = index
+                    self.set_array(pa)
+
+                cpdef set_array(self, pa):
+                    self.array = pa
+                    props = set(pa.properties.keys())
+                    props = props.union(['tag', 'pid', 'gid'])
+                    for prop in props:
+                        setattr(self, prop, pa.get_carray(prop))
+                    for prop in pa.constants.keys():
+                        setattr(self, prop, pa.get_carray(prop))
+
+                    self.name = pa.name
+
+                cpdef long size(self, bint real=False):
+                    return self.array.get_number_of_particles(real)
+            ''').format(decl=decl)
+
     def get_header(self):
         object = self.object
         headers = []
@@ -167,7 +240,10 @@ class AccelerationEvalCythonHelper(object):
 
         # Kernel wrappers.
         cg = CythonGenerator(known_types=self.known_types)
-        cg.parse(object.kernel)
+        constants = None
+        if self.config.specialize:
+            constants = get_common_constants([object.kernel])
+        cg.parse(object.kernel, constants=constants)
         headers.append(cg.get_code())
 
         # Equation wrappers.
@@ -229,6 +305,27 @@ class AccelerationEvalCythonHelper(object):
         else:
             return "if True: # Placeholder used for OpenMP."
 
+    def get_loop_profile_name(self, label, dest, source, eq_group):
+        """Name of the timer for the loop over the given destination and
+        source, this also lists the equations evaluated in the loop.
+        """
+        names = ', '.join(eq.name for eq in eq_group.equations
+                          if hasattr(eq, 'loop'))
+        return '{label}: {dest} <- {source} ({names})'.format(
+            label=label, dest=dest, source=source, names=names
+        )
+
+    def get_number_of_pair_caches(self):
+        return len(self._cached_loops)
+
+    def get_pair_cache_index(self, eq_group):
+        """Return the index of the pair cache for the given group of equations
+        or None if its pairs are not cached.
+        """
+        for i, g in enumerate(self._cached_loops):
+            if g is eq_group:
+                return i
+
     def get_particle_array_names(self):
         parrays = [pa.name for pa in self.object.particle_arrays]
         return ', '.join(parrays)
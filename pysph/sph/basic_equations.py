@@ -174,6 +174,8 @@ class ContinuityEquation(Equation):
     \nabla_a W_{ab}`
 
     """
+    symmetric = True
+
     def initialize(self, d_idx, d_arho):
         d_arho[d_idx] = 0.0
 
@@ -19,7 +19,9 @@ from textwrap import dedent
 
 # Local imports.
 from pysph.base.ast_utils import get_symbols
-from pysph.base.cython_generator import CythonGenerator, KnownType
+from pysph.base.config import get_config
+from pysph.base.cython_generator import (CythonGenerator, KnownType,
+                                         get_common_constants)
 from pysph.base.translator import OpenCLConverter
 
 
@@ -267,6 +269,20 @@ def precomputed_symbols():
     return c
 
 
+# Precomputed symbols that change sign when the destination and source are
+# swapped.
+ANTISYMMETRIC_SYMBOLS = ('XIJ', 'VIJ', 'DWIJ')
+
+# Precomputed symbols that are exchanged with their partner when the
+# destination and source are swapped, vectors also change sign.
+SYMMETRIC_PARTNERS = {'WI': 'WJ', 'WJ': 'WI', 'GHI': 'GHJ', 'GHJ': 'GHI',
+                      'DWI': 'DWJ', 'DWJ': 'DWI'}
+
+# Properties that must not change within an iterative group that caches the
+# pairs, the precomputed symbols that only depend on these are cached.
+PAIR_CACHE_PROPS = ('x', 'y', 'z', 'h')
+
+
 def sort_precomputed(precomputed, all_pre_comp):
     """Sorts the precomputed equations in the given dictionary as per the
     dependencies of the symbols and returns an ordered dict.
@@ -356,6 +372,15 @@ def get_init_args(obj, method, ignore=None):
 ##############################################################################
 class Equation(object):
 
+    # Set this to True (on the class or an instance) to evaluate the `loop`
+    # only once per pair of particles when the source is the destination.
+    # The loop is then also called with the destination and source indices
+    # swapped (and the precomputed symbols adjusted accordingly) to update
+    # the neighbor.  This is only valid when the loop merely updates the
+    # destination particle and does not depend on the order in which the
+    # neighbors are visited.  Only the Cython backend supports this.
+    symmetric = False
+
     ##########################################################################
     # `object` interface.
     ##########################################################################
@@ -405,7 +430,7 @@ class Group(object):
     pre_comp = precomputed_symbols()
 
     def __init__(self, equations, real=True, update_nnps=False, iterate=False,
-                 max_iterations=1, min_iterations=0):
+                 max_iterations=1, min_iterations=0, cache_pairs=False):
         """Constructor.
 
         Parameters
@@ -434,6 +459,16 @@ class Group(object):
             specifies the minimum number of times this group should be
             iterated.
 
+        cache_pairs: bool
+            only valid for iterative groups. If True, the neighbors and the
+            precomputed symbols that only depend on the positions and
+            smoothing lengths (XIJ, RIJ, WIJ, DWIJ etc.) are stored on the
+            first iteration and read back on the subsequent iterations
+            instead of finding the neighbors and evaluating the kernel
+            again.  The positions and smoothing lengths must therefore not
+            change inside the group.  Loops that are evaluated symmetrically
+            are not cached.  This is only supported by the Cython backend.
+
         Notes
         -----
 
@@ -453,12 +488,22 @@ class Group(object):
         self.iterate = iterate
         self.max_iterations = max_iterations
         self.min_iterations = min_iterations
+        self.cache_pairs = cache_pairs
 
         only_groups = [x for x in equations if isinstance(x, Group)]
         if (len(only_groups) > 0) and (len(only_groups) != len(equations)):
             raise ValueError(
                 'All elements must be Groups if you use sub groups.'
             )
+        if cache_pairs:
+            if not iterate:
+                raise ValueError(
+                    'cache_pairs can only be used with iterative groups.'
+                )
+            if update_nnps or any(g.update_nnps for g in only_groups):
+                raise ValueError(
+                    'cache_pairs cannot be used when updating the NNPS.'
+                )
 
         # This group has only sub-groups.
         self.has_subgroups = len(only_groups) > 0
@@ -497,6 +542,12 @@ class Group(object):
                 all_args.update(args)
         all_args.discard('self')
 
+        # Symmetric equations need the symbols of the neighbor as well.
+        if any(getattr(eq, 'symmetric', False) for eq in self.equations):
+            for sym in list(all_args):
+                if sym in SYMMETRIC_PARTNERS:
+                    all_args.add(SYMMETRIC_PARTNERS[sym])
+
         pre = self.pre_comp
         precomputed = dict((s, pre[s]) for s in all_args if s in pre)
 
@@ -553,6 +604,21 @@ class Group(object):
         self.dest_arrays = dest_arrays
         return src_arrays, dest_arrays
 
+    def get_cached_symbols(self):
+        """Return the precomputed symbols that only depend on the positions
+        and smoothing lengths, these are stored when the pairs are cached.
+        """
+        cached = []
+        for sym, cb in self.precomputed.items():
+            props = set(x[2:] for x in
+                        itertools.chain(cb.src_arrays, cb.dest_arrays))
+            depends = [x for x in cb.symbols if x in self.pre_comp
+                       and x != sym]
+            if props.issubset(PAIR_CACHE_PROPS) and \
+               all(x in cached for x in depends):
+                cached.append(sym)
+        return cached
+
     def get_converged_condition(self):
         if self.has_subgroups:
             code = [g.get_converged_condition() for g in self.equations]
@@ -603,6 +669,13 @@ class Group(object):
     def has_reduce(self):
         return self._has_code('reduce')
 
+    def has_symmetric(self):
+        """Return True if any equation with a loop is to be evaluated
+        symmetrically.
+        """
+        return any(eq.symmetric for eq in self.equations
+                   if hasattr(eq, 'loop'))
+
 
 class CythonGroup(Group):
     ##########################################################################
@@ -639,6 +712,20 @@ class CythonGroup(Group):
                     pass
         return '\n'.join(decl)
 
+    def _get_call(self, eq, kind, swap=False):
+        args = inspect.getargspec(getattr(eq, kind)).args
+        if 'self' in args:
+            args.remove('self')
+        if kind == 'reduce':
+            args = ['dst.array']
+        if swap:
+            swapped = {'d_idx': 's_idx', 's_idx': 'd_idx'}
+            args = [swapped.get(x, x) for x in args]
+        call_args = ', '.join(args)
+        return 'self.{eq_name}.{method}({args})'.format(
+            eq_name=eq.var_name, method=kind, args=call_args
+        )
+
     def _get_code(self, kind='loop'):
         assert kind in ('initialize', 'loop', 'post_loop', 'reduce')
         # We assume here that precomputed quantities are only relevant
@@ -653,19 +740,46 @@ class CythonGroup(Group):
         for eq in self.equations:
             meth = getattr(eq, kind, None)
             if meth is not None:
-                args = inspect.getargspec(meth).args
-                if 'self' in args:
-                    args.remove('self')
-                if kind == 'reduce':
-                    args = ['dst.array']
-                call_args = ', '.join(args)
-                c = 'self.{eq_name}.{method}({args})'\
-                    .format(eq_name=eq.var_name, method=kind, args=call_args)
-                code.append(c)
+                code.append(self._get_call(eq, kind))
         if len(code) > 0:
             code.append('')
         return '\n'.join(pre + code)
 
+    def _get_swap_code(self):
+        """Code to change the precomputed symbols to those seen by the
+        source when the destination and source are swapped.
+        """
+        code = []
+        for sym in self.precomputed:
+            if sym in ANTISYMMETRIC_SYMBOLS:
+                code.extend('{s}[{i}] = -{s}[{i}]'.format(s=sym, i=i)
+                            for i in range(3))
+        for sym in ('WI', 'GHI'):
+            if sym in self.precomputed:
+                other = SYMMETRIC_PARTNERS[sym]
+                code.extend(['_tmp = %s' % sym,
+                             '%s = %s' % (sym, other),
+                             '%s = _tmp' % other])
+        if 'DWI' in self.precomputed:
+            for i in range(3):
+                code.extend(['_tmp = DWI[%d]' % i,
+                             'DWI[%d] = -DWJ[%d]' % (i, i),
+                             'DWJ[%d] = -_tmp' % i])
+        return code
+
+    def _get_cached_values(self):
+        """Names of the values stored for each cached pair, the components
+        of the vectors are stored separately.
+        """
+        values = []
+        for sym in self.get_cached_symbols():
+            value = self.context[sym]
+            if isinstance(value, (list, tuple)):
+                values.extend('%s[%d]' % (sym, i) for i in range(len(value)))
+            else:
+                values.append(sym)
+        return values
+
     def _set_kernel(self, code, kernel):
         if kernel is not None:
             k_func = 'self.kernel.kernel'
@@ -717,6 +831,86 @@ class CythonGroup(Group):
         code = self._get_code(kind='loop')
         return self._set_kernel(code, kernel)
 
+    def get_symmetric_loop_code(self, kernel=None):
+        """Return the loop code for a source that is also the destination
+        where the symmetric equations are evaluated once per pair.
+
+        The generated code expects the destination to be in the range
+        ``[_lo, _hi)`` that is owned by the current thread.  A pair of
+        particles that both lie in this range is evaluated when the
+        destination has the smaller index, the source is then updated by
+        calling the loop with the indices swapped.  All other pairs are
+        evaluated from both sides as usual, this ensures that a thread only
+        writes to the particles that it owns.
+        """
+        symmetric, others = [], []
+        for eq in self.equations:
+            if hasattr(eq, 'loop'):
+                if eq.symmetric:
+                    symmetric.append(eq)
+                else:
+                    others.append(eq)
+
+        code = ['# Pairs with s_idx < d_idx in [_lo, _hi) are done by s_idx.',
+                '_skip = s_idx >= _lo and s_idx < d_idx']
+        if len(others) == 0:
+            code.extend(['if _skip:', '    continue'])
+        code.extend(cb.code.strip() for cb in self.precomputed.values())
+        code.extend(self._get_call(eq, 'loop') for eq in others)
+
+        pair = [self._get_call(eq, 'loop') for eq in symmetric]
+        pair.append('if s_idx > d_idx and s_idx < _hi:')
+        swapped = self._get_swap_code() + [
+            self._get_call(eq, 'loop', swap=True) for eq in symmetric
+        ]
+        pair.extend('    ' + x for x in swapped)
+        if len(others) > 0:
+            code.append('if not _skip:')
+            code.extend('    ' + x for x in pair)
+        else:
+            code.extend(pair)
+        code.append('')
+        return self._set_kernel('\n'.join(code), kernel)
+
+    def get_pair_cache_size(self):
+        """Return the number of values stored for each cached pair.
+        """
+        return len(self._get_cached_values())
+
+    def get_pair_cache_store_code(self, kernel=None):
+        """Return the loop code that also stores the cached precomputed
+        symbols of the pair with index ``_pair_idx`` in ``_pair_data``.
+        """
+        code = [cb.code.strip() for cb in self.precomputed.values()]
+        values = self._get_cached_values()
+        if len(values) > 0:
+            code.append('_pair_ptr = &_pair_data[_pair_idx*%d]' % len(values))
+            code.extend('_pair_ptr[%d] = %s' % (i, value)
+                        for i, value in enumerate(values))
+        code.extend(self._get_call(eq, 'loop') for eq in self.equations
+                    if hasattr(eq, 'loop'))
+        code.append('')
+        return self._set_kernel('\n'.join(code), kernel)
+
+    def get_pair_cache_load_code(self, kernel=None):
+        """Return the loop code that reads the cached precomputed symbols of
+        the pair with index ``_pair_idx`` from ``_pair_data``, only the
+        remaining symbols are computed.
+        """
+        code = []
+        values = self._get_cached_values()
+        if len(values) > 0:
+            code.append('_pair_ptr = &_pair_data[_pair_idx*%d]' % len(values))
+            code.extend('%s = _pair_ptr[%d]' % (value, i)
+                        for i, value in enumerate(values))
+        cached = self.get_cached_symbols()
+        code.extend(cb.code.strip() for sym, cb in self.precomputed.items()
+                    if sym not in cached)
+        code.extend(self._get_call(eq, 'loop') for eq in self.equations
+                    if hasattr(eq, 'loop'))
+        code.append('')
+        return self._set_kernel('\n'.join(code), kernel)
+
     def get_post_loop_code(self, kernel=None):
         code = self._get_code(kind='post_loop')
         return self._set_kernel(code, kernel)
@@ -739,8 +933,16 @@ class CythonGroup(Group):
         predefined = dict(get_predefined_types(self.pre_comp))
         predefined.update(known_types)
         code_gen = CythonGenerator(known_types=predefined)
+        specialize = get_config().specialize
         for cls in sorted(classes.keys()):
-            code_gen.parse(eqs[cls])
+            constants = None
+            if specialize:
+                # Only the values common to all the instances can be used.
+                constants = get_common_constants(
+                    [eq for eq in self.equations
+                     if eq.__class__.__name__ == cls]
+                )
+            code_gen.parse(eqs[cls], constants=constants)
             wrappers.append(code_gen.get_code())
         return '\n'.join(wrappers)
 
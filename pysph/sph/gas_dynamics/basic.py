@@ -224,6 +224,8 @@ class IdealGasEOS(Equation):
 
 
 class Monaghan92Accelerations(Equation):
+    symmetric = True
+
     def __init__(self, dest, sources, alpha=1.0, beta=2.0):
         self.alpha = alpha
         self.beta = beta
@@ -272,6 +274,8 @@ class ADKEAccelerations(Equation):
         2014, Journal of Computational Physics, 256, pp 308 -- 333
             (http://dx.doi.org/10.1016/j.jcp.2013.08.060)
     """
+    symmetric = True
+
     def __init__(self, dest, sources, alpha, beta, g1, g2, k, eps):
         self.alpha = alpha
         self.g1 = g1
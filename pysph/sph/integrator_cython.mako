@@ -8,17 +8,30 @@ ${' '*4*level}${l}
 
 from libc.math cimport *
 from libc.math cimport M_PI as pi
+% if helper.config.use_openmp:
+from cython.parallel import prange
+% endif
+% if helper.config.profile:
+from pysph.base.profiler import add_profile_info, timer
+% endif
 
 from pysph.base.nnps_base cimport NNPS
+from pysph.base.particle_array cimport ParticleArray
+from pyzoltan.core.carray cimport (DoubleArray, FloatArray, IntArray,
+    LongArray, UIntArray)
 
 
 ${helper.get_stepper_code()}
 
 
+# #############################################################################
+${helper.get_particle_array_wrapper()}
+
+
 # #############################################################################
 cdef class Integrator:
     cdef public ParticleArrayWrapper ${helper.get_particle_array_names()}
-    cdef public AccelerationEval acceleration_eval
+    cdef public object acceleration_eval
     cdef public object parallel_manager
     cdef public NNPS nnps
     cdef public double dt, t, orig_t
@@ -30,7 +43,9 @@ cdef class Integrator:
         self.acceleration_eval = acceleration_eval
         self._post_stage_callback = None
         % for name in sorted(helper.object.steppers.keys()):
-        self.${name} = acceleration_eval.${name}
+        self.${name} = ParticleArrayWrapper(
+            acceleration_eval.${name}.array, acceleration_eval.${name}.index
+        )
         % endfor
         ${indent(helper.get_stepper_init(), 2)}
 
@@ -44,13 +59,29 @@ cdef class Integrator:
         self._post_stage_callback = callback
 
     cpdef compute_accelerations(self):
+        % if helper.config.profile:
+        cdef double _profile_t0 = timer()
         # update NNPS since particles have moved
         if self.parallel_manager:
             self.parallel_manager.update()
+            add_profile_info("ParallelManager.update", timer() - _profile_t0)
+            _profile_t0 = timer()
         self.nnps.update()
+        add_profile_info("NNPS.update", timer() - _profile_t0)
 
         # Evaluate
+        _profile_t0 = timer()
         self.acceleration_eval.compute(self.t, self.dt)
+        add_profile_info("AccelerationEval.compute", timer() - _profile_t0)
+        % else:
+        # update NNPS since particles have moved
+        if self.parallel_manager:
+            self.parallel_manager.update()
+        self.nnps.update()
+
+        # Evaluate
+        self.acceleration_eval.compute(self.t, self.dt)
+        % endif
 
     cpdef do_post_stage(self, double stage_dt, int stage):
         """This is called after every stage of the integrator.
@@ -66,8 +97,15 @@ cdef class Integrator:
          - stage : int: the stage completed (starting from 1).
         """
         self.t = self.orig_t + stage_dt
+        % if helper.config.profile:
+        cdef double _profile_t0 = timer()
+        if self._post_stage_callback is not None:
+            self._post_stage_callback(self.t, self.dt, stage)
+        add_profile_info("Integrator.do_post_stage", timer() - _profile_t0)
+        % else:
         if self._post_stage_callback is not None:
             self._post_stage_callback(self.t, self.dt, stage)
+        % endif
 
     cpdef step(self, double t, double dt):
         """Main step routine.
@@ -75,8 +113,17 @@ cdef class Integrator:
         self.orig_t = t
         self.t = t
         self.dt = dt
+        self._update_particle_arrays()
         self.one_timestep(t, dt)
 
+    cdef _update_particle_arrays(self):
+        # The acceleration eval is in a separate module and has its own
+        # wrappers, use the same arrays if these have been changed.
+        % for name in sorted(helper.object.steppers.keys()):
+        if self.${name}.array is not self.acceleration_eval.${name}.array:
+            self.${name}.set_array(self.acceleration_eval.${name}.array)
+        % endfor
+
     cdef one_timestep(self, double t, double dt):
         ${indent(helper.get_timestep_code(), 2)}
 
@@ -88,6 +135,9 @@ cdef class Integrator:
         cdef double dt = self.dt
         cdef double t = self.t
         ${indent(helper.get_array_declarations(method), 2)}
+        % if helper.config.profile:
+        cdef double _profile_t0 = timer()
+        % endif
 
         % for dest in sorted(helper.object.steppers.keys()):
         # ---------------------------------------------------------------------
@@ -96,7 +146,10 @@ cdef class Integrator:
         # Only iterate over real particles.
         NP_DEST = dst.size(real=True)
         ${indent(helper.get_array_setup(dest, method), 2)}
-        for d_idx in range(NP_DEST):
+        for d_idx in ${helper.get_stepper_range('NP_DEST')}:
             ${indent(helper.get_stepper_loop(dest, method), 3)}
         % endfor
+        % if helper.config.profile:
+        add_profile_info("Integrator.${method}", timer() - _profile_t0)
+        % endif
     % endfor
@@ -12,8 +12,10 @@ from textwrap import dedent
 from mako.template import Template
 
 # Local imports.
+from pysph.base.config import get_config
 from pysph.sph.equation import get_array_names
-from pysph.base.cython_generator import CythonGenerator, get_func_definition
+from pysph.base.cython_generator import (CythonGenerator, get_common_constants,
+    get_func_definition)
 
 
 class IntegratorCythonHelper(object):
@@ -24,6 +26,7 @@ class IntegratorCythonHelper(object):
         self.acceleration_eval_helper = acceleration_eval_helper
         pas = acceleration_eval_helper.object.particle_arrays
         self._particle_arrays = dict((x.name, x) for x in pas)
+        self.config = get_config()
         if self.object is not None:
             self._check_integrator_steppers()
 
@@ -35,6 +38,11 @@ class IntegratorCythonHelper(object):
         else:
             return ''
 
+    def get_ext_module(self, code):
+        """Return the ExtModule for the given code without building it.
+        """
+        return self.acceleration_eval_helper.get_ext_module(code)
+
     def setup_compiled_module(self, module, acceleration_eval):
         # Create the compiled module.
         cython_integrator = module.Integrator(
@@ -49,11 +57,16 @@ class IntegratorCythonHelper(object):
     def get_particle_array_names(self):
         return ', '.join(sorted(self.object.steppers.keys()))
 
+    def get_particle_array_wrapper(self):
+        return self.acceleration_eval_helper.get_particle_array_wrapper()
+
     def get_stepper_code(self):
         classes = {}
+        instances = {}
         for dest, stepper in self.object.steppers.items():
             cls = stepper.__class__.__name__
             classes[cls] = stepper
+            instances.setdefault(cls, []).append(stepper)
 
         known_types = dict(self.acceleration_eval_helper.known_types)
         known_types.update(dict(t=0.0, dt=0.0))
@@ -61,7 +74,10 @@ class IntegratorCythonHelper(object):
 
         wrappers = []
         for cls in sorted(classes.keys()):
-            code_gen.parse(classes[cls])
+            constants = None
+            if self.config.specialize:
+                constants = get_common_constants(instances[cls])
+            code_gen.parse(classes[cls], constants=constants)
             wrappers.append(code_gen.get_code())
         return '\n'.join(wrappers)
 
@@ -121,6 +137,15 @@ class IntegratorCythonHelper(object):
         )
         return c
 
+    def get_stepper_range(self, limit):
+        """Return the iterator used to loop over the particles in the
+        stepper methods, this is a nogil `prange` when OpenMP is enabled.
+        """
+        if self.config.use_openmp:
+            return 'prange({limit}, nogil=True)'.format(limit=limit)
+        else:
+            return 'range({limit})'.format(limit=limit)
+
     def get_stepper_method_wrapper_names(self):
         """Returns the names of the methods we should wrap.  For a 2 stage
         method this will return ('initialize', 'stage1', 'stage2')
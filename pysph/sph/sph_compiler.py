@@ -1,3 +1,10 @@
+from contextlib import contextmanager
+import time
+
+from pysph.base.config import get_config
+from pysph.base.profiler import add_profile_info
+
+
 class SPHCompiler(object):
     def __init__(self, acceleration_eval, integrator):
         """Compiles the acceleration evaluator and integrator to produce a
@@ -15,6 +22,10 @@ class SPHCompiler(object):
         self.backend = acceleration_eval.backend
         self._setup_helpers()
         self.module = None
+        # Time taken to generate and compile the code, in secs.
+        self.compile_time = 0.0
+        # Time taken by each phase of the compilation, in secs.
+        self.timings = {}
 
     # Public interface. ####################################################
     def compile(self):
@@ -24,24 +35,61 @@ class SPHCompiler(object):
         """
         if self.module is not None:
             return
-        code = self._get_code()
-        mod = self.acceleration_eval_helper.compile(code)
-        self.module = mod
-        self.acceleration_eval_helper.setup_compiled_module(mod)
+        start = time.time()
         if self.backend == 'cython':
-            cython_a_eval = self.acceleration_eval.c_acceleration_eval
-            if self.integrator is not None:
-                self.integrator_helper.setup_compiled_module(
-                    mod, cython_a_eval
-                )
+            self._compile_cython()
         elif self.backend == 'opencl':
+            code = self._get_code()
+            mod = self.acceleration_eval_helper.compile(code)
+            self.module = mod
+            self.acceleration_eval_helper.setup_compiled_module(mod)
             if self.integrator is not None:
                 c_a_eval = self.acceleration_eval.c_acceleration_eval
                 self.integrator_helper.setup_compiled_module(
                     mod, c_a_eval
                 )
+        self.compile_time = time.time() - start
 
     # Private interface. ####################################################
+    @contextmanager
+    def _timeit(self, name):
+        start = time.time()
+        yield
+        self._add_timing(name, time.time() - start)
+
+    def _add_timing(self, name, seconds):
+        self.timings[name] = seconds
+        if get_config().profile:
+            add_profile_info('SPHCompiler.' + name, seconds)
+
+    def _compile_cython(self):
+        """The acceleration eval and the integrator are generated as
+        separate extension modules which are compiled concurrently.  Each
+        module is cached based on its code so a module is only compiled
+        again when its code changes.
+        """
+        from pysph.base.ext_module import build_modules
+        helpers = [('acceleration_eval', self.acceleration_eval_helper)]
+        if self.integrator is not None:
+            helpers.append(('integrator', self.integrator_helper))
+
+        with self._timeit('generate'):
+            ext_mods = [helper.get_ext_module(helper.get_code())
+                        for name, helper in helpers]
+        with self._timeit('build'):
+            build_modules(ext_mods)
+            modules = [ext_mod.load() for ext_mod in ext_mods]
+        for (name, helper), ext_mod in zip(helpers, ext_mods):
+            for phase, seconds in ext_mod.timings.items():
+                self._add_timing('%s.%s' % (name, phase), seconds)
+
+        self.module = modules[0]
+        self.acceleration_eval_helper.setup_compiled_module(modules[0])
+        if self.integrator is not None:
+            self.integrator_helper.setup_compiled_module(
+                modules[1], self.acceleration_eval.c_acceleration_eval
+            )
+
     def _get_code(self):
         main = self.acceleration_eval_helper.get_code()
         integrator_code = self.integrator_helper.get_code()
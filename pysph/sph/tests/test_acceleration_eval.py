@@ -11,7 +11,7 @@ import numpy as np
 
 # Local imports.
 from pysph.base.config import get_config
-from pysph.base.utils import get_particle_array
+from pysph.base.utils import get_particle_array, set_single_precision
 from pysph.sph.equation import Equation, Group
 from pysph.sph.acceleration_eval import (AccelerationEval,
                                          check_equation_array_properties)
@@ -171,6 +171,16 @@ class MixedTypeEquation(Equation):
         d_u[d_idx] = d_au[d_idx] + d_pid[d_idx]
 
 
+class GradientEquation(Equation):
+    def initialize(self, d_idx, d_au, d_av):
+        d_au[d_idx] = 0.0
+        d_av[d_idx] = 0.0
+
+    def loop(self, d_idx, d_au, d_av, s_idx, s_m, s_u, DWIJ, XIJ, WI):
+        d_au[d_idx] += s_m[s_idx]*s_u[s_idx]*DWIJ[0]
+        d_av[d_idx] += XIJ[0]*WI
+
+
 class SimpleReduction(Equation):
     def initialize(self, d_idx, d_au):
         d_au[d_idx] = 0.0
@@ -181,6 +191,20 @@ class SimpleReduction(Equation):
             dst.gpu.push('total_mass')
 
 
+class JacobiEquation(Equation):
+    def initialize(self, d_idx, d_av):
+        d_av[d_idx] = 0.0
+
+    def loop(self, d_idx, d_av, s_idx, s_m, s_au, WIJ, DWIJ, VIJ):
+        d_av[d_idx] += s_m[s_idx]*s_au[s_idx]*WIJ + DWIJ[0]*VIJ[0]
+
+    def post_loop(self, d_idx, d_au, d_av):
+        d_au[d_idx] = 0.5*d_av[d_idx] + 1.0
+
+    def converged(self):
+        return 0
+
+
 class TestAccelerationEval1D(unittest.TestCase):
     def setUp(self):
         self.dim = 1
@@ -231,6 +255,27 @@ class TestAccelerationEval1D(unittest.TestCase):
         expect = np.asarray([3., 4., 5., 5., 5., 5., 5., 5.,  4.,  3.])
         self.assertListEqual(list(pa.u), list(expect))
 
+    def test_should_work_with_single_precision_arrays(self):
+        # Given
+        pa = self.pa
+        pa.u[:] = np.linspace(0, 1, 10)
+        pa_d = get_particle_array(name='fluid', x=pa.x, h=pa.h, m=pa.m,
+                                  u=pa.u)
+        set_single_precision([pa])
+        equations = [GradientEquation(dest='fluid', sources=['fluid'])]
+        a_eval = self._make_accel_eval(equations)
+
+        # When
+        a_eval.compute(0.1, 0.1)
+
+        # Then
+        self.assertEqual(pa.m.dtype, np.float32)
+        self.assertEqual(pa.x.dtype, np.float64)
+        self.pa = pa_d
+        self._make_accel_eval(equations).compute(0.1, 0.1)
+        np.testing.assert_allclose(pa.au, pa_d.au, rtol=1e-6, atol=1e-5)
+        np.testing.assert_allclose(pa.av, pa_d.av, rtol=1e-6, atol=1e-5)
+
     def test_should_work_with_cached_nnps(self):
         # Given
         pa = self.pa
@@ -244,6 +289,43 @@ class TestAccelerationEval1D(unittest.TestCase):
         expect = np.asarray([3., 4., 5., 5., 5., 5., 5., 5.,  4.,  3.])
         self.assertListEqual(list(pa.u), list(expect))
 
+    def test_symmetric_equations_give_same_results(self):
+        # Given
+        pa = self.pa
+        pa.u[:] = np.linspace(1, 2, 10)
+        pa.h[3] *= 1.5
+        equations = [GradientEquation(dest='fluid', sources=['fluid'])]
+        a_eval = self._make_accel_eval(equations)
+        a_eval.compute(0.1, 0.1)
+        expect_au, expect_av = pa.au.copy(), pa.av.copy()
+
+        # When
+        equations = [GradientEquation(dest='fluid', sources=['fluid'])]
+        equations[0].symmetric = True
+        a_eval = self._make_accel_eval(equations)
+        a_eval.compute(0.1, 0.1)
+
+        # Then
+        np.testing.assert_allclose(pa.au, expect_au, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(pa.av, expect_av, rtol=0, atol=1e-12)
+
+    def test_symmetric_and_normal_equations_can_be_mixed(self):
+        # Given
+        pa = self.pa
+        sym = SimpleEquation(dest='fluid', sources=['fluid'])
+        sym.symmetric = True
+        equations = [
+            sym, MixedTypeEquation(dest='fluid', sources=['fluid'])
+        ]
+        a_eval = self._make_accel_eval(equations)
+
+        # When
+        a_eval.compute(0.1, 0.1)
+
+        # Then
+        expect = np.asarray([3., 4., 5., 5., 5., 5., 5., 5.,  4.,  3.])*2
+        self.assertListEqual(list(pa.au), list(expect))
+
     def test_should_iterate_iterated_group(self):
         # Given
         pa = self.pa
@@ -285,6 +367,81 @@ class TestAccelerationEval1D(unittest.TestCase):
         expect = np.asarray([3., 4., 5., 5., 5., 5., 5., 5.,  4.,  3.])
         self.assertListEqual(list(pa.u), list(expect))
 
+    def test_cached_pairs_give_same_results(self):
+        # Given
+        pa = self.pa
+        pa.u[:] = np.linspace(1, 2, 10)
+        pa.h[3] *= 1.5
+
+        def _get_equations(cache_pairs):
+            return [Group(
+                equations=[
+                    Group(equations=[
+                        JacobiEquation(dest='fluid', sources=['fluid'])
+                    ]),
+                    Group(equations=[
+                        SimpleEquation(dest='fluid', sources=['fluid'])
+                    ]),
+                ],
+                iterate=True, max_iterations=5, cache_pairs=cache_pairs
+            )]
+
+        a_eval = self._make_accel_eval(_get_equations(False))
+        pa.au[:] = 0.0
+        a_eval.compute(0.1, 0.1)
+        expect = pa.av.copy()
+
+        # When
+        a_eval = self._make_accel_eval(_get_equations(True))
+        for i in range(2):
+            pa.au[:] = 0.0
+            a_eval.compute(0.1, 0.1)
+
+            # Then
+            np.testing.assert_allclose(pa.av, expect, rtol=0, atol=1e-12)
+
+    def test_iteration_limits_are_set_at_runtime(self):
+        # Given
+        pa = self.pa
+
+        def _get_equations(max_iterations):
+            return [Group(
+                equations=[
+                    Group(equations=[
+                        SimpleEquation(dest='fluid', sources=['fluid'])
+                    ]),
+                ],
+                iterate=True, max_iterations=max_iterations
+            )]
+
+        a_eval = self._make_accel_eval(_get_equations(2))
+        module = type(a_eval.c_acceleration_eval).__module__
+
+        # When
+        a_eval = self._make_accel_eval(_get_equations(3))
+
+        # Then
+        self.assertEqual(type(a_eval.c_acceleration_eval).__module__, module)
+        self.assertEqual(a_eval.c_acceleration_eval._max_iterations, [3])
+        pa.au[:] = 0.0
+        a_eval.compute(0.1, 0.1)
+        expect = pa.au.copy()
+
+        # When
+        orig = get_config().specialize
+        get_config().specialize = True
+        try:
+            a_eval = self._make_accel_eval(_get_equations(3))
+        finally:
+            get_config().specialize = orig
+
+        # Then
+        self.assertNotEqual(type(a_eval.c_acceleration_eval).__module__,
+                            module)
+        pa.au[:] = 0.0
+        a_eval.compute(0.1, 0.1)
+        np.testing.assert_allclose(pa.au, expect)
+
     def test_should_run_reduce(self):
         # Given.
         pa = self.pa
@@ -313,6 +470,93 @@ class TestAccelerationEval1D(unittest.TestCase):
         self.assertListEqual(list(pa.u), list(expect))
 
 
+class TestSymmetricSchemeEquations(unittest.TestCase):
+    """Check that the equations evaluated symmetrically by default give the
+    same results as the normal evaluation.
+    """
+    def _make_particles(self):
+        dx = 0.05
+        rng = np.random.RandomState(42)
+        x, y = np.mgrid[dx/2:0.6:dx, dx/2:0.6:dx]
+        x = x.ravel() + rng.uniform(-0.1, 0.1, x.size)*dx
+        y = y.ravel() + rng.uniform(-0.1, 0.1, y.size)*dx
+        n = x.size
+        fluid = get_particle_array(
+            name='fluid', x=x, y=y, m=dx*dx, h=1.3*dx,
+            rho=1.0 + rng.uniform(-0.01, 0.01, n),
+            u=rng.uniform(-1, 1, n), v=rng.uniform(-1, 1, n)
+        )
+        xb, yb = np.mgrid[-0.15:0.75:dx, -0.15:0.0:dx]
+        solid = get_particle_array(
+            name='solid', x=xb.ravel(), y=yb.ravel(), m=dx*dx, h=1.3*dx,
+            rho=1.0
+        )
+        return [fluid, solid]
+
+    def _compute(self, scheme, symmetric):
+        arrays = self._make_particles()
+        scheme.setup_properties(arrays)
+        for pa in arrays:
+            for prop in ('h0', 'e', 'V', 'uhat', 'vhat'):
+                if prop in pa.properties:
+                    pa.get(prop)[:] = dict(
+                        h0=pa.h, e=2.5, V=1.0/pa.m, uhat=pa.u, vhat=pa.v
+                    )[prop]
+        equations = scheme.get_equations()
+        n_symmetric = 0
+        for group in equations:
+            for eq in group.equations:
+                if not symmetric:
+                    eq.symmetric = False
+                n_symmetric += int(eq.symmetric)
+        self.assertEqual(n_symmetric > 0, symmetric)
+        kernel = CubicSpline(dim=2)
+        a_eval = AccelerationEval(arrays, equations, kernel=kernel)
+        comp = SPHCompiler(a_eval, integrator=None)
+        comp.compile()
+        nnps = NNPS(dim=2, particles=arrays)
+        nnps.update()
+        a_eval.set_nnps(nnps)
+        a_eval.compute(0.0, 1e-4)
+        return arrays[0]
+
+    def _check_scheme(self, scheme, props):
+        expect = self._compute(scheme, symmetric=False)
+        result = self._compute(scheme, symmetric=True)
+        for prop in props:
+            np.testing.assert_allclose(
+                result.get(prop), expect.get(prop), rtol=1e-10,
+                atol=1e-10*np.abs(expect.get(prop)).max(), err_msg=prop
+            )
+
+    def test_wcsph_dam_break_accelerations(self):
+        from pysph.sph.scheme import WCSPHScheme
+        scheme = WCSPHScheme(
+            ['fluid'], ['solid'], dim=2, rho0=1.0, c0=10.0, h0=0.065,
+            hdx=1.3, gy=-9.81, alpha=0.1, beta=0.0
+        )
+        self._check_scheme(scheme, ['arho', 'au', 'av', 'dt_cfl'])
+
+        # When
+        scheme.delta_sph = True
+
+        # Then
+        self._check_scheme(scheme, ['arho', 'au', 'av'])
+
+    def test_tvf_accelerations(self):
+        from pysph.sph.scheme import TVFScheme
+        scheme = TVFScheme(
+            ['fluid'], ['solid'], dim=2, rho0=1.0, c0=10.0, nu=0.01,
+            p0=100.0, pb=100.0, h0=0.065, alpha=0.1
+        )
+        self._check_scheme(scheme, ['au', 'av', 'auhat', 'avhat'])
+
+    def test_adke_accelerations(self):
+        from pysph.sph.scheme import ADKEScheme
+        scheme = ADKEScheme(['fluid'], [], dim=2, g1=0.2, g2=0.4)
+        self._check_scheme(scheme, ['au', 'av', 'ae'])
+
+
 class EqWithTime(Equation):
     def initialize(self, d_idx, d_au, t, dt):
         d_au[d_idx] = t + dt
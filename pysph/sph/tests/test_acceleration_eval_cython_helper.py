@@ -5,10 +5,16 @@ import unittest
 import numpy as np
 
 # Local library imports.
+from pysph.base.config import get_config, set_config
 from pysph.base.particle_array import ParticleArray
 from pysph.base.cython_generator import KnownType
+from pysph.base.kernels import CubicSpline
+from pysph.base.utils import get_particle_array
+from pysph.sph.acceleration_eval import AccelerationEval
 from pysph.sph.acceleration_eval_cython_helper import (get_all_array_names,
-    get_known_types_for_arrays)
+    get_known_types_for_arrays, AccelerationEvalCythonHelper)
+from pysph.sph.basic_equations import SummationDensity
+from pysph.sph.equation import Equation
 
 
 class TestGetAllArrayNames(unittest.TestCase):
@@ -31,6 +37,13 @@ class TestGetAllArrayNames(unittest.TestCase):
         self.assertEqual(result['IntArray'], set(('pid', 'tag')))
         self.assertEqual(result['UIntArray'], set(('gid',)))
 
+    def test_that_properties_with_different_types_raise_error(self):
+        x = np.linspace(0, 1, 10)
+        pa1 = ParticleArray(name='f', x=x, u=x)
+        pa2 = ParticleArray(name='b', x=x)
+        pa2.add_property('u', type='float')
+        self.assertRaises(RuntimeError, get_all_array_names, [pa1, pa2])
+
 class TestGetKnownTypesForAllArrays(unittest.TestCase):
     def test_that_all_types_are_detected_correctly(self):
         x = np.linspace(0, 1, 10)
@@ -48,3 +61,75 @@ class TestGetKnownTypesForAllArrays(unittest.TestCase):
         for key in expect:
             self.assertEqual(repr(result[key]), repr(expect[key]))
 
+
+
+class DummyEquation(Equation):
+    def initialize(self, d_idx, d_rho):
+        d_rho[d_idx] = 0.0
+
+    def loop(self, d_idx, d_p):
+        d_p[d_idx] = 1.0
+
+    def post_loop(self, d_idx, d_rho, d_p):
+        d_p[d_idx] = d_rho[d_idx]
+
+
+class TestAccelerationEvalCythonHelper(unittest.TestCase):
+    def tearDown(self):
+        set_config(None)
+
+    def _get_code(self):
+        x = np.linspace(0, 1, 10)
+        pa = get_particle_array(name='fluid', x=x, rho=1.0, p=0.0)
+        equations = [
+            DummyEquation(dest='fluid', sources=None),
+            SummationDensity(dest='fluid', sources=['fluid'])
+        ]
+        a_eval = AccelerationEval([pa], equations, kernel=CubicSpline(dim=1))
+        helper = AccelerationEvalCythonHelper(a_eval)
+        return helper.get_code()
+
+    def test_destination_loops_are_serial_without_openmp(self):
+        # Given
+        get_config().use_openmp = False
+
+        # When
+        code = self._get_code()
+
+        # Then
+        self.assertNotIn('with nogil, parallel():', code)
+        self.assertEqual(code.count('for d_idx in prange(NP_DEST):'), 4)
+
+    def test_destination_loops_are_parallel_with_openmp(self):
+        # Given
+        get_config().use_openmp = True
+
+        # When
+        code = self._get_code()
+
+        # Then
+        # initialize, no-source loop, neighbor loop and post_loop.
+        self.assertEqual(code.count('with nogil, parallel():'), 4)
+        self.assertEqual(code.count('for d_idx in prange(NP_DEST):'), 4)
+        self.assertNotIn('for d_idx in range(NP_DEST):', code)
+
+    def test_profile_timers_are_only_generated_when_profiling(self):
+        # Given
+        get_config().profile = False
+
+        # When
+        code = self._get_code()
+
+        # Then
+        self.assertNotIn('add_profile_info', code)
+
+        # Given
+        get_config().profile = True
+
+        # When
+        code = self._get_code()
+
+        # Then
+        self.assertIn('from pysph.base.profiler import', code)
+        self.assertIn('add_profile_info("Group 0"', code)
+        self.assertIn('"Group 0: fluid <- fluid (SummationDensity)"', code)
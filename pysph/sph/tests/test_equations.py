@@ -158,6 +158,18 @@ class Equation2(Equation):
         x += 1
 
 
+class Equation3(Equation):
+    symmetric = True
+
+    def loop(self, d_idx, s_idx, d_au, s_m, DWI):
+        d_au[d_idx] += s_m[s_idx]*DWI[0]
+
+
+class Equation4(Equation):
+    def loop(self, d_idx, d_au, VIJ, DWIJ):
+        d_au[d_idx] += VIJ[0]*DWIJ[0]
+
+
 class TestGroup(TestBase):
     def setUp(self):
         from pysph.sph.basic_equations import SummationDensity
@@ -247,6 +259,78 @@ class TestGroup(TestBase):
         msg = 'EXPECTED:\n%s\nGOT:\n%s' % (expect, result)
         self.assertEqual(result, expect, msg)
 
+    def test_symmetric_loop_code(self):
+        from pysph.base.kernels import CubicSpline
+        k = CubicSpline(dim=3)
+        e2 = Equation2('f', ['f'])
+        e3 = Equation3('f', ['f'])
+        g = CythonGroup([e2, e3])
+        # First get the equation wrappers so the equation names are setup.
+        g.get_equation_wrappers()
+
+        # When
+        self.assertTrue(g.has_symmetric())
+        result = g.get_symmetric_loop_code(k)
+
+        # Then
+        # The partner of DWI is also precomputed.
+        self.assertEqual(list(g.precomputed.keys()),
+                         ['XIJ', 'R2IJ', 'RIJ', 'DWI', 'DWJ'])
+        expect = dedent('''\
+            if not _skip:
+                self.equation30.loop(d_idx, s_idx, d_au, s_m, DWI)
+                if s_idx > d_idx and s_idx < _hi:
+                    XIJ[0] = -XIJ[0]
+                    XIJ[1] = -XIJ[1]
+                    XIJ[2] = -XIJ[2]
+            ''')
+        msg = 'EXPECTED:\n%s\nGOT:\n%s' % (expect, result)
+        self.assertIn(expect, result, msg)
+        self.assertIn('self.equation20.loop(d_idx, s_idx)\n', result)
+        self.assertIn('DWJ[0] = -_tmp', result)
+        self.assertIn(
+            '        self.equation30.loop(s_idx, d_idx, d_au, s_m, DWI)', result
+        )
+        self.assertNotIn('continue', result)
+
+    def test_pair_cache_code(self):
+        from pysph.base.kernels import CubicSpline
+        k = CubicSpline(dim=3)
+        e1 = Equation1('f', ['f'])
+        e4 = Equation4('f', ['f'])
+        g = CythonGroup([e1, e4])
+        g.get_equation_wrappers()
+
+        # When
+        cached = g.get_cached_symbols()
+        store = g.get_pair_cache_store_code(k)
+        load = g.get_pair_cache_load_code(k)
+
+        # Then
+        # VIJ depends on the velocities and is not cached.
+        self.assertEqual(cached, ['HIJ', 'XIJ', 'R2IJ', 'RIJ', 'DWIJ', 'WIJ'])
+        self.assertEqual(g.get_pair_cache_size(), 10)
+        self.assertIn('self.kernel.kernel(XIJ, RIJ, HIJ)', store)
+        self.assertIn('_pair_ptr = &_pair_data[_pair_idx*10]\n', store)
+        self.assertIn('_pair_ptr[6] = DWIJ[0]\n', store)
+        self.assertIn('_pair_ptr[9] = WIJ\n', store)
+        self.assertNotIn('self.kernel', load)
+        self.assertIn('DWIJ[0] = _pair_ptr[6]\n', load)
+        self.assertIn('WIJ = _pair_ptr[9]\n', load)
+        self.assertIn('VIJ[0] = d_u[d_idx] - s_u[s_idx]', load)
+        for code in (store, load):
+            self.assertIn('self.equation10.loop(WIJ)\n', code)
+            self.assertIn('self.equation40.loop(d_idx, d_au, VIJ, DWIJ)\n',
+                          code)
+
+    def test_cache_pairs_needs_iterative_group(self):
+        e1 = Equation1('f', ['f'])
+        self.assertRaises(ValueError, Group, [e1], cache_pairs=True)
+        self.assertRaises(ValueError, Group, [e1], iterate=True,
+                          update_nnps=True, cache_pairs=True)
+        g = Group([Group([e1])], iterate=True, cache_pairs=True)
+        self.assertTrue(g.cache_pairs)
+
     def test_post_loop_code(self):
         from pysph.base.kernels import CubicSpline
         k = CubicSpline(dim=3)
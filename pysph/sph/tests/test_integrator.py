@@ -92,6 +92,7 @@ class TestIntegratorBase(unittest.TestCase):
         nnps = LinkedListNNPS(dim=kernel.dim, particles=arrays)
         a_eval.set_nnps(nnps)
         integrator.set_nnps(nnps)
+        return comp
 
     def _integrate(self, integrator, dt, tf, post_step_callback):
         """The post_step_callback is called after each step and is passed the
@@ -127,6 +128,32 @@ class TestLeapFrogIntegrator(TestIntegratorBase):
         energy = np.asarray(energy)
         self.assertAlmostEqual(np.max(np.abs(energy - 0.5)), 0.0, places=3)
 
+    def test_integrator_is_compiled_separately(self):
+        # Given.
+        integrator = LeapFrogIntegrator(fluid=LeapFrogStep())
+        equations = [SHM(dest="fluid", sources=None)]
+
+        # When
+        comp = self._setup_integrator(equations=equations,
+                                      integrator=integrator)
+
+        # Then
+        a_eval = comp.acceleration_eval
+        self.assertNotEqual(type(integrator.c_integrator).__module__,
+                            type(a_eval.c_acceleration_eval).__module__)
+        for name in ('generate', 'build'):
+            self.assertTrue(comp.timings[name] >= 0.0)
+
+        # When
+        pa = self.pa.extract_particles([0])
+        a_eval.update_particle_arrays([pa])
+        x = self.pa.x.copy()
+        integrator.step(0.0, 0.1)
+
+        # Then
+        self.assertEqual(self.pa.x[0], x[0])
+        self.assertNotEqual(pa.x[0], x[0])
+
     def test_leapfrog_is_second_order(self):
         # Given.
         integrator = LeapFrogIntegrator(fluid=LeapFrogStep())
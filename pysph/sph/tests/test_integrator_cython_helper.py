@@ -2,7 +2,8 @@ import unittest
 
 import numpy as np
 
-from pysph.base.utils import get_particle_array
+from pysph.base.config import get_config, set_config
+from pysph.base.utils import get_particle_array, get_particle_array_wcsph
 from pysph.base.kernels import QuinticSpline
 
 from pysph.sph.acceleration_eval import AccelerationEval
@@ -15,6 +16,69 @@ from pysph.sph.basic_equations import SummationDensity
 
 
 class TestIntegratorCythonHelper(unittest.TestCase):
+    def tearDown(self):
+        set_config(None)
+
+    def _make_helper(self):
+        x = np.linspace(0, 1, 10)
+        pa = get_particle_array_wcsph(name='fluid', x=x)
+        equations = [SummationDensity(dest='fluid', sources=['fluid'])]
+        kernel = QuinticSpline(dim=1)
+        a_eval = AccelerationEval([pa], equations, kernel=kernel)
+        a_helper = AccelerationEvalCythonHelper(a_eval)
+        integrator = PECIntegrator(fluid=WCSPHStep())
+        return IntegratorCythonHelper(integrator, a_helper)
+
+    def test_stepper_loops_are_serial_without_openmp(self):
+        # Given
+        get_config().use_openmp = False
+        helper = self._make_helper()
+
+        # When
+        code = helper.get_code()
+
+        # Then
+        self.assertIn('for d_idx in range(NP_DEST):', code)
+        self.assertNotIn('prange', code)
+
+    def test_stepper_loops_use_prange_with_openmp(self):
+        # Given
+        get_config().use_openmp = True
+        helper = self._make_helper()
+
+        # When
+        code = helper.get_code()
+
+        # Then
+        self.assertIn('from cython.parallel import prange', code)
+        self.assertIn('for d_idx in prange(NP_DEST, nogil=True):', code)
+        self.assertNotIn('for d_idx in range(NP_DEST):', code)
+        self.assertIn('cdef inline void stage1(', code)
+        self.assertIn(') nogil:', code)
+
+    def test_profile_timers_are_only_generated_when_profiling(self):
+        # Given
+        get_config().profile = False
+        helper = self._make_helper()
+
+        # When
+        code = helper.get_code()
+
+        # Then
+        self.assertNotIn('add_profile_info', code)
+
+        # Given
+        get_config().profile = True
+        helper = self._make_helper()
+
+        # When
+        code = helper.get_code()
+
+        # Then
+        self.assertIn('add_profile_info("NNPS.update"', code)
+        self.assertIn('add_profile_info("AccelerationEval.compute"', code)
+        self.assertIn('add_profile_info("Integrator.stage1"', code)
+
     def test_invalid_kwarg_raises_error(self):
         # Given
         x = np.linspace(0, 1, 10)
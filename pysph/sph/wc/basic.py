@@ -161,6 +161,8 @@ class MomentumEquation(Equation):
     .. [Monaghan1992] J. Monaghan, Smoothed Particle Hydrodynamics, "Annual
         Review of Astronomy and Astrophysics", 30 (1992), pp. 543-574.
     """
+    symmetric = True
+
     def __init__(self, dest, sources, c0,
                  alpha=1.0, beta=1.0, gx=0.0, gy=0.0, gz=0.0,
                  tensile_correction=False):
@@ -296,6 +298,8 @@ class MomentumEquationDeltaSPH(Equation):
         pp 1468--1480.
 
     """
+    symmetric = True
+
     def __init__(self, dest, sources, rho0, c0, alpha=1.0,
                  gx=0.0, gy=0.0, gz=0.0):
         r"""
@@ -386,6 +390,8 @@ class ContinuityEquationDeltaSPH(Equation):
         violent impact flows", Computer Methods in Applied Mechanics and
         Engineering, 200 (2011), pp 1526--1542.
     """
+    symmetric = True
+
     def __init__(self, dest, sources, c0, delta=0.1):
         r"""
         Parameters
@@ -482,6 +488,8 @@ class PressureGradientUsingNumberDensity(Equation):
         (\frac{p_a}{V_a^2} + \frac{p_b}{V_b^2})\nabla_a W_{ab}
 
     """
+    symmetric = True
+
     def initialize(self, d_idx, d_au, d_av, d_aw):
         d_au[d_idx] = 0.0
         d_av[d_idx] = 0.0
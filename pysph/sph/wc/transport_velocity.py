@@ -145,6 +145,8 @@ class ContinuityEquation(Equation):
         \boldsymbol{v}_{ab} \cdot \nabla_a W_{ab}
 
     """
+    symmetric = True
+
     def initialize(self, d_idx, d_arho):
         d_arho[d_idx] = 0.0
 
@@ -213,6 +215,7 @@ class MomentumEquationPressureGradient(Equation):
 
         \bar{p}_{ab} = \frac{\rho_b p_a + \rho_a p_b}{\rho_a + \rho_b}
     """
+    symmetric = True
 
     def __init__(self, dest, sources, pb, gx=0., gy=0., gz=0.,
                  tdamp=0.0):
@@ -323,6 +326,7 @@ class MomentumEquationViscosity(Equation):
 
         \bar{\eta}_{ab} = \frac{2\eta_a \eta_b}{\eta_a + \eta_b}
     """
+    symmetric = True
 
     def __init__(self, dest, sources, nu):
         r"""
@@ -389,6 +393,8 @@ class MomentumEquationArtificialViscosity(Equation):
 
         h_{ab} = \frac{h_a + h_b}{2}
     """
+    symmetric = True
+
     def __init__(self, dest, sources, c0, alpha=0.1):
         r"""
         Parameters
@@ -446,6 +452,8 @@ class MomentumEquationArtificialStress(Equation):
          - \boldsymbol{v})
 
     """
+    symmetric = True
+
     def initialize(self, d_idx, d_au, d_av, d_aw):
         d_au[d_idx] = 0.0
         d_av[d_idx] = 0.0
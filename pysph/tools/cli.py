@@ -19,6 +19,10 @@ def output_vtk(args):
     from pysph.solver.vtk_output import main
     main(args)
 
+def run_benchmarks(args):
+    from pysph.benchmarks.run import main
+    main(args)
+
 def _has_pysph_dir():
     init_py = join('pysph', '__init__.py')
     init_pyc = join('pysph', '__init__.pyc')
@@ -60,6 +64,12 @@ def main():
     )
     tests.set_defaults(func=run_tests)
 
+    bench = subparsers.add_parser(
+        'bench', help='Run PySPH benchmarks',
+        add_help=False
+    )
+    bench.set_defaults(func=run_benchmarks)
+
     if len(sys.argv) == 1 or \
         (len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']):
         parser.print_help()
@@ -1,13 +1,15 @@
 # Standard library imports
 from functools import reduce
+import imp
 
 # Library imports.
 import numpy as np
 
 # Package imports.
 from pysph.base.utils import get_particle_array
-from pysph.base.kernels import Gaussian
+from pysph.base.kernels import Gaussian, get_compiled_kernel
 from pysph.base.nnps import LinkedListNNPS as NNPS
+from pysph.base.ext_module import ExtModule, get_md5
 from pysph.sph.equation import Equation
 from pysph.sph.acceleration_eval import AccelerationEval
 from pysph.sph.sph_compiler import SPHCompiler
@@ -27,6 +29,84 @@ class InterpolateFunction(Equation):
             d_prop[d_idx] /= d_number_density[d_idx]
 
 
+def _get_batch_prop_names(prop, gradient=False):
+    """Return the names of the destination properties used to store the
+    interpolated value of the given property and the gradient components.
+    """
+    name = prop + '_interp'
+    if gradient:
+        return [name] + [name + '_grad_' + c for c in 'xyz']
+    else:
+        return [name]
+
+
+def make_batch_interpolation_equation(props, gradient=False):
+    """Return an Equation class that interpolates all the given properties
+    in a single sweep over the neighbors.
+
+    The equation stores the interpolated value of each property `prop` in
+    the destination property `prop_interp`.  If `gradient` is True, the
+    gradient of the (Shepard) interpolant is also computed and stored in
+    `prop_interp_grad_x`, `prop_interp_grad_y` and `prop_interp_grad_z`.
+
+    The source of the class is generated and written to a module in the
+    same directory as the other generated code, since the code generators
+    work with the source of the equation methods.
+    """
+    props = sorted(props)
+    key = ','.join(props) + (':grad' if gradient else '')
+    cls_name = 'InterpolateMany' + get_md5(key)[:8]
+
+    dest = [_get_batch_prop_names(x, gradient) for x in props]
+    d_args = ['d_number_density']
+    if gradient:
+        d_args += ['d_dw_sum_x', 'd_dw_sum_y', 'd_dw_sum_z']
+    d_args += ['d_' + x for names in dest for x in names]
+    s_args = ['s_' + x for x in props]
+
+    def _args(*args):
+        return ', '.join(['self'] + list(args))
+
+    init = ['        %s[d_idx] = 0.0' % x for x in d_args]
+
+    loop = ['        d_number_density[d_idx] += WIJ']
+    if gradient:
+        loop += ['        d_dw_sum_%s[d_idx] += DWIJ[%d]' % (c, i)
+                 for i, c in enumerate('xyz')]
+    for prop, names in zip(props, dest):
+        loop.append('        d_%s[d_idx] += WIJ*s_%s[s_idx]' % (names[0], prop))
+        if gradient:
+            loop += ['        d_%s[d_idx] += DWIJ[%d]*s_%s[s_idx]' % (
+                name, i, prop) for i, name in enumerate(names[1:])]
+
+    post = ['        if d_number_density[d_idx] > 1e-12:']
+    for names in dest:
+        post.append('            d_{0}[d_idx] /= d_number_density[d_idx]'
+                    .format(names[0]))
+        if gradient:
+            # Gradient of sum(f_j W_j)/sum(W_j).
+            post += [
+                '            d_{g}[d_idx] = (d_{g}[d_idx] - d_{f}[d_idx]*'
+                'd_dw_sum_{c}[d_idx])/d_number_density[d_idx]'.format(
+                    g=g, f=names[0], c=c
+                ) for g, c in zip(names[1:], 'xyz')
+            ]
+
+    loop_args = ['s_idx', 'd_idx', 'WIJ'] + (['DWIJ'] if gradient else [])
+    code = '\n'.join(
+        ['from pysph.sph.equation import Equation', '', '',
+         'class %s(Equation):' % cls_name,
+         '    def initialize(%s):' % _args('d_idx', *d_args)] + init +
+        ['', '    def loop(%s):' % _args(*(loop_args + d_args + s_args))] +
+        loop +
+        ['', '    def post_loop(%s):' % _args('d_idx', *d_args)] + post
+    ) + '\n'
+
+    ext_mod = ExtModule(code, extension='py')
+    mod = imp.load_source(ext_mod.name, ext_mod.src_path)
+    return getattr(mod, cls_name)
+
+
 def get_bounding_box(particle_arrays, tight=False, stretch=0.05):
     """Find the size of the domain given a sequence of particle arrays.
 
@@ -83,7 +163,8 @@ class Interpolator(object):
     """
 
     def __init__(self, particle_arrays, num_points=125000, kernel=None,
-                 x=None, y=None, z=None, domain_manager=None, equations=None):
+                 x=None, y=None, z=None, domain_manager=None, equations=None,
+                 use_weights=False, fixed_arrays=()):
         """
         The x, y, z coordinates need not be specified, and if they are not,
         the bounds of the interpolated domain is automatically computed and
@@ -109,6 +190,15 @@ class Interpolator(object):
         equations: sequence
             A sequence of equations or groups.  Defaults to None.  This is
             used only if the default interpolation equations are inadequate.
+        use_weights: bool
+            Precompute the interpolation weights (as a sparse matrix) once
+            for the current particles and interpolation points and use them
+            for every property.  This makes interpolating several properties
+            (or repeatedly interpolating changed data) much cheaper.
+        fixed_arrays: sequence
+            Names of the particle arrays that do not move, for example
+            boundaries.  When `use_weights` is True, their kernel values are
+            kept when :py:meth:`update_particle_arrays` is called.
         """
         self._set_particle_arrays(particle_arrays)
         bounds = get_bounding_box(self.particle_arrays)
@@ -124,6 +214,15 @@ class Interpolator(object):
         self.nnps = None
         self.equations = equations
         self.func_eval = None
+        # The evaluator, destination particle array and NNPS used by
+        # interpolate_many keyed on (props, gradient).
+        self._batch = {}
+        self.use_weights = use_weights
+        self.fixed_arrays = list(fixed_arrays)
+        # The kernel values for each source array keyed on the array name,
+        # each value is a tuple (rows, cols, weights) of a sparse matrix.
+        self._kernel_values = {}
+        self._weights = None
         self.domain_manager = domain_manager
         if x is None and y is None and z is None:
             self.set_domain(bounds, shape)
@@ -163,6 +262,10 @@ class Interpolator(object):
 
         self.shape = x.shape
         self.pa = self._create_particle_array(x, y, z)
+        self._kernel_values = {}
+        for key, (func_eval, pa, nnps) in self._batch.items():
+            self._batch[key] = (func_eval, self._create_batch_array(*key),
+                                nnps)
         arrays = self.particle_arrays + [self.pa]
 
         if self.func_eval is None:
@@ -200,8 +303,15 @@ class Interpolator(object):
 
         Returns
         -------
-        A numpy array suitably shaped with the property interpolated.
+        A numpy array suitably shaped with the property interpolated.  If
+        `gradient` is True, the array has an additional first axis with the
+        components of the gradient along each dimension.
         """
+        if gradient:
+            return self.interpolate_many([prop], gradient=True)[prop]
+        if self.use_weights and self.equations is None:
+            return self._interpolate_with_weights(prop)
+
         for array in self.particle_arrays:
             data = array.get(prop, only_real_particles=False)
             array.get('temp_prop', only_real_particles=False)[:] = data
@@ -211,6 +321,60 @@ class Interpolator(object):
         result.shape = self.shape
         return result.squeeze()
 
+    def interpolate_many(self, props, gradient=False):
+        """Interpolate the given properties in a single pass over the
+        neighbors.
+
+        This is much faster than calling :py:meth:`interpolate` for each
+        property.  The first call for a given set of properties generates
+        and compiles a suitable equation.  If the interpolator was created
+        with `equations`, these are used for each property in turn and
+        `gradient` is not supported.
+
+        Parameters
+        ----------
+
+        props: sequence
+            The names of the properties to interpolate.
+
+        gradient: bool
+            Evaluate the gradient of the interpolated function.
+
+        Returns
+        -------
+        A dictionary keyed on the property names with the values returned by
+        :py:meth:`interpolate` for each property.
+        """
+        for prop in props:
+            if prop not in self.particle_arrays[0].properties:
+                raise RuntimeError('Unknown property: %s' % prop)
+        if self.equations is not None:
+            if gradient:
+                raise RuntimeError(
+                    'Gradients cannot be interpolated with user equations.'
+                )
+            return dict((prop, self.interpolate(prop)) for prop in set(props))
+
+        if self.use_weights and not gradient:
+            return dict((prop, self._interpolate_with_weights(prop))
+                        for prop in set(props))
+
+        key = (tuple(sorted(set(props))), gradient)
+        if key not in self._batch:
+            self._batch[key] = self._setup_batch_eval(*key)
+        func_eval, pa, nnps = self._batch[key]
+
+        func_eval.compute(0.0, 0.1) # These are junk arguments.
+        result = {}
+        for prop in key[0]:
+            names = _get_batch_prop_names(prop, gradient)
+            if gradient:
+                data = [pa.get(name) for name in names[1:self.kernel.dim + 1]]
+                result[prop] = self._reshape_result(np.array(data), gradient)
+            else:
+                result[prop] = self._reshape_result(pa.get(names[0]).copy())
+        return result
+
     def update_particle_arrays(self, particle_arrays):
         """Call this for a new set of particle arrays which have the
         same properties as before.
@@ -223,16 +387,121 @@ class Interpolator(object):
         arrays = self.particle_arrays + [self.pa]
         self._create_nnps(arrays)
         self.func_eval.update_particle_arrays(arrays)
+        self._weights = None
+        for name in list(self._kernel_values.keys()):
+            if name not in self.fixed_arrays:
+                del self._kernel_values[name]
+        for key, (func_eval, pa, nnps) in self._batch.items():
+            arrays = self.particle_arrays + [pa]
+            nnps = self._get_nnps(arrays)
+            func_eval.update_particle_arrays(arrays)
+            func_eval.set_nnps(nnps)
+            self._batch[key] = (func_eval, pa, nnps)
 
     #### Private protocol #####################################################
 
+    def _get_kernel_values(self, src_index):
+        """Return the kernel values between the interpolation points and
+        the particles of the given source array as a tuple (rows, cols,
+        values) of a sparse matrix.
+        """
+        src = self.particle_arrays[src_index]
+        dst_index = len(self.particle_arrays)
+        indptr, cols = self.nnps.get_neighbor_lists(src_index, dst_index)
+        n_dst = self.pa.get_number_of_particles()
+        rows = np.repeat(np.arange(n_dst), np.diff(indptr))
+        d, s = self.pa, src
+        sx, sy, sz, sh = [s.get(x, only_real_particles=False)
+                          for x in ('x', 'y', 'z', 'h')]
+        kernel = get_compiled_kernel(self.kernel)
+        values = kernel.kernel_array(
+            d.x[rows] - sx[cols], d.y[rows] - sy[cols],
+            d.z[rows] - sz[cols], 0.5*(d.h[rows] + sh[cols])
+        )
+        return rows, cols, values
+
+    def _get_weights(self):
+        """Return a list of the (rows, cols, weights) for each source array.
+        The weights are normalized so the interpolation is a sum of the
+        weighted source values.
+        """
+        if self._weights is not None:
+            return self._weights
+        n_dst = self.pa.get_number_of_particles()
+        number_density = np.zeros(n_dst)
+        data = []
+        for i, array in enumerate(self.particle_arrays):
+            if array.name not in self._kernel_values:
+                self._kernel_values[array.name] = self._get_kernel_values(i)
+            rows, cols, values = self._kernel_values[array.name]
+            number_density += np.bincount(rows, values, minlength=n_dst)
+            data.append((rows, cols, values))
+
+        # This is consistent with the normalization in InterpolateFunction.
+        factor = np.where(number_density > 1e-12, number_density, 1.0)
+        self._weights = [(rows, cols, values/factor[rows])
+                         for rows, cols, values in data]
+        return self._weights
+
+    def _interpolate_with_weights(self, prop):
+        n_dst = self.pa.get_number_of_particles()
+        result = np.zeros(n_dst)
+        for array, (rows, cols, weights) in zip(self.particle_arrays,
+                                                self._get_weights()):
+            data = array.get(prop, only_real_particles=False)
+            result += np.bincount(rows, weights*data[cols], minlength=n_dst)
+        result.shape = self.shape
+        return result.squeeze()
+
+    def _create_batch_array(self, props, gradient):
+        """Create a destination particle array at the interpolation points
+        with the properties needed to interpolate the given props.
+
+        A separate array is used for each set of properties as the compiled
+        code requires the properties of the arrays to remain unchanged.
+        """
+        names = [x for prop in props
+                 for x in _get_batch_prop_names(prop, gradient)]
+        names.append('number_density')
+        if gradient:
+            names += ['dw_sum_x', 'dw_sum_y', 'dw_sum_z']
+        pa = self.pa
+        data = dict((name, np.zeros_like(pa.x)) for name in names)
+        return get_particle_array(
+            name='interpolate', x=pa.x, y=pa.y, z=pa.z, h=pa.h, **data
+        )
+
+    def _reshape_result(self, result, gradient=False):
+        if gradient:
+            result.shape = (self.kernel.dim,) + tuple(self.shape)
+        else:
+            result.shape = self.shape
+        return result.squeeze()
+
+    def _setup_batch_eval(self, props, gradient):
+        pa = self._create_batch_array(props, gradient)
+        names = [x.name for x in self.particle_arrays]
+        cls = make_batch_interpolation_equation(props, gradient)
+        equations = [cls(dest='interpolate', sources=names)]
+        arrays = self.particle_arrays + [pa]
+        func_eval = AccelerationEval(arrays, equations, self.kernel)
+        compiler = SPHCompiler(func_eval, None)
+        compiler.compile()
+        nnps = self._get_nnps(arrays)
+        func_eval.set_nnps(nnps)
+        return func_eval, pa, nnps
+
+    def _get_nnps(self, arrays):
+        nnps = NNPS(dim=self.kernel.dim, particles=arrays,
+                    radius_scale=self.kernel.radius_scale,
+                    domain=self.domain_manager,
+                    cache=True)
+        nnps.update()
+        return nnps
+
     def _create_nnps(self, arrays):
         # create the neighbor locator object
-        self.nnps = NNPS(dim=self.kernel.dim, particles=arrays,
-                         radius_scale=self.kernel.radius_scale,
-                         domain=self.domain_manager,
-                         cache=True)
-        self.nnps.update()
+        self.nnps = self._get_nnps(arrays)
         self.func_eval.set_nnps(self.nnps)
 
     def _create_default_points(self, bounds, shape):
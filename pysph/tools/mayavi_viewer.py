@@ -33,7 +33,8 @@ from tvtk.array_handler import array2vtk  # noqa: E402
 
 from pysph.base.particle_array import ParticleArray  # noqa: E402
 from pysph.solver.solver_interfaces import MultiprocessingClient  # noqa: E402
-from pysph.solver.utils import load, dump, output_formats  # noqa: E402
+from pysph.solver.utils import (load, dump, output_formats,  # noqa: E402
+                                get_series_files)
 from pysph.solver.utils import remove_irrelevant_files, _sort_key  # noqa: E402
 from pysph.tools.interpolator import (get_bounding_box, get_nx_ny_nz,  # noqa: E402
     Interpolator)
@@ -70,9 +71,24 @@ def glob_files(fname):
     """
     fbase = fname[:fname.rfind('_')+1]
     ext = fname[fname.rfind('.'):]
+    if ext == '.series':
+        return get_series_files(fbase[:-1] + ext)
     return glob.glob("%s*%s" % (fbase, ext))
 
 
+def expand_series(files):
+    """Replace any series index files in the given list with the names of the
+    snapshots in the series.
+    """
+    result = []
+    for f in files:
+        if f.endswith('.series'):
+            result.extend(get_series_files(f))
+        else:
+            result.append(f)
+    return result
+
+
 def sort_file_list(files):
     """Given a list of input files, sort them in serial order, in-place.
     """
@@ -995,7 +1011,7 @@ class MayaviViewer(HasTraits):
 
     def _directory_changed(self, d):
         ext = os.path.splitext(self.files[-1])[1]
-        files = glob.glob(os.path.join(d, '*' + ext))
+        files = expand_series(glob.glob(os.path.join(d, '*' + ext)))
         if len(files) > 0:
             self._clear()
             sort_file_list(files)
@@ -1116,13 +1132,15 @@ def main(args=None):
                 scripts.append(arg)
                 continue
             elif arg.endswith(output_formats):
-                files.extend(glob.glob(arg))
+                files.extend(expand_series(glob.glob(arg)))
                 continue
             elif os.path.isdir(arg):
                 _files = glob.glob(os.path.join(arg, '*.hdf5'))
                 if len(_files) == 0:
                     _files = glob.glob(os.path.join(arg, '*.npz'))
-                files.extend(_files)
+                if len(_files) == 0:
+                    _files = glob.glob(os.path.join(arg, '*.series'))
+                files.extend(expand_series(_files))
                 continue
             else:
                 usage()
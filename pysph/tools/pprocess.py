@@ -9,19 +9,156 @@ except (ImportError, SystemExit):
 if TVTK:
     from tvtk.array_handler import array2vtk
 
+import ast
+import json
+import os
 from os import path
+import warnings
 import numpy as np
 import pysph.solver.utils as utils
-
-
-def get_ke_history(files, array_name):
-    t, ke = [], []
-    for sd, array in utils.iter_output(files, array_name):
-        t.append(sd['t'])
-        m, u, v, w = array.get('m', 'u', 'v', 'w')
-        _ke = 0.5 * np.sum( m * (u**2 + v**2 + w**2) )
-        ke.append(_ke)
-    return np.asarray(t), np.asarray(ke)
+from pysph.solver.output import (get_series_entries, is_series_entry,
+                                 parse_series_name)
+
+_ke_expr = '0.5*m*(u**2 + v**2 + w**2)'
+
+_history_ops = {'sum': np.sum, 'max': np.max, 'min': np.min, 'mean': np.mean}
+
+
+def _get_expression_props(expr):
+    """Return the names of the properties used in the expression."""
+    names = []
+    for node in ast.walk(ast.parse(expr, mode='eval')):
+        if isinstance(node, ast.Name) and node.id not in ('np', 'numpy') \
+           and node.id not in names:
+            names.append(node.id)
+    return sorted(names)
+
+
+class HistoryFunction(object):
+    """Evaluate a NumPy expression of the properties of a particle array
+    and reduce it to a scalar using one of 'sum', 'max', 'min' or 'mean'.
+
+    Instances are picklable and can be used with
+    :py:func:`pysph.solver.utils.iter_output_parallel`, each call returns
+    the time and the reduced value.  The expression can only use the
+    properties and ``np`` (or ``numpy``), no builtins are available.
+    """
+    def __init__(self, expr, op='sum'):
+        if op not in _history_ops:
+            raise ValueError(
+                'Unsupported operation %s, must be one of %s' % (
+                    op, sorted(_history_ops)
+                )
+            )
+        self.expr = expr
+        self.op = op
+        self.props = _get_expression_props(expr)
+
+    def __call__(self, solver_data, array):
+        namespace = dict((x, array.get(x)) for x in self.props)
+        namespace.update(np=np, numpy=np)
+        values = np.asarray(eval(self.expr, {'__builtins__': {}}, namespace))
+        if values.size == 0:
+            value = np.nan
+        else:
+            value = _history_ops[self.op](values)
+        return float(solver_data['t']), float(value)
+
+
+def _get_file_stamps(files):
+    """Return a stamp for each file which changes if the file changes, this
+    is the modification time and size for files and the location in the
+    segment for snapshots in a series.
+    """
+    series = {}
+    stamps = []
+    for f in files:
+        if is_series_entry(f):
+            index, count = parse_series_name(f)
+            if index not in series:
+                series[index] = dict(
+                    (e.count, [e.segment, e.offset, e.size])
+                    for e in get_series_entries(index)
+                )
+            stamps.append(series[index].get(count))
+        else:
+            stat = os.stat(f)
+            stamps.append([stat.st_mtime, stat.st_size])
+    return stamps
+
+
+def _read_history_cache(cache_file):
+    if cache_file is None or not path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except ValueError:
+        # A corrupt cache is simply recomputed.
+        return {}
+
+
+def _write_history_cache(cache_file, cache):
+    tmp_file = cache_file + '.tmp'
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.rename(tmp_file, cache_file)
+    except (IOError, OSError) as e:
+        # For example when the output is in a read-only directory.
+        warnings.warn(
+            'Unable to write the history cache %s: %s' % (cache_file, e)
+        )
+
+
+def get_history(files, array_name, expr, op='sum', workers=1,
+                cache_file=None):
+    """Return the time and the value of the expression of the properties of
+    the given array reduced with `op` for each file.
+
+    The expression is evaluated with NumPy, for example
+    ``'0.5*m*(u**2 + v**2 + w**2)'`` with `op` as 'sum' is the kinetic
+    energy.  Only the properties used are loaded.  The files are processed in
+    parallel if `workers` is not 1.
+
+    If `cache_file` is given, the results are stored in it keyed on the
+    array, operation and expression along with the modification time of each
+    file.  Only the new or modified files are processed on later calls.  If
+    the cache cannot be written a warning is issued and the results are
+    returned as usual.
+    """
+    func = HistoryFunction(expr, op)
+    key = '%s:%s:%s' % (array_name, op, expr)
+    cache = _read_history_cache(cache_file)
+    entries = cache.get(key, {})
+    stamps = _get_file_stamps(files)
+    names = [path.basename(f) for f in files]
+
+    todo = [i for i, (name, stamp) in enumerate(zip(names, stamps))
+            if name not in entries or entries[name][0] != stamp]
+    results = utils.iter_output_parallel(
+        [files[i] for i in todo], func, [array_name], props=func.props,
+        workers=workers
+    )
+    for i, (t, value) in zip(todo, results):
+        entries[names[i]] = [stamps[i], t, value]
+
+    if cache_file is not None and len(todo) > 0:
+        cache[key] = entries
+        _write_history_cache(cache_file, cache)
+
+    t = np.asarray([entries[name][1] for name in names])
+    values = np.asarray([entries[name][2] for name in names])
+    return t, values
+
+
+def get_ke_history(files, array_name, workers=1, cache_file=None):
+    """Return the time and kinetic energy of the given array for each file.
+    The files are processed in parallel if `workers` is not 1.  See
+    :py:func:`get_history` for the `cache_file`.
+    """
+    return get_history(files, array_name, _ke_expr, 'sum', workers,
+                       cache_file)
 
 
 class Results(object):
@@ -52,8 +189,40 @@ class Results(object):
         self.start = self.nfiles
         self.load()
 
-    def get_ke_history(self, array_name):
-        self.t, self.ke = get_ke_history(self.files, array_name)
+    @property
+    def history_cache_file(self):
+        return path.join(self.dirname, self.fname + '_history.json')
+
+    def get_history(self, array_name, expr, op='sum', workers=1):
+        """Return the time and the value of the expression reduced with `op`
+        for each of the loaded files, see :py:func:`get_history`.
+
+        The results are cached in the output directory so only new or
+        modified files are processed when this is called again, for example
+        after :py:meth:`reload` while a simulation is running.
+        """
+        return get_history(self.files, array_name, expr, op, workers,
+                           self.history_cache_file)
+
+    def get_ke_history(self, array_name, workers=1):
+        self.t, self.ke = self.get_history(array_name, _ke_expr, 'sum',
+                                           workers)
+
+    def map(self, func, files=None, arrays=None, props=None, workers=None,
+            prefetch=None):
+        """Apply the function to the data of each file (all the loaded files
+        by default) using a pool of processes and return a list of the
+        results in order.
+
+        See :py:func:`pysph.solver.utils.iter_output_parallel` for the
+        arguments.
+        """
+        if files is None:
+            files = self.files
+        return list(utils.iter_output_parallel(
+            files, func, arrays=arrays, props=props, workers=workers,
+            prefetch=prefetch
+        ))
 
     def _write_vtk_snapshot(self, mesh, directory, _fname):
         fname = path.join(directory, _fname)
@@ -13,7 +13,8 @@ except ImportError:
 import numpy as np
 
 # Local imports
-from pysph.tools.interpolator import get_nx_ny_nz, Interpolator
+from pysph.tools.interpolator import (get_nx_ny_nz, InterpolateFunction,
+                                      Interpolator)
 from pysph.base.utils import get_particle_array
 
 
@@ -78,6 +79,12 @@ class TestGetNxNyNz(unittest.TestCase):
         self.assertListEqual(list(dims), [7, 7, 21])
 
 
+class InterpolateTwice(InterpolateFunction):
+    def post_loop(self, d_idx, d_prop, d_number_density):
+        if d_number_density[d_idx] > 1e-12:
+            d_prop[d_idx] *= 2.0/d_number_density[d_idx]
+
+
 class TestInterpolator(unittest.TestCase):
     def _make_2d_grid(self, name='fluid'):
         n = 11
@@ -247,6 +254,149 @@ class TestInterpolator(unittest.TestCase):
         expect = np.ones_like(x)*2.0
         self.assertTrue(np.allclose(p, expect))
 
+    def test_interpolate_many_should_match_interpolate(self):
+        # Given
+        pa1 = self._make_2d_grid()
+        pa2 = self._make_2d_grid('solid')
+        pa1.p[:] = np.random.random(pa1.get_number_of_particles())
+        pa2.u[:] = 0.2
+        ip = Interpolator([pa1, pa2], num_points=1000)
+
+        # When.
+        result = ip.interpolate_many(['p', 'u'])
+
+        # Then.
+        self.assertEqual(sorted(result.keys()), ['p', 'u'])
+        for prop in ('p', 'u'):
+            expect = ip.interpolate(prop)
+            self.assertEqual(result[prop].shape, expect.shape)
+            self.assertTrue(np.allclose(result[prop], expect, atol=1e-14))
+
+    def test_interpolate_many_should_work_with_updated_arrays_and_points(self):
+        # Given
+        pa = self._make_2d_grid()
+        ip = Interpolator([pa], num_points=1000)
+        ip.interpolate_many(['p', 'u'])
+        pa_new = self._make_2d_grid()
+        pa_new.p[:] = 10.0
+
+        # When.
+        ip.update_particle_arrays([pa_new])
+        x, y = np.random.random((2, 5, 5))
+        ip.set_interpolation_points(x=x, y=y)
+        result = ip.interpolate_many(['p', 'u'])
+
+        # Then.
+        self.assertEqual(result['p'].shape, x.shape)
+        self.assertTrue(np.allclose(result['p'], 10.0))
+        self.assertTrue(np.allclose(result['u'], 0.1))
+
+    def test_interpolate_many_should_compute_gradients(self):
+        # Given
+        n = 41
+        x, y = np.mgrid[-1:1:n*1j,-1:1:n*1j]
+        x, y = x.ravel(), y.ravel()
+        h = np.ones_like(x)*2.0/(n-1)
+        pa = get_particle_array(name='fluid', x=x, y=y, h=h,
+                                p=2.0*x + 3.0*y, u=np.ones_like(x)*0.1)
+        ip = Interpolator([pa], num_points=1000)
+
+        # When.
+        result = ip.interpolate_many(['p', 'u'], gradient=True)
+        grad_p = ip.interpolate('p', gradient=True)
+
+        # Then.
+        self.assertTrue(isinstance(grad_p, np.ndarray))
+        self.assertEqual(grad_p.shape, (2,) + ip.x.shape)
+        self.assertEqual(result['p'].shape, grad_p.shape)
+        # Only check points away from the boundaries.
+        inside = (np.abs(ip.x) < 0.5) & (np.abs(ip.y) < 0.5)
+        self.assertTrue(np.allclose(result['p'][0][inside], 2.0, atol=0.05))
+        self.assertTrue(np.allclose(result['p'][1][inside], 3.0, atol=0.05))
+        for i in range(2):
+            self.assertTrue(np.allclose(result['u'][i], 0.0, atol=1e-12))
+            self.assertTrue(np.allclose(grad_p[i], result['p'][i]))
+
+    def test_interpolate_many_should_raise_error_for_unknown_property(self):
+        # Given
+        pa = self._make_2d_grid()
+        ip = Interpolator([pa], num_points=1000)
+
+        # When/Then.
+        self.assertRaises(RuntimeError, ip.interpolate_many, ['junk'])
+
+    def test_interpolate_many_should_use_given_equations(self):
+        # Given
+        pa = self._make_2d_grid()
+        pa.p[:] = np.random.random(pa.get_number_of_particles())
+        equations = [InterpolateTwice(dest='interpolate', sources=['fluid'])]
+        ip = Interpolator([pa], num_points=1000, equations=equations)
+
+        # When.
+        result = ip.interpolate_many(['p', 'u'])
+
+        # Then.
+        ip_default = Interpolator([pa], num_points=1000)
+        for prop in ('p', 'u'):
+            expect = 2.0*ip_default.interpolate(prop)
+            self.assertTrue(np.allclose(result[prop], expect))
+        self.assertRaises(RuntimeError, ip.interpolate_many, ['p'],
+                          gradient=True)
+
+    def test_weights_should_match_interpolate(self):
+        # Given
+        pa1 = self._make_2d_grid()
+        pa1.p[:] = pa1.x**2 + pa1.y
+        pa2 = self._make_2d_grid('solid')
+        pa2.x += 0.5
+        pa2.u[:] = 0.2
+        ip = Interpolator([pa1, pa2], num_points=1000)
+        ipw = Interpolator([pa1, pa2], num_points=1000, use_weights=True)
+
+        # When.
+        p = ipw.interpolate('p')
+        result = ipw.interpolate_many(['p', 'u'])
+
+        # Then.
+        self.assertEqual(p.shape, ip.x.shape)
+        self.assertTrue(np.allclose(p, ip.interpolate('p')))
+        self.assertTrue(np.allclose(result['p'], p))
+        self.assertTrue(np.allclose(result['u'], ip.interpolate('u')))
+
+    def test_weights_should_be_updated_with_arrays_and_points(self):
+        # Given
+        pa = self._make_2d_grid()
+        solid = self._make_2d_grid('solid')
+        solid.x += 1.0
+        solid.p[:] = 4.0
+        ip = Interpolator([pa, solid], num_points=1000)
+        ipw = Interpolator([pa, solid], num_points=1000, use_weights=True,
+                           fixed_arrays=['solid'])
+        ipw.interpolate('p')
+        solid_values = ipw._kernel_values['solid']
+
+        # When.
+        pa_new = self._make_2d_grid()
+        pa_new.x += 0.1
+        pa_new.p[:] = pa_new.y
+        ip.update_particle_arrays([pa_new, solid])
+        ipw.update_particle_arrays([pa_new, solid])
+        p = ipw.interpolate('p')
+
+        # Then.
+        self.assertIs(ipw._kernel_values['solid'], solid_values)
+        self.assertTrue(np.allclose(p, ip.interpolate('p')))
+
+        # When.
+        x, y = np.mgrid[-1:1:5j, -1:1:5j]
+        ip.set_interpolation_points(x=x, y=y)
+        ipw.set_interpolation_points(x=x, y=y)
+        p = ipw.interpolate('p')
+
+        # Then.
+        self.assertEqual(p.shape, x.shape)
+        self.assertTrue(np.allclose(p, ip.interpolate('p')))
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,127 @@
+import os
+import shutil
+from os.path import join
+from tempfile import mkdtemp
+from unittest import TestCase, main
+import warnings
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import numpy as np
+
+from pysph.base.utils import get_particle_array
+from pysph.solver.utils import dump
+from pysph.tools import pprocess
+from pysph.tools.pprocess import HistoryFunction, Results, get_history
+
+
+class TestHistory(TestCase):
+    def setUp(self):
+        self.root = mkdtemp()
+        self.x = np.linspace(0, 1, 10)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _dump(self, count):
+        pa = get_particle_array(name='fluid', x=self.x, u=self.x*count,
+                                m=1.0)
+        pa.set_output_arrays(['x', 'u', 'v', 'w', 'm'])
+        fname = join(self.root, 'sim_%d.npz' % count)
+        dump(fname, [pa], solver_data=dict(t=0.1*count, dt=0.1, count=count))
+        return fname
+
+    def test_history_function_uses_only_needed_properties(self):
+        func = HistoryFunction('np.sqrt(u**2 + v**2)', op='max')
+        self.assertEqual(func.props, ['u', 'v'])
+        self.assertRaises(ValueError, HistoryFunction, 'u', op='avg')
+
+    def test_history_function_is_evaluated_without_builtins(self):
+        # Given
+        pa = get_particle_array(name='fluid', x=self.x, u=-self.x)
+        solver_data = dict(t=0.1)
+
+        # When
+        t, value = HistoryFunction('numpy.abs(u)', op='max')(solver_data, pa)
+
+        # Then
+        self.assertEqual(value, 1.0)
+        with mock.patch.object(pprocess, 'eval', create=True,
+                               wraps=eval) as m:
+            HistoryFunction('u', op='max')(solver_data, pa)
+        self.assertEqual(m.call_args[0][1], {'__builtins__': {}})
+
+    def test_history_is_computed_and_cached(self):
+        # Given
+        files = [self._dump(count) for count in (0, 1, 2)]
+        cache_file = join(self.root, 'cache.json')
+        expected_ke = [0.5*np.sum((self.x*c)**2) for c in (0, 1, 2)]
+
+        # When
+        t, ke = get_history(files, 'fluid', '0.5*m*(u**2 + v**2 + w**2)',
+                            cache_file=cache_file)
+
+        # Then
+        np.testing.assert_allclose(t, [0.0, 0.1, 0.2])
+        np.testing.assert_allclose(ke, expected_ke)
+        self.assertTrue(os.path.exists(cache_file))
+
+        # When a new file is added only it is processed.
+        files.append(self._dump(3))
+        expected_ke.append(0.5*np.sum((self.x*3)**2))
+        with mock.patch.object(pprocess.utils, 'iter_output_parallel',
+                               wraps=pprocess.utils.iter_output_parallel) as m:
+            t, ke = get_history(files, 'fluid', '0.5*m*(u**2 + v**2 + w**2)',
+                                cache_file=cache_file)
+
+        # Then
+        self.assertEqual(m.call_args[0][0], [files[-1]])
+        np.testing.assert_allclose(ke, expected_ke)
+
+        # When a different expression is used.
+        t, u_max = get_history(files, 'fluid', 'u', op='max',
+                               cache_file=cache_file)
+
+        # Then
+        np.testing.assert_allclose(u_max, [0, 1, 2, 3])
+
+    def test_history_works_when_cache_cannot_be_written(self):
+        # Given
+        files = [self._dump(count) for count in (0, 1)]
+        cache_file = join(self.root, 'read_only', 'cache.json')
+
+        # When
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            t, u_max = get_history(files, 'fluid', 'u', op='max',
+                                   cache_file=cache_file)
+
+        # Then
+        np.testing.assert_allclose(t, [0.0, 0.1])
+        np.testing.assert_allclose(u_max, [0.0, 1.0])
+        self.assertEqual(len(w), 1)
+        self.assertTrue(cache_file in str(w[0].message))
+        self.assertFalse(os.path.exists(cache_file))
+
+    def test_results_get_ke_history(self):
+        # Given
+        for count in (0, 1, 2):
+            self._dump(count)
+        results = Results(self.root, 'sim')
+
+        # When
+        results.get_ke_history('fluid')
+
+        # Then
+        np.testing.assert_allclose(results.t, [0.0, 0.1, 0.2])
+        np.testing.assert_allclose(
+            results.ke, [0.5*np.sum((self.x*c)**2) for c in (0, 1, 2)]
+        )
+        self.assertTrue(os.path.exists(results.history_cache_file))
+
+
+if __name__ == '__main__':
+    main()